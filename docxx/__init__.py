@@ -4,7 +4,10 @@ DefModules:
     docxx.ma
 """
 
-from docxx.api import open_docx, compose_docx  # noqa
+from docxx.api import (  # noqa
+    CompressionPolicy, PackageTransport, compose_docx, iter_media, open_docx,
+    open_docx_async
+)
 
 __version__ = '0.1.0.0'
 
@@ -0,0 +1,157 @@
+# encoding: utf-8
+
+"""
+Support for opening and saving documents from asyncio code. The blocking zip
+I/O, parsing and serialization run in an executor, at most
+:func:`concurrency_limit` at a time per event loop, and async byte sources
+and sinks are bridged to the file-like objects the package reader and writer
+expect.
+"""
+
+from __future__ import absolute_import
+
+import asyncio
+import inspect
+import tempfile
+import weakref
+
+from functools import partial
+
+_CHUNK_SIZE = 64 * 1024
+
+# an async source larger than this is spooled to a temporary file
+_SPOOL_MAX_SIZE = 8 * 1024 * 1024
+
+_concurrency_limit = 4
+_semaphores = weakref.WeakKeyDictionary()
+
+
+def concurrency_limit():
+    """
+    Return the number of blocking open or save operations that may run at
+    once in each event loop.
+    """
+    return _concurrency_limit
+
+
+def set_concurrency_limit(limit):
+    """
+    Allow at most *limit* blocking open or save operations to run at once in
+    each event loop. Applies to event loops that have not yet run one.
+    """
+    global _concurrency_limit
+    if limit < 1:
+        raise ValueError('concurrency limit must be at least 1, got %r' % limit)
+    _concurrency_limit = limit
+    _semaphores.clear()
+
+
+def is_async_sink(sink):
+    """
+    True if *sink* is written asynchronously, i.e. its ``write()`` method is
+    a coroutine function or it has a coroutine ``drain()`` method, as
+    :class:`asyncio.StreamWriter` does.
+    """
+    return (
+        inspect.iscoroutinefunction(getattr(sink, 'write', None)) or
+        inspect.iscoroutinefunction(getattr(sink, 'drain', None))
+    )
+
+
+def is_async_source(source):
+    """
+    True if *source* is read asynchronously, i.e. it is an async iterable of
+    byte chunks or its ``read()`` method is a coroutine function.
+    """
+    return (
+        hasattr(source, '__aiter__') or
+        inspect.iscoroutinefunction(getattr(source, 'read', None))
+    )
+
+
+async def run_blocking(func, *args, executor=None):
+    """
+    Return the result of calling *func* with *args* in *executor*, the loop's
+    default executor when |None|, once fewer than :func:`concurrency_limit`
+    such calls are running in the current event loop.
+    """
+    loop = asyncio.get_running_loop()
+    async with _semaphore_for(loop):
+        return await loop.run_in_executor(executor, partial(func, *args))
+
+
+async def save_to(save, stream, executor=None):
+    """
+    Call *save*, a callable taking a path or writable file-like object, with
+    *stream* in an executor. When *stream* is an async sink, the package is
+    written to it as it is serialized rather than buffered.
+    """
+    if not is_async_sink(stream):
+        return await run_blocking(save, stream, executor=executor)
+    loop = asyncio.get_running_loop()
+    await run_blocking(save, _SinkWriter(stream, loop), executor=executor)
+
+
+async def spool(source):
+    """
+    Return a seekable file-like object holding the bytes of async *source*,
+    kept in memory up to a few megabytes and in a temporary file beyond.
+    A zip package is read from its end, so it must be available in full
+    before it is opened.
+    """
+    spooled = tempfile.SpooledTemporaryFile(_SPOOL_MAX_SIZE)
+    try:
+        if hasattr(source, '__aiter__'):
+            async for chunk in source:
+                spooled.write(chunk)
+        else:
+            while True:
+                chunk = await source.read(_CHUNK_SIZE)
+                if not chunk:
+                    break
+                spooled.write(chunk)
+    except BaseException:
+        spooled.close()
+        raise
+    spooled.seek(0)
+    return spooled
+
+
+def _semaphore_for(loop):
+    """
+    Return the semaphore limiting blocking calls in *loop*.
+    """
+    semaphore = _semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _semaphores[loop] = asyncio.Semaphore(_concurrency_limit)
+    return semaphore
+
+
+class _SinkWriter(object):
+    """
+    Write-only, non-seekable file-like object passing each write on to async
+    *sink* in event loop *loop* and waiting for it to complete, so a writer
+    running in another thread is held back by a slow sink.
+    """
+    def __init__(self, sink, loop):
+        super(_SinkWriter, self).__init__()
+        self._sink = sink
+        self._loop = loop
+
+    def flush(self):
+        pass
+
+    def write(self, data):
+        future = asyncio.run_coroutine_threadsafe(
+            self._write(bytes(data)), self._loop
+        )
+        future.result()
+        return len(data)
+
+    async def _write(self, data):
+        result = self._sink.write(data)
+        if inspect.isawaitable(result):
+            await result
+        drain = getattr(self._sink, 'drain', None)
+        if drain is not None:
+            await drain()
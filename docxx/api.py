@@ -12,7 +12,12 @@ from typing import Generic, TypeVar
 
 import os
 
+from docxx.opc.compat import is_string
+from docxx.opc.compression import CompressionPolicy  # noqa
 from docxx.opc.constants import CONTENT_TYPE as CT
+from docxx.opc.media import iter_media  # noqa
+from docxx.opc.phys_pkg import map_file
+from docxx.opc.transport import PackageTransport  # noqa
 from docxx.package import Package
 from docxx.element import remove_element, query, insert_copy_element
 from docxx.parts.document import DocumentPart
@@ -31,18 +36,58 @@ class DocumentOpener(Generic[T]):
         """
         return self.template_file
         
-    def __call__(self, path=None) -> T:
-        if path is None:    
+    def __call__(self, path=None, mmap=False, lazy_blobs=False) -> T:
+        """
+        Open the package at *path*, or the default package when |None|.
+        *path* may also be a file-like object, or bytes, a bytearray or a
+        memoryview holding the package, which is read without being copied,
+        or a |PackageTransport| handed over from another process.
+        When *mmap* is True a file *path* is memory-mapped rather than read;
+        parts are parsed or copied out of the map as the package is opened,
+        so the document can be saved over *path*. When
+        *lazy_blobs* is True images and other binary parts are read from
+        *path* only when needed, see :meth:`OpcPackage.open`.
+        Each thread parses with its own XML parser, so independent documents
+        can be opened, edited and saved concurrently from several threads;
+        a single document must not be used by two threads at once.
+        """
+        if path is None:
             path = self.default_document_path()
-            
-        document_part = Package.open(path).main_document_part
+        pkg_file = map_file(path) if mmap and is_string(path) else path
+
+        document_part = Package.open(pkg_file, lazy_blobs).main_document_part
         ct = document_part.content_type
         if ct != self.content_type:
-            tmpl = "file '{}' has unsupported content type '{}'.".format(path, ct) 
+            name = path if is_string(path) else type(path).__name__
+            tmpl = "file '{}' has unsupported content type '{}'.".format(name, ct) 
             raise ValueError(tmpl)
             
         return document_part
 
+    async def open_async(self, path_or_stream=None, executor=None,
+                         mmap=False, lazy_blobs=False) -> T:
+        """
+        Open the package at *path_or_stream* as :meth:`__call__` does, with
+        the blocking work run in *executor*, the event loop's default
+        executor when |None|. *path_or_stream* may also be an async source,
+        an async iterable of byte chunks or an object with a coroutine
+        ``read()`` method, which is spooled to a temporary file as it is
+        read. *mmap* and *lazy_blobs* are passed on to :meth:`__call__`,
+        except that binary parts of an async source are always read up
+        front, the spooled copy being discarded once the package is open.
+        """
+        from docxx.aio import is_async_source, run_blocking, spool
+
+        if not is_async_source(path_or_stream):
+            return await run_blocking(
+                self, path_or_stream, mmap, lazy_blobs, executor=executor
+            )
+        stream = await spool(path_or_stream)
+        try:
+            return await run_blocking(self, stream, mmap, executor=executor)
+        finally:
+            stream.close()
+
 def _templatefile(filename):
     thisdir = os.path.split(__file__)[0]
     return os.path.join(thisdir, 'templates', filename)
@@ -53,6 +98,8 @@ open_docx: DocumentOpener[DocumentPart] = DocumentOpener(
 
 del _templatefile
 
+open_docx_async = open_docx.open_async
+
 
 def compose_docx(base=None, template=None):
     """
@@ -92,7 +139,8 @@ def compose_docx(base=None, template=None):
         sec.grid_lines = 300
         """
         pass # Not implemented yet
-        
+
+    newdocx.section_index.invalidate()
     return newdocx
 
 # for compatiblity with python-docx
@@ -0,0 +1,238 @@
+# encoding: utf-8
+
+"""
+Batch processing of document collections on a pool of worker processes.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import os
+import traceback
+
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from itertools import islice
+
+from docxx.api import open_docx
+from docxx.opc.compat import is_string
+
+# template document of this worker process, opened once by _init_worker()
+_worker_template = None
+
+
+class BatchResult(object):
+    """
+    Outcome of processing one document of a batch. *value* is what the job
+    returned and *error* the formatted traceback of the exception it raised,
+    |None| when it succeeded. *output_path* is where the document was saved,
+    |None| when it was not.
+    """
+    def __init__(self, path, value=None, error=None, output_path=None):
+        super(BatchResult, self).__init__()
+        self.path = path
+        self.value = value
+        self.error = error
+        self.output_path = output_path
+
+    @property
+    def ok(self):
+        """
+        True if the job succeeded for this document.
+        """
+        return self.error is None
+
+
+def run_batch(job, paths, output_dir=None, template=None, max_workers=None,
+              chunksize=16, progress=None):
+    """
+    Generate a |BatchResult| for each document in *paths*, in the order the
+    documents finish, after running *job* on it in a worker process.
+
+    *paths* is an iterable of .docx paths, or the path of a directory whose
+    .docx files are processed. Paths are consumed as workers become free, so
+    *paths* can be a generator over a very large collection. *job* must be
+    picklable, e.g. a module-level function; it is called with the document
+    opened by :func:`open_docx` and its return value, which must also be
+    picklable, is reported as :attr:`BatchResult.value`. When *output_dir*
+    is given, each document is saved there under its own filename after the
+    job has run. Documents whose filenames clash, e.g. ``a/x.docx`` and
+    ``b/x.docx``, are saved under distinct names, ``x.docx`` and
+    ``x-2.docx``; :attr:`BatchResult.output_path` tells which is which.
+
+    When *template* is the path of a document, each worker opens it once and
+    *job* is called as ``job(document, template)`` with that already-parsed
+    template, e.g. to pass to :func:`compose_docx`; it must not be changed
+    by the job. Workers are otherwise reused across documents, so per-process
+    caches such as the image cache and the XML part cache, when enabled,
+    stay warm.
+
+    Documents are sent to the workers *chunksize* at a time. An exception
+    raised while opening, processing or saving a document is reported in
+    that document's result and does not affect the rest of the batch. So is
+    the death of a worker process, e.g. a crash or an out-of-memory kill:
+    the documents that were in flight are run again one at a time on a
+    fresh pool, and only the one the worker dies on is reported as failed.
+    *progress*, when given, is called in this process as
+    ``progress(done, total)`` after each document, *total* being |None| when
+    *paths* has no length.
+    """
+    if is_string(paths) and os.path.isdir(paths):
+        paths = _docx_paths_in(paths)
+    total = len(paths) if hasattr(paths, '__len__') else None
+    if output_dir is not None and not os.path.isdir(output_dir):
+        os.makedirs(output_dir)
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    chunks = _chunks(_tasks(paths, output_dir), chunksize)
+    max_pending = max_workers * 2
+    done = 0
+    executor = _new_executor(max_workers, template)
+    pending = {}
+    suspects = deque()
+    try:
+        while True:
+            if suspects:
+                results, executor = _run_suspect(
+                    executor, job, suspects.popleft(), max_workers, template
+                )
+            else:
+                for chunk in islice(chunks, max_pending - len(pending)):
+                    pending[executor.submit(_run_chunk, job, chunk)] = chunk
+                if not pending:
+                    return
+                finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                results = []
+                for future in finished:
+                    chunk = pending.pop(future)
+                    if isinstance(future.exception(), BrokenProcessPool):
+                        suspects.extend(chunk)
+                    else:
+                        results.extend(future.result())
+                if suspects:
+                    # the pool is lost with every chunk still in it, only
+                    # those that finished before it broke have results
+                    executor.shutdown()
+                    for future, chunk in pending.items():
+                        if future.exception() is None:
+                            results.extend(future.result())
+                        else:
+                            suspects.extend(chunk)
+                    pending.clear()
+                    executor = _new_executor(max_workers, template)
+            for result in results:
+                done += 1
+                if progress is not None:
+                    progress(done, total)
+                yield result
+    finally:
+        executor.shutdown()
+
+
+def _chunks(tasks, chunksize):
+    """
+    Generate lists of at most *chunksize* items from iterator *tasks*.
+    """
+    while True:
+        chunk = list(islice(tasks, chunksize))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _docx_paths_in(directory):
+    """
+    Return the sorted list of paths of the .docx files in *directory*.
+    """
+    return [
+        os.path.join(directory, filename)
+        for filename in sorted(os.listdir(directory))
+        if filename.lower().endswith('.docx')
+    ]
+
+
+def _new_executor(max_workers, template):
+    """
+    Return a new pool of *max_workers* worker processes prepared with
+    *template*.
+    """
+    return ProcessPoolExecutor(
+        max_workers, initializer=_init_worker, initargs=(template,)
+    )
+
+
+def _init_worker(template):
+    """
+    Prepare a worker process, opening the *template* document, if any, once
+    for all the documents the worker processes.
+    """
+    global _worker_template
+    _worker_template = None if template is None else open_docx(template)
+
+
+def _run_chunk(job, tasks):
+    """
+    Run *job* on each ``(path, output_path)`` document in *tasks*, in a
+    worker process, and return the list of their |BatchResult| objects.
+    """
+    return [_run_one(job, path, output_path) for path, output_path in tasks]
+
+
+def _run_one(job, path, output_path):
+    """
+    Return the |BatchResult| of running *job* on the document at *path* and
+    saving it to *output_path* when that is not |None|.
+    """
+    try:
+        document = open_docx(path)
+        if _worker_template is None:
+            value = job(document)
+        else:
+            value = job(document, _worker_template)
+        if output_path is not None:
+            document.save(output_path)
+        return BatchResult(path, value, output_path=output_path)
+    except Exception:
+        return BatchResult(path, error=traceback.format_exc())
+
+
+def _run_suspect(executor, job, task, max_workers, template):
+    """
+    Return a ``(results, executor)`` pair after running *job* alone on the
+    document of *task*, which was in flight when a worker process died. When
+    the worker dies on it again, the document is reported as failed and
+    *executor* is replaced by a fresh pool.
+    """
+    future = executor.submit(_run_chunk, job, [task])
+    try:
+        return future.result(), executor
+    except BrokenProcessPool as e:
+        executor.shutdown()
+        error = 'worker process died while processing %s: %s' % (task[0], e)
+        return (
+            [BatchResult(task[0], error=error)],
+            _new_executor(max_workers, template)
+        )
+
+
+def _tasks(paths, output_dir):
+    """
+    Generate a ``(path, output_path)`` pair for each path in *paths*, giving
+    documents whose filenames clash in *output_dir* distinct output names.
+    *output_path* is |None| when *output_dir* is.
+    """
+    used = set()
+    for path in paths:
+        if output_dir is None:
+            yield path, None
+            continue
+        filename = os.path.basename(path)
+        root, ext = os.path.splitext(filename)
+        n = 1
+        # compared case-blind, for output_dir may be on such a filesystem
+        while filename.lower() in used:
+            n += 1
+            filename = '%s-%d%s' % (root, n, ext)
+        used.add(filename.lower())
+        yield path, os.path.join(output_dir, filename)
@@ -8,8 +8,9 @@ specialized ones like structured document tags.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+from docxx.oxml.ns import qn
 from docxx.oxml.table import CT_Tbl
-from docxx.shared import Parented
+from docxx.shared import Parented, ProxySequence
 from docxx.text.paragraph import Paragraph
 
 
@@ -21,6 +22,8 @@ class BlockItemContainer(Parented):
     a paragraph or table.
     """
 
+    __slots__ = ('_element',)
+
     def __init__(self, element, parent):
         super(BlockItemContainer, self).__init__(parent)
         self._element = element
@@ -50,22 +53,41 @@ class BlockItemContainer(Parented):
         self._element._insert_tbl(tbl)
         return Table(tbl, self)
 
+    def iter_block_items(self):
+        """
+        Generate the |Paragraph| and |Table| objects in this container, in
+        document order. The block items in each cell of a table are generated
+        directly after the table itself, so nested content is reached without
+        building intermediate lists.
+        """
+        from .table import Table, _Cell
+        for child in self._element.iterchildren(qn('w:p'), qn('w:tbl')):
+            if child.tag == qn('w:p'):
+                yield Paragraph(child, self)
+                continue
+            table = Table(child, self)
+            yield table
+            for tr in child.iterchildren(qn('w:tr')):
+                for tc in tr.iterchildren(qn('w:tc')):
+                    for block_item in _Cell(tc, table).iter_block_items():
+                        yield block_item
+
     @property
     def paragraphs(self):
         """
-        A list containing the paragraphs in this container, in document
-        order. Read-only.
+        A lazy sequence of the paragraphs in this container, in document
+        order, supporting ``len()``, iteration and indexed access. Read-only.
         """
-        return [Paragraph(p, self) for p in self._element.p_lst]
+        return ProxySequence(self._element, 'w:p', Paragraph, self)
 
     @property
     def tables(self):
         """
-        A list containing the tables in this container, in document order.
-        Read-only.
+        A lazy sequence of the tables in this container, in document order,
+        supporting ``len()``, iteration and indexed access. Read-only.
         """
         from .table import Table
-        return [Table(tbl, self) for tbl in self._element.tbl_lst]
+        return ProxySequence(self._element, 'w:tbl', Table, self)
 
     def _add_paragraph(self):
         """
@@ -9,29 +9,155 @@ from __future__ import (
 )
 
 from docxx.document import _Body
-from docxx.shared import ElementProxy
+from docxx.oxml.ns import qn
+from docxx.shared import ElementProxy, ProxySequence
 
 class Comments(ElementProxy):    
     @property
     def comments(self):
-        return [Comment(n, self) for n in self._element.comment_lst]
+        return ProxySequence(self._element, 'w:comment', Comment, self)
     
     def add(self):
         # IDを発行
-        if len(self._element.comment_lst) > 0:
-            nid = self._element.comment_lst[-1].id + 1
-        else:
-            nid = 0
+        index = self.index
+        nid = index.next_id()
         # 要素を追加し初期化する
         cmt = self._element._add_comment()
         cmt.id = nid
         cmt.author = "machine"
+        index.add(cmt)
         comment = Comment(cmt, self)
         return comment
+
+    def get(self, id):
+        """
+        IDが *id* のコメントを返す。存在しなければ |None|。
+        """
+        cmt = self.index.get(id)
+        if cmt is None:
+            return None
+        return Comment(cmt, self)
+
+    def anchors(self, id):
+        """
+        IDが *id* のコメントの (commentRangeStart, commentRangeEnd,
+        commentReference) 要素の組を返す。存在しない要素は |None|。
+        """
+        return self.index.anchors(id)
+
+    @property
+    def index(self):
+        """
+        コメントパートが保持する |CommentIndex|。
+        """
+        return self.part.comment_index
+
+
+class CommentIndex(object):
+    """
+    コメントパートのコメントの索引。IDから ``<w:comment>`` 要素を引き、
+    使用中の最大のIDを保持するので、検索や新しいIDの発行でコメントの
+    一覧をたどらない。各コメントのストーリー内のアンカー
+    （``<w:commentRangeStart>``, ``<w:commentRangeEnd>``,
+    ``<w:commentReference>``）は、初めて求められたときに全ストーリーを
+    一度だけ走査して集める。*iter_story_elements* はそのストーリーの
+    ルート要素を返す呼び出し可能オブジェクト。
+    """
+
+    _anchor_slots = {
+        qn('w:commentRangeStart'): 0,
+        qn('w:commentRangeEnd'): 1,
+        qn('w:commentReference'): 2,
+    }
+
+    def __init__(self, comments_elm, iter_story_elements=None):
+        super(CommentIndex, self).__init__()
+        self._comments_elm = comments_elm
+        self._iter_story_elements = iter_story_elements
+        self._comments_by_id = None
+        self._max_id = -1
+        self._anchors_by_id = None
+
+    def add(self, comment):
+        """
+        パートに新しく追加した ``<w:comment>`` 要素 *comment* を索引に加える。
+        """
+        comments_by_id = self._comments
+        comments_by_id[comment.id] = comment
+        self._max_id = max(self._max_id, comment.id)
+
+    def add_anchor(self, anchor):
+        """
+        ストーリーに新しく挿入したアンカー要素 *anchor*
+        （``<w:commentRangeStart>``, ``<w:commentRangeEnd>``,
+        ``<w:commentReference>``）を、アンカーが収集済みなら索引に加える。
+        """
+        if self._anchors_by_id is not None:
+            self._set_anchor(self._anchors_by_id, anchor)
+
+    def anchors(self, id):
+        """
+        IDが *id* のコメントの (commentRangeStart, commentRangeEnd,
+        commentReference) 要素の組を返す。存在しない要素は |None|。
+        """
+        if self._anchors_by_id is None:
+            anchors_by_id = {}
+            story_elements = (
+                () if self._iter_story_elements is None
+                else self._iter_story_elements()
+            )
+            for story_element in story_elements:
+                for anchor in story_element.iter(*self._anchor_slots):
+                    self._set_anchor(anchors_by_id, anchor)
+            self._anchors_by_id = anchors_by_id
+        return tuple(self._anchors_by_id.get(id, (None, None, None)))
+
+    def get(self, id):
+        """
+        IDが *id* の ``<w:comment>`` 要素を返す。存在しなければ |None|。
+        """
+        return self._comments.get(id)
+
+    def invalidate(self):
+        """
+        索引を破棄し、次に使うときに作り直させる。|Comments| や
+        |Paragraph| を通さずにコメントやアンカーを追加・削除したあとに呼ぶ。
+        """
+        self._comments_by_id = None
+        self._max_id = -1
+        self._anchors_by_id = None
+
+    def next_id(self):
+        """
+        新しいコメントのIDを返す。使用中の最大のIDに1を足した値で、
+        コメントがなければ0。
+        """
+        self._comments
+        return self._max_id + 1
+
+    @property
+    def _comments(self):
+        """
+        コメントIDから ``<w:comment>`` 要素への辞書。初めて使うときに作る。
+        """
+        if self._comments_by_id is None:
+            comments_by_id = {}
+            for comment in self._comments_elm.iterchildren(qn('w:comment')):
+                comments_by_id[comment.id] = comment
+            self._comments_by_id = comments_by_id
+            self._max_id = max(comments_by_id, default=-1)
+        return self._comments_by_id
+
+    def _set_anchor(self, anchors_by_id, anchor):
+        slots = anchors_by_id.setdefault(anchor.id, [None, None, None])
+        slots[self._anchor_slots[anchor.tag]] = anchor
         
 class Comment(ElementProxy):    
+
+    __slots__ = ('__comment',)
+
     def __init__(self, r, parent):
-        super().__init__(r)
+        super().__init__(r, parent=parent)
         self.__comment = None
         
     @property
@@ -7,7 +7,9 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 from docxx.blkcntnr import BlockItemContainer
 from docxx.enum.section import WD_SECTION
 from docxx.enum.text import WD_BREAK
+from docxx.oxml.ns import qn
 from docxx.section import Section, Sections
+from docxx.shape import InlineShape
 from docxx.shared import ElementProxy, Emu
 
 
@@ -18,7 +20,7 @@ class Document(ElementProxy):
     a document.
     """
 
-    __slots__ = ('_part', '__body')
+    __slots__ = ('__body',)
 
     def __init__(self, element, part):
         super(Document, self).__init__(element)
@@ -71,6 +73,26 @@ class Document(ElementProxy):
         run = self.add_paragraph().add_run()
         return run.add_picture(image_path_or_stream, width, height)
 
+    def add_pictures(self, image_paths_or_streams, width=None, height=None,
+                     max_workers=None):
+        """
+        Return a list of new picture shapes, each added in its own paragraph at
+        the end of the document, for the images in *image_paths_or_streams*.
+        *width* and *height* apply to every picture as they do for
+        :meth:`add_picture`. The image files are read and hashed in parallel on
+        a thread pool of up to *max_workers* threads, after which the image
+        parts, relationships and shapes are added in one batch.
+        """
+        inlines = self._part.new_pic_inlines(
+            image_paths_or_streams, width, height, max_workers
+        )
+        shapes = []
+        for inline in inlines:
+            run = self.add_paragraph().add_run()
+            run._r.add_drawing(inline)
+            shapes.append(InlineShape(inline))
+        return shapes
+
     def add_section(self, start_type=WD_SECTION.NEW_PAGE):
         """
         Return a |Section| object representing a new section added at the end
@@ -80,6 +102,7 @@ class Document(ElementProxy):
         """
         new_sectPr = self._element.body.add_section_break()
         new_sectPr.start_type = start_type
+        self._part.section_index.invalidate()
         return Section(new_sectPr, self._part)
 
     def add_table(self, rows, cols, style=None):
@@ -93,6 +116,14 @@ class Document(ElementProxy):
         table.style = style
         return table
 
+    def bookmark(self, name):
+        """
+        Return the |Bookmark| named *name* in the document body, or |None| if
+        there is none. Bookmarks are looked up in an index built on first
+        use.
+        """
+        return self._part.markup_index.bookmark(name)
+
     @property
     def core_properties(self):
         """
@@ -101,6 +132,14 @@ class Document(ElementProxy):
         """
         return self._part.core_properties
 
+    def fields(self, field_type=None):
+        """
+        Return a list of the |Field| objects in the document body of
+        *field_type*, e.g. ``'REF'`` or ``'TOC'``, in document order, or of
+        all fields when *field_type* is |None|.
+        """
+        return self._part.markup_index.fields(field_type)
+
     @property
     def inline_shapes(self):
         """
@@ -111,15 +150,34 @@ class Document(ElementProxy):
         """
         return self._part.inline_shapes
 
+    def iter_block_items(self):
+        """
+        Generate the |Paragraph| and |Table| objects in the document body, in
+        document order, descending into table cells. See
+        :meth:`BlockItemContainer.iter_block_items`.
+        """
+        return self._body.iter_block_items()
+
     @property
     def paragraphs(self):
         """
-        A list of |Paragraph| instances corresponding to the paragraphs in
-        the document, in document order. Note that paragraphs within revision
-        marks such as ``<w:ins>`` or ``<w:del>`` do not appear in this list.
+        A lazy sequence of |Paragraph| instances corresponding to the
+        paragraphs in the document, in document order. Note that paragraphs
+        within revision marks such as ``<w:ins>`` or ``<w:del>`` do not
+        appear in this sequence.
         """
         return self._body.paragraphs
 
+    def iter_paragraph_texts(self):
+        """
+        Generate the text of each paragraph in the document body, in document
+        order, as :attr:`Paragraph.text` would return it. No |Paragraph|
+        proxies are created, which makes this the preferred way to extract the
+        text of a large document.
+        """
+        for p in self._element.body.iterchildren(qn('w:p')):
+            yield p.text
+
     @property
     def part(self):
         """
@@ -127,17 +185,45 @@ class Document(ElementProxy):
         """
         return self._part
 
-    def save(self, path_or_stream):
+    def save(self, path_or_stream, compression=None, max_workers=None):
         """
         Save this document to *path_or_stream*, which can be either a path to
-        a filesystem location (a string) or a file-like object.
+        a filesystem location (a string) or a file-like object. See
+        :meth:`OpcPackage.save` for *compression* and *max_workers*.
+        """
+        self._part.save(path_or_stream, compression, max_workers)
+
+    async def save_async(self, stream, compression=None, max_workers=None,
+                         executor=None):
+        """
+        Save this document as :meth:`save` does, with the blocking work run
+        in *executor*, the event loop's default executor when |None|.
+        *stream* may also be an async sink, an object with a coroutine
+        ``write()`` or ``drain()`` method, which receives the package as it
+        is written.
+        """
+        await self._part.save_async(stream, compression, max_workers, executor)
+
+    def to_bytes(self, compression=None, max_workers=None):
+        """
+        Return this document serialized as a .docx package, as bytes. Prefer
+        this to saving to a |BytesIO| and calling ``getvalue()``.
+        """
+        return self._part.to_bytes(compression, max_workers)
+
+    def to_transport(self, share_media=False):
+        """
+        Return a picklable |PackageTransport| of this document, to open it
+        in another process with :func:`open_docx` without a zip archive
+        being written and read. See :meth:`OpcPackage.to_transport` for
+        *share_media*.
         """
-        self._part.save(path_or_stream)
+        return self._part.to_transport(share_media)
 
     @property
     def sections(self):
         """|Sections| object providing access to each section in this document."""
-        return Sections(self._element, self._part)
+        return Sections(self._element, self._part, self._part.section_index)
 
     @property
     def settings(self):
@@ -157,11 +243,12 @@ class Document(ElementProxy):
     @property
     def tables(self):
         """
-        A list of |Table| instances corresponding to the tables in the
-        document, in document order. Note that only tables appearing at the
-        top level of the document appear in this list; a table nested inside
-        a table cell does not appear. A table within revision marks such as
-        ``<w:ins>`` or ``<w:del>`` will also not appear in the list.
+        A lazy sequence of |Table| instances corresponding to the tables in
+        the document, in document order. Note that only tables appearing at
+        the top level of the document appear in this sequence; a table nested
+        inside a table cell does not appear. A table within revision marks
+        such as ``<w:ins>`` or ``<w:del>`` will also not appear in the
+        sequence.
         """
         return self._body.tables
 
@@ -187,6 +274,7 @@ class Document(ElementProxy):
 
     def insert_paragraph(self, p):
         self._element.body._insert_p(p._element)
+        self._part.section_index.invalidate()
 
 
 class _Body(BlockItemContainer):
@@ -205,4 +293,5 @@ class _Body(BlockItemContainer):
         preserved.
         """
         self._body.clear_content()
+        self.part.section_index.invalidate()
         return self
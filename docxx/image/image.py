@@ -9,6 +9,8 @@ from __future__ import absolute_import, division, print_function
 
 import hashlib
 import os
+import threading
+from collections import OrderedDict
 
 from ..compat import BytesIO, is_string
 from .exceptions import UnrecognizedImageError
@@ -32,27 +34,41 @@ class Image(object):
         Return a new |Image| subclass instance parsed from the image binary
         contained in *blob*.
         """
-        stream = BytesIO(blob)
-        return cls._from_stream(stream, blob)
+        if not image_cache.enabled:
+            return cls._from_stream(BytesIO(blob), blob)
+        return cls._from_blob_cached(blob, None)
 
     @classmethod
     def from_file(cls, image_descriptor):
         """
         Return a new |Image| subclass instance loaded from the image file
-        identified by *image_descriptor*, a path or file-like object.
+        identified by *image_descriptor*, a path or file-like object. Images
+        are looked up in the process-wide |image_cache| first, by path, size
+        and modification time for a path, or by the SHA1 of the bytes read
+        for a file-like object.
         """
         if is_string(image_descriptor):
             path = image_descriptor
+            if image_cache.enabled:
+                st = os.stat(path)
+                key = ('path', os.path.abspath(path), st.st_size, st.st_mtime_ns)
+                image = image_cache.get(key)
+                if image is not None:
+                    return image
             with open(path, 'rb') as f:
                 blob = f.read()
                 stream = BytesIO(blob)
             filename = os.path.basename(path)
-        else:
-            stream = image_descriptor
-            stream.seek(0)
-            blob = stream.read()
-            filename = None
-        return cls._from_stream(stream, blob, filename)
+            image = cls._from_stream(stream, blob, filename)
+            if image_cache.enabled:
+                image_cache.put(key, image)
+            return image
+        stream = image_descriptor
+        stream.seek(0)
+        blob = stream.read()
+        if not image_cache.enabled:
+            return cls._from_stream(stream, blob, None)
+        return cls._from_blob_cached(blob, stream)
 
     @property
     def blob(self):
@@ -167,6 +183,25 @@ class Image(object):
         """
         return hashlib.sha1(self._blob).hexdigest()
 
+    @classmethod
+    def _from_blob_cached(cls, blob, stream):
+        """
+        Return the |Image| for *blob* from |image_cache|, keyed by the SHA1 of
+        *blob*, parsing it from *stream* (or a new stream on *blob* if
+        |None|) and adding it to the cache when not found.
+        """
+        sha1 = hashlib.sha1(blob).hexdigest()
+        key = ('sha1', sha1)
+        image = image_cache.get(key)
+        if image is not None:
+            return image
+        if stream is None:
+            stream = BytesIO(blob)
+        image = cls._from_stream(stream, blob)
+        image._sha1 = sha1
+        image_cache.put(key, image)
+        return image
+
     @classmethod
     def _from_stream(cls, stream, blob, filename=None):
         """
@@ -179,6 +214,97 @@ class Image(object):
         return cls(blob, filename, image_header)
 
 
+class ImageCache(object):
+    """
+    Thread-safe least-recently-used cache of |Image| objects shared by all the
+    documents in the process, so an image embedded over and over is read and
+    parsed only once. The cache is bounded by the total size in bytes of the
+    cached image blobs, *max_bytes*; a value of 0 disables it. The process
+    cache, |image_cache|, is disabled until its *max_bytes* is set, for it
+    keeps image blobs in memory that a package opened with lazy blobs would
+    otherwise read only when needed.
+    """
+    def __init__(self, max_bytes):
+        super(ImageCache, self).__init__()
+        self._max_bytes = max_bytes
+        self._images = OrderedDict()
+        self._nbytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._images)
+
+    def clear(self):
+        """
+        Remove all images from the cache.
+        """
+        with self._lock:
+            self._images.clear()
+            self._nbytes = 0
+
+    @property
+    def enabled(self):
+        """
+        |True| if images are being cached, i.e. *max_bytes* is not 0.
+        """
+        return self._max_bytes > 0
+
+    def get(self, key):
+        """
+        Return the image cached under *key*, or |None| if there is none.
+        """
+        with self._lock:
+            image = self._images.get(key)
+            if image is not None:
+                self._images.move_to_end(key)
+            return image
+
+    @property
+    def max_bytes(self):
+        """
+        Read/write. Upper bound on the total blob size of the cached images.
+        Lowering it evicts least-recently-used images as needed.
+        """
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, value):
+        with self._lock:
+            self._max_bytes = value
+            self._evict()
+
+    @property
+    def nbytes(self):
+        """
+        Total size in bytes of the blobs of the cached images.
+        """
+        return self._nbytes
+
+    def put(self, key, image):
+        """
+        Cache *image* under *key*, evicting least-recently-used images to stay
+        within *max_bytes*. An image larger than *max_bytes* is not cached.
+        """
+        size = len(image.blob)
+        with self._lock:
+            if size > self._max_bytes:
+                return
+            old = self._images.pop(key, None)
+            if old is not None:
+                self._nbytes -= len(old.blob)
+            self._images[key] = image
+            self._nbytes += size
+            self._evict()
+
+    def _evict(self):
+        while self._nbytes > self._max_bytes and self._images:
+            _, image = self._images.popitem(last=False)
+            self._nbytes -= len(image.blob)
+
+
+image_cache = ImageCache(0)
+
+
 def _ImageHeaderFactory(stream):
     """
     Return a |BaseImageHeader| subclass instance that knows how to parse the
@@ -222,37 +222,44 @@ class _MarkerFinder(object):
         Return an offset, byte 2-tuple for the next byte in *stream* that is
         not '\xFF', starting with the byte at offset *start*. If the byte at
         offset *start* is not '\xFF', *start* and the returned *offset* will
-        be the same.
+        be the same. The stream is read a block at a time and each block
+        scanned with ``bytes.lstrip()`` rather than byte by byte.
         """
-        self._stream.seek(start)
-        byte_ = self._read_byte()
-        while byte_ == b'\xFF':
-            byte_ = self._read_byte()
-        offset_of_non_ff_byte = self._stream.tell() - 1
-        return offset_of_non_ff_byte, byte_
+        position = start
+        while True:
+            block = self._read_block(position)
+            unpadded = block.lstrip(b'\xFF')
+            if unpadded:
+                offset_of_non_ff_byte = position + len(block) - len(unpadded)
+                return offset_of_non_ff_byte, unpadded[:1]
+            position += len(block)
 
     def _offset_of_next_ff_byte(self, start):
         """
         Return the offset of the next '\xFF' byte in *stream* starting with
         the byte at offset *start*. Returns *start* if the byte at that
         offset is a hex 255; it does not necessarily advance in the stream.
+        The stream is read a block at a time and each block searched with
+        ``bytes.find()`` rather than byte by byte.
         """
-        self._stream.seek(start)
-        byte_ = self._read_byte()
-        while byte_ != b'\xFF':
-            byte_ = self._read_byte()
-        offset_of_ff_byte = self._stream.tell() - 1
-        return offset_of_ff_byte
+        position = start
+        while True:
+            block = self._read_block(position)
+            index = block.find(b'\xFF')
+            if index != -1:
+                return position + index
+            position += len(block)
 
-    def _read_byte(self):
+    def _read_block(self, start):
         """
-        Return the next byte read from stream. Raise Exception if stream is
-        at end of file.
+        Return up to the next 4096 bytes of stream, starting at offset
+        *start*. Raise Exception if stream is at end of file.
         """
-        byte_ = self._stream.read(1)
-        if not byte_:  # pragma: no cover
+        self._stream.seek(start)
+        block = self._stream.read(4096)
+        if not block:  # pragma: no cover
             raise Exception('unexpected end of file')
-        return byte_
+        return block
 
 
 def _MarkerFactory(marker_code, stream, offset):
@@ -327,10 +327,7 @@ class DocxFile(OpcPackageFile):
         Returns:
             Str:
         """
-        s = []
-        for p in self.get_document().paragraphs:
-            s.append(p.text)
-        return "\n".join(s)
+        return "\n".join(self.get_document().iter_paragraph_texts())
     
     def concat(self, app, right):
         """ @task
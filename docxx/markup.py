@@ -0,0 +1,229 @@
+# encoding: utf-8
+
+"""
+Bookmarks and fields of a story, and the index used to look them up.
+"""
+
+from __future__ import (
+    absolute_import, division, print_function, unicode_literals
+)
+
+from docxx.oxml.ns import qn
+
+
+class Bookmark(object):
+    """
+    A bookmark in a story: its ``<w:bookmarkStart>`` and ``<w:bookmarkEnd>``
+    elements and the ``<w:p>`` element containing the start, or |None| when
+    the start is not inside a paragraph. *end* is |None| for a bookmark that
+    is never closed.
+    """
+    def __init__(self, name, start, end, paragraph):
+        super(Bookmark, self).__init__()
+        self.name = name
+        self.start = start
+        self.end = end
+        self.paragraph = paragraph
+
+
+class Field(object):
+    """
+    A field in a story. For a complex field, *begin*, *separate* and *end* are
+    its ``<w:fldChar>`` elements, *separate* being |None| when the field has
+    no result. For a simple field all three are the ``<w:fldSimple>``
+    element. *instr* is the field instruction, e.g. ``' REF _Ref1 \\h '``.
+    """
+    def __init__(self, begin, instr='', separate=None, end=None):
+        super(Field, self).__init__()
+        self.begin = begin
+        self.instr = instr
+        self.separate = separate
+        self.end = end
+
+    @property
+    def type(self):
+        """
+        Upper-cased first word of the field instruction, e.g. ``'REF'``,
+        ``'PAGEREF'`` or ``'SEQ'``, or ``''`` when the instruction is empty.
+        """
+        words = self.instr.split(None, 1)
+        return words[0].upper() if words else ''
+
+
+class MarkupIndex(object):
+    """
+    Index of the bookmarks and fields in the story rooted at *story_element*,
+    built in a single pass over the story on first use. Bookmarks are looked
+    up by name and fields grouped by type. Bookmarks added through
+    :meth:`Paragraph.add_bookmark` are indexed as they are added; a bookmark
+    or field whose elements have since been removed from the story is dropped
+    when next looked up. Call :meth:`invalidate` after adding bookmarks or
+    fields in other ways.
+    """
+
+    _bookmarkStart = qn('w:bookmarkStart')
+    _bookmarkEnd = qn('w:bookmarkEnd')
+    _fldChar = qn('w:fldChar')
+    _fldCharType = qn('w:fldCharType')
+    _fldSimple = qn('w:fldSimple')
+    _instr = qn('w:instr')
+    _instrText = qn('w:instrText')
+    _p = qn('w:p')
+
+    def __init__(self, story_element):
+        super(MarkupIndex, self).__init__()
+        self._story_element = story_element
+        self._bookmarks_by_name = None
+        self._field_lst = None
+        self._fields_by_type = None
+
+    def add_bookmark(self, start, end):
+        """
+        Index the bookmark delimited by *start* and *end*, newly inserted in
+        the story.
+        """
+        if self._bookmarks_by_name is None:
+            return
+        bookmark = Bookmark(
+            start.get(qn('w:name')), start, end, self._paragraph_of(start)
+        )
+        self._bookmarks_by_name[bookmark.name] = bookmark
+
+    def bookmark(self, name):
+        """
+        Return the |Bookmark| named *name*, or |None| if there is none.
+        """
+        bookmarks_by_name = self._bookmarks
+        bookmark = bookmarks_by_name.get(name)
+        if bookmark is None:
+            return None
+        if not self._in_story(bookmark.start):
+            del bookmarks_by_name[name]
+            return None
+        return bookmark
+
+    @property
+    def bookmark_names(self):
+        """
+        List of the names of the bookmarks in the story, those found when the
+        index was built in document order, followed by those added since.
+        """
+        return [
+            name for name in list(self._bookmarks)
+            if self.bookmark(name) is not None
+        ]
+
+    def fields(self, field_type=None):
+        """
+        Return a list of the |Field| objects of *field_type*, e.g. ``'REF'``,
+        in document order, or of all fields when *field_type* is |None|.
+        """
+        if self._fields_by_type is None:
+            self._build()
+        if field_type is None:
+            fields = self._field_lst = self._live_fields(self._field_lst)
+            return list(fields)
+        field_type = field_type.upper()
+        fields = self._fields_by_type.get(field_type)
+        if not fields:
+            return []
+        fields = self._fields_by_type[field_type] = self._live_fields(fields)
+        return list(fields)
+
+    def invalidate(self):
+        """
+        Discard the index so it is rebuilt on next use.
+        """
+        self._bookmarks_by_name = None
+        self._field_lst = None
+        self._fields_by_type = None
+
+    @property
+    def _bookmarks(self):
+        if self._bookmarks_by_name is None:
+            self._build()
+        return self._bookmarks_by_name
+
+    def _build(self):
+        """
+        Gather the bookmarks and fields of the story in one pass.
+        """
+        bookmarks_by_name = {}
+        bookmarks_by_id = {}
+        field_lst = []
+        open_fields = []
+        tags = (
+            self._bookmarkStart, self._bookmarkEnd, self._fldChar,
+            self._instrText, self._fldSimple,
+        )
+        for elm in self._story_element.iter(*tags):
+            tag = elm.tag
+            if tag == self._bookmarkStart:
+                bookmark = Bookmark(
+                    elm.get(qn('w:name')), elm, None, self._paragraph_of(elm)
+                )
+                bookmarks_by_name[bookmark.name] = bookmark
+                bookmarks_by_id[elm.get(qn('w:id'))] = bookmark
+            elif tag == self._bookmarkEnd:
+                bookmark = bookmarks_by_id.pop(elm.get(qn('w:id')), None)
+                if bookmark is not None:
+                    bookmark.end = elm
+            elif tag == self._fldChar:
+                fldCharType = elm.get(self._fldCharType)
+                if fldCharType == 'begin':
+                    field = Field(elm)
+                    field_lst.append(field)
+                    open_fields.append(field)
+                elif not open_fields:
+                    continue
+                elif fldCharType == 'separate':
+                    open_fields[-1].separate = elm
+                elif fldCharType == 'end':
+                    open_fields.pop().end = elm
+            elif tag == self._instrText:
+                if open_fields and open_fields[-1].separate is None:
+                    open_fields[-1].instr += elm.text or ''
+            else:
+                field_lst.append(
+                    Field(elm, elm.get(self._instr) or '', elm, elm)
+                )
+        field_lst = [field for field in field_lst if field.end is not None]
+        fields_by_type = {}
+        for field in field_lst:
+            fields_by_type.setdefault(field.type, []).append(field)
+        self._bookmarks_by_name = bookmarks_by_name
+        self._field_lst = field_lst
+        self._fields_by_type = fields_by_type
+
+    def _in_story(self, element):
+        """
+        True if *element* is still part of the story.
+        """
+        return _top(element) is _top(self._story_element)
+
+    def _live_fields(self, fields):
+        """
+        Return *fields*, less any no longer part of the story.
+        """
+        live = [field for field in fields if self._in_story(field.begin)]
+        return fields if len(live) == len(fields) else live
+
+    def _paragraph_of(self, element):
+        """
+        Return the ``<w:p>`` element containing *element*, or |None|.
+        """
+        for ancestor in element.iterancestors(self._p):
+            return ancestor
+        return None
+
+
+def _top(element):
+    """
+    Return the outermost ancestor of *element*, or *element* itself when it
+    has no parent. Unlike ``getroottree().getroot()`` this reflects removal
+    of *element*, or of one of its ancestors, from its tree.
+    """
+    parent = element.getparent()
+    while parent is not None:
+        element, parent = parent, parent.getparent()
+    return element
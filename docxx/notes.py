@@ -10,21 +10,143 @@ from __future__ import (
 
 from warnings import warn
 from docxx.document import _Body
-from docxx.shared import ElementProxy
+from docxx.oxml import OxmlElement
+from docxx.oxml.ns import qn
+from docxx.shared import ElementProxy, ProxySequence
+from docxx.text.run import Run
+
+
+class _BaseNotes(ElementProxy):
+    """
+    Base class for |Footnotes| and |Endnotes|. Lookups by id go through the
+    |NoteIndex| kept on the notes part, the parent of this object.
+    """
+
+    _note_tag = None
+    _reference_tag = None
 
-class Endnotes(ElementProxy):    
     @property
     def notes(self):
-        return [Note(n, self) for n in self._element.endnote_lst]
+        return ProxySequence(self._element, self._note_tag, Note, self)
+
+    def add(self):
+        """
+        注を新たに追加して返す。IDは使用中の最大値の次が振られる。
+        """
+        index = self.index
+        note = OxmlElement(self._note_tag)
+        note.id = index.next_id()
+        self._element.append(note)
+        index.add(note)
+        return Note(note, self)
+
+    def get(self, id):
+        """
+        IDが *id* の注を返す。存在しなければ |None|。
+        """
+        note = self.index.get(id)
+        if note is None:
+            return None
+        return Note(note, self)
+
+    @property
+    def index(self):
+        """
+        注パートが保持する |NoteIndex|。
+        """
+        return self._parent.note_index
+
+    def iter_references(self):
+        """
+        本文中の参照を文書順にたどり、参照を含むランと参照先の注の組
+        (Run, Note) を生成する。参照先が無ければ注は |None|。
+        """
+        document_part = self.part
+        for reference in document_part.element.iter(qn(self._reference_tag)):
+            run = Run(reference.getparent(), document_part)
+            yield run, self.get(reference.id)
+
+    def resolve(self, reference):
+        """
+        参照要素（またはそのID） *reference* が指す注を返す。
+        存在しなければ |None|。
+        """
+        id = reference if isinstance(reference, int) else reference.id
+        return self.get(id)
+
+
+class Endnotes(_BaseNotes):    
+
+    _note_tag = 'w:endnote'
+    _reference_tag = 'w:endnoteReference'
     
     
-class Footnotes(ElementProxy):  
+class Footnotes(_BaseNotes):  
+
+    _note_tag = 'w:footnote'
+    _reference_tag = 'w:footnoteReference'
+
+
+class NoteIndex(object):
+    """
+    Index of the notes in a footnotes or endnotes part, mapping each note id
+    to its ``<w:footnote>`` or ``<w:endnote>`` element, *note_tag*, and
+    tracking the largest id in use. It is built in one pass on first use and
+    kept current as notes are added, so resolving a reference and allocating
+    the id of a new note do not walk the notes.
+    """
+    def __init__(self, notes_elm, note_tag):
+        super(NoteIndex, self).__init__()
+        self._notes_elm = notes_elm
+        self._note_tag = qn(note_tag)
+        self._notes_by_id = None
+        self._max_id = 0
+
+    def add(self, note):
+        """
+        Index *note*, a note element newly added to the part.
+        """
+        self._notes[note.id] = note
+        self._max_id = max(self._max_id, note.id)
+
+    def get(self, id):
+        """
+        Return the note element with *id*, or |None| if there is none.
+        """
+        return self._notes.get(id)
+
+    def invalidate(self):
+        """
+        Discard the index so it is rebuilt on next use. Call after notes are
+        added or removed other than through |Footnotes| or |Endnotes|.
+        """
+        self._notes_by_id = None
+        self._max_id = 0
+
+    def next_id(self):
+        """
+        Return the id for a new note, one more than the largest id in use.
+        Ids below 1 are reserved for the separator notes.
+        """
+        self._notes
+        return self._max_id + 1
+
     @property
-    def notes(self):
-        return [Note(n, self) for n in self._element.footnote_lst]
-        
-        
+    def _notes(self):
+        if self._notes_by_id is None:
+            notes_by_id = {}
+            for note in self._notes_elm.iterchildren(self._note_tag):
+                notes_by_id[note.id] = note
+            self._notes_by_id = notes_by_id
+            self._max_id = max(notes_by_id, default=0)
+        return self._notes_by_id
+
+
+
 class Note(ElementProxy):    
+
+    __slots__ = ('__note',)
+
     def __init__(self, r, parent):
         super().__init__(r, parent=parent)
         self.__note = None
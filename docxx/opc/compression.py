@@ -0,0 +1,84 @@
+# encoding: utf-8
+
+"""
+Per-content-type compression policy applied when a package is saved.
+"""
+
+from __future__ import absolute_import
+
+import zlib
+
+from docxx.opc.constants import CONTENT_TYPE as CT
+
+#: content types already compressed by their own format, which deflate does
+#: not shrink further
+PRECOMPRESSED_CONTENT_TYPES = frozenset((
+    CT.GIF, CT.JPEG, CT.PNG, 'audio/', 'video/',
+))
+
+
+class CompressionPolicy(object):
+    """
+    Compression level to use for each member of a saved package, chosen by
+    the member's content type. A level is an int from 0 to 9; 0 stores the
+    member uncompressed and 1 to 9 deflate it, 1 fastest and 9 smallest.
+    |None| is zlib's default level. *levels* maps a content type, e.g.
+    ``'image/png'``, or a media type prefix ending in ``'/'``, e.g.
+    ``'audio/'``, to the level for members of that type; any other member is
+    written at *default_level*.
+    """
+    def __init__(self, default_level=None, levels=None):
+        super(CompressionPolicy, self).__init__()
+        self._default_level = _checked_level(default_level)
+        self._levels = dict(
+            (content_type, _checked_level(level))
+            for content_type, level in (levels or {}).items()
+        )
+
+    @classmethod
+    def archival(cls):
+        """
+        Return a policy deflating every member at the highest level, except
+        already-compressed media, which is stored.
+        """
+        return cls(9, dict.fromkeys(PRECOMPRESSED_CONTENT_TYPES, 0))
+
+    @classmethod
+    def fast(cls):
+        """
+        Return a policy deflating every member at the fastest level, except
+        already-compressed media, which is stored.
+        """
+        return cls(1, dict.fromkeys(PRECOMPRESSED_CONTENT_TYPES, 0))
+
+    def level_for(self, content_type):
+        """
+        Return the compression level for a member of *content_type*, which
+        may be |None| when the member's content type is not known.
+        """
+        levels = self._levels
+        if content_type is not None:
+            if content_type in levels:
+                return levels[content_type]
+            prefix = content_type.split('/', 1)[0] + '/'
+            if prefix in levels:
+                return levels[prefix]
+        return self._default_level
+
+
+def deflate(blob, level):
+    """
+    Return *blob* compressed at *level* as a raw deflate stream, the form in
+    which a deflated member is stored in a zip archive.
+    """
+    compressor = zlib.compressobj(
+        zlib.Z_DEFAULT_COMPRESSION if level is None else level,
+        zlib.DEFLATED, -zlib.MAX_WBITS
+    )
+    return compressor.compress(blob) + compressor.flush()
+
+
+def _checked_level(level):
+    if level is not None and not 0 <= level <= 9:
+        raise ValueError('compression level must be 0-9, got %r' % level)
+    return level
@@ -17,3 +17,10 @@ class PackageNotFoundError(OpcError):
     """
     Raised when a package cannot be found at the specified path.
     """
+
+
+class PackageChangedError(OpcError):
+    """
+    Raised when a blob is read on demand from a package file that has changed
+    since the package was opened.
+    """
@@ -0,0 +1,163 @@
+# encoding: utf-8
+
+"""
+Streaming access to the media members, such as images, of a zip-format OPC
+package, without loading the package or parsing its XML parts.
+"""
+
+from __future__ import absolute_import
+
+import hashlib
+import posixpath
+import shutil
+
+from zipfile import ZipFile
+
+from docxx.opc.compat import is_string
+from docxx.opc.constants import RELATIONSHIP_TYPE as RT
+from docxx.opc.packuri import CONTENT_TYPES_URI, PACKAGE_URI, PackURI
+from docxx.opc.pkgreader import _ContentTypeMap, _SerializedRelationships
+from docxx.opc.shared import lazyproperty
+
+#: relationship types whose target parts are treated as media
+MEDIA_RELTYPES = frozenset((RT.AUDIO, RT.IMAGE, RT.VIDEO))
+
+_CHUNK_SIZE = 1024 * 1024
+
+
+def iter_media(pkg_file):
+    """
+    Generate a |MediaMember| for each media member of the zip package at
+    *pkg_file*, a path or a seekable file-like object, in archive order. A
+    member is media when it is the target of an image, audio or video
+    relationship, or is stored in a ``media`` folder. Only
+    ``[Content_Types].xml`` and the relationship items are parsed; member
+    contents are read only on request, a chunk at a time, so a package can be
+    processed without holding its media in memory. The members are readable
+    only until the generator is advanced past the last one or closed.
+    """
+    with ZipFile(pkg_file, 'r') as zipf:
+        content_types = _ContentTypeMap.from_xml(
+            zipf.read(CONTENT_TYPES_URI.membername)
+        )
+        rels_by_target = _media_rels_by_target(zipf)
+        for info in zipf.infolist():
+            if info.filename.endswith('/'):
+                continue
+            partname = PackURI('/%s' % info.filename)
+            rels = rels_by_target.get(partname)
+            if rels is None and 'media' not in partname.baseURI.split('/'):
+                continue
+            try:
+                content_type = content_types[partname]
+            except KeyError:
+                continue
+            yield MediaMember(zipf, info, partname, content_type, rels or [])
+
+
+class MediaMember(object):
+    """
+    A media member of a zip package, as generated by :func:`iter_media`.
+    """
+    def __init__(self, zipf, info, partname, content_type, rels):
+        super(MediaMember, self).__init__()
+        self._zipf = zipf
+        self._info = info
+        self._partname = partname
+        self._content_type = content_type
+        self._rels = rels
+
+    @property
+    def content_type(self):
+        """
+        Content type of this member, e.g. ``'image/png'``.
+        """
+        return self._content_type
+
+    def copy_to(self, file, chunk_size=_CHUNK_SIZE):
+        """
+        Copy the contents of this member to *file*, a path or a writable
+        file-like object, *chunk_size* bytes at a time.
+        """
+        with self.open() as src:
+            if is_string(file):
+                with open(file, 'wb') as dst:
+                    shutil.copyfileobj(src, dst, chunk_size)
+            else:
+                shutil.copyfileobj(src, file, chunk_size)
+
+    def open(self):
+        """
+        Return a read-only file-like object over the uncompressed contents of
+        this member.
+        """
+        return self._zipf.open(self._info, 'r')
+
+    @property
+    def partname(self):
+        """
+        |PackURI| of this member, e.g. ``'/word/media/image1.png'``.
+        """
+        return self._partname
+
+    @property
+    def rels(self):
+        """
+        List of ``(source_partname, rId, reltype)`` 3-tuples, one for each
+        media relationship in the package targeting this member.
+        """
+        return self._rels
+
+    @lazyproperty
+    def sha1(self):
+        """
+        SHA1 hex digest of the contents of this member, computed by streaming
+        the member on first access.
+        """
+        sha1 = hashlib.sha1()
+        with self.open() as src:
+            for chunk in iter(lambda: src.read(_CHUNK_SIZE), b''):
+                sha1.update(chunk)
+        return sha1.hexdigest()
+
+    @property
+    def size(self):
+        """
+        Uncompressed size of this member in bytes.
+        """
+        return self._info.file_size
+
+
+def _media_rels_by_target(zipf):
+    """
+    Return dict mapping the partname of each target of a media relationship
+    in *zipf* to a list of ``(source_partname, rId, reltype)`` 3-tuples.
+    """
+    rels_by_target = {}
+    for membername in zipf.namelist():
+        if not membername.endswith('.rels'):
+            continue
+        source_uri = _source_uri_for(membername)
+        srels = _SerializedRelationships.load_from_xml(
+            source_uri.baseURI, zipf.read(membername)
+        )
+        for srel in srels:
+            if srel.is_external or srel.reltype not in MEDIA_RELTYPES:
+                continue
+            rels_by_target.setdefault(srel.target_partname, []).append(
+                (source_uri, srel.rId, srel.reltype)
+            )
+    return rels_by_target
+
+
+def _source_uri_for(rels_membername):
+    """
+    Return the |PackURI| of the source of the rels item *rels_membername*,
+    e.g. '/word/document.xml' for 'word/_rels/document.xml.rels'.
+    """
+    rels_dir, rels_filename = posixpath.split(rels_membername)
+    source_dir = posixpath.dirname(rels_dir)
+    source_filename = rels_filename[:-len('.rels')]
+    if not source_filename:
+        return PACKAGE_URI
+    return PackURI(posixpath.join('/', source_dir, source_filename))
@@ -9,15 +9,42 @@ the package related custom element classes.
 
 from __future__ import absolute_import, print_function, unicode_literals
 
+import threading
+
 from lxml import etree
 
 from docxx.opc.constants import NAMESPACE as NS, RELATIONSHIP_TARGET_MODE as RTM
 
 
+def make_thread_parser(element_class_lookup):
+    """
+    Return a function returning the oxml parser of the calling thread,
+    created on first use with *element_class_lookup*. lxml parsers must not
+    be shared between threads, so each thread parses with its own, all of
+    them sharing *element_class_lookup* and so producing the same custom
+    element classes.
+    """
+    thread_local = threading.local()
+
+    def thread_parser():
+        try:
+            return thread_local.parser
+        except AttributeError:
+            parser = thread_local.parser = etree.XMLParser(
+                remove_blank_text=True, resolve_entities=False
+            )
+            parser.set_element_class_lookup(element_class_lookup)
+            return parser
+
+    return thread_parser
+
+
 # configure XML parser
 element_class_lookup = etree.ElementNamespaceClassLookup()
-oxml_parser = etree.XMLParser(remove_blank_text=True, resolve_entities=False)
-oxml_parser.set_element_class_lookup(element_class_lookup)
+thread_oxml_parser = make_thread_parser(element_class_lookup)
+
+# parser of the importing thread, other threads get their own on first use
+oxml_parser = thread_oxml_parser()
 
 nsmap = {
     'ct': NS.OPC_CONTENT_TYPES,
@@ -32,9 +59,10 @@ nsmap = {
 
 def parse_xml(text):
     """
-    ``etree.fromstring()`` replacement that uses oxml parser
+    ``etree.fromstring()`` replacement that uses the oxml parser of the
+    calling thread
     """
-    return etree.fromstring(text, oxml_parser)
+    return etree.fromstring(text, thread_oxml_parser())
 
 
 def qn(tag):
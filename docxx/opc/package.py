@@ -4,14 +4,16 @@
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+from docxx.compat import BytesIO, is_string
 from docxx.opc.constants import RELATIONSHIP_TYPE as RT
 from docxx.opc.packuri import PACKAGE_URI, PackURI
-from docxx.opc.part import PartFactory
+from docxx.opc.part import PartFactory, XmlPart
 from docxx.opc.parts.coreprops import CorePropertiesPart
 from docxx.opc.pkgreader import PackageReader
 from docxx.opc.pkgwriter import PackageWriter
 from docxx.opc.rel import Relationships
 from docxx.opc.shared import lazyproperty
+from docxx.opc.transport import PackageTransport
 
 
 class OpcPackage(object):
@@ -41,6 +43,19 @@ class OpcPackage(object):
         """
         return self._core_properties_part.core_properties
 
+    def drop_unreferenced_rels(self):
+        """
+        Remove from each XML part in the package the relationships to
+        images, hyperlinks, headers and the like that are no longer
+        referenced from its XML. Parts reachable only through a dropped
+        relationship are then left out when the package is saved. Return the
+        number of relationships dropped.
+        """
+        return sum(
+            len(part.drop_unreferenced_rels()) for part in self.parts
+            if isinstance(part, XmlPart)
+        )
+
     def iter_rels(self):
         """
         Generate exactly one reference to each relationship in the package by
@@ -120,12 +135,24 @@ class OpcPackage(object):
                 return PackURI(candidate_partname)
 
     @classmethod
-    def open(cls, pkg_file):
+    def from_transport(cls, transport):
+        """
+        Return an |OpcPackage| instance loaded from |PackageTransport|
+        *transport*, as produced by :meth:`to_transport`. The parts are
+        parsed again but nothing needs to be decompressed.
+        """
+        return cls.open(transport)
+
+    @classmethod
+    def open(cls, pkg_file, lazy_blobs=False):
         """
         Return an |OpcPackage| instance loaded with the contents of
-        *pkg_file*.
+        *pkg_file*. When *lazy_blobs* is True, binary parts such as images
+        read their blob from *pkg_file* when it is needed, rather than
+        holding it in memory; *pkg_file* must then stay unchanged while the
+        package is in use, other than by saving the package over it.
         """
-        pkg_reader = PackageReader.from_file(pkg_file)
+        pkg_reader = PackageReader.from_file(pkg_file, lazy_blobs)
         package = cls()
         Unmarshaller.unmarshal(pkg_reader, package, PartFactory)
         return package
@@ -162,14 +189,47 @@ class OpcPackage(object):
         """
         return Relationships(PACKAGE_URI.baseURI)
 
-    def save(self, pkg_file):
+    def save(self, pkg_file, compression=None, max_workers=None):
         """
         Save this package to *pkg_file*, where *file* can be either a path to
-        a file (a string) or a file-like object.
+        a file (a string) or a writable file-like object. The file-like object
+        need not be seekable; a socket file or HTTP response body is written
+        front to back in zip streaming mode. *compression* is an optional
+        |CompressionPolicy| choosing the compression level of each part by
+        its content type. When *max_workers* is greater than 1 the parts are
+        compressed on a pool of that many threads.
         """
         for part in self.parts:
             part.before_marshal()
-        PackageWriter.write(pkg_file, self.rels, self.parts)
+            if is_string(pkg_file):
+                part.detach_blob_from(pkg_file)
+        PackageWriter.write(
+            pkg_file, self.rels, self.parts, compression, max_workers
+        )
+
+    def to_bytes(self, compression=None, max_workers=None):
+        """
+        Return this package serialized as it would be saved by :meth:`save`,
+        as a bytes object. The buffer the package is written to becomes the
+        result rather than being copied into it.
+        """
+        stream = BytesIO()
+        self.save(stream, compression, max_workers)
+        blob = stream.getvalue()
+        stream.close()
+        return blob
+
+    def to_transport(self, share_media=False):
+        """
+        Return a picklable |PackageTransport| holding each part of this
+        package as uncompressed XML or bytes, along with the rels graph, to
+        hand this package to another process. When *share_media* is True
+        the binary parts are placed in shared memory rather than pickled
+        with the transport, see |PackageTransport|.
+        """
+        transport = PackageTransport(share_media)
+        self.save(transport)
+        return transport
 
     @property
     def _core_properties_part(self):
@@ -8,10 +8,18 @@ from __future__ import (
     absolute_import, division, print_function, unicode_literals
 )
 
+import hashlib
+import threading
+
+from collections import Counter, OrderedDict
+from copy import deepcopy
+
 from docxx.opc.compat import cls_method_fn
+from docxx.opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
 from docxx.opc.oxml import serialize_part_xml
 from docxx.oxml import parse_xml
 from docxx.opc.packuri import PackURI
+from docxx.opc.phys_pkg import LazyBlob
 from docxx.opc.rel import Relationships
 from docxx.opc.shared import lazyproperty
 
@@ -22,13 +30,25 @@ class Part(object):
     intended to be subclassed in client code to implement specific part
     behaviors.
     """
+    _rel_refs = None
+
     def __init__(self, partname, content_type, blob=None, package=None):
         super(Part, self).__init__()
         self._partname = partname
         self._content_type = content_type
-        self._blob = blob
+        # a memoryview blob is a view into the buffer or memory-mapped file
+        # the package was read from, which the part must not outlive
+        self._blob = blob.tobytes() if isinstance(blob, memoryview) else blob
         self._package = package
 
+    def add_rel_ref(self, rId):
+        """
+        Record a reference to *rId* newly inserted into the XML of this part,
+        keeping the reference-count index current if it has been built.
+        """
+        if self._rel_refs is not None:
+            self._rel_refs[rId] += 1
+
     def after_unmarshal(self):
         """
         Entry point for post-unmarshaling processing, for example to parse
@@ -54,8 +74,11 @@ class Part(object):
         """
         Contents of this package part as a sequence of bytes. May be text or
         binary. Intended to be overridden by subclasses. Default behavior is
-        to return load blob.
+        to return load blob. A part opened with lazy blobs reads its blob
+        from the source package on each access.
         """
+        if isinstance(self._blob, LazyBlob):
+            return self._blob.read()
         return self._blob
 
     @property
@@ -65,15 +88,39 @@ class Part(object):
         """
         return self._content_type
 
+    def detach_blob_from(self, path):
+        """
+        Read the blob of this part into memory if it is still read on demand
+        from the package file at *path*, or from a memory map of it, e.g.
+        before that file is overwritten.
+        """
+        if isinstance(self._blob, LazyBlob) and self._blob.is_read_from(path):
+            self._blob = self._blob.read()
+
     def drop_rel(self, rId):
         """
         Remove the relationship identified by *rId* if its reference count
         is less than 2. Relationships with a reference count of 0 are
         implicit relationships.
+
+        The count is taken from the reference-count index, which the API
+        paths that insert or copy references, such as :meth:`Run.clone`,
+        keep current; a copy that is never inserted only makes the count too
+        high, which keeps a relationship that :meth:`drop_unreferenced_rels`
+        later collects. Call :meth:`invalidate_rel_refs` after adding
+        references by editing the XML directly.
         """
         if self._rel_ref_count(rId) < 2:
             del self.rels[rId]
 
+    def invalidate_rel_refs(self):
+        """
+        Discard the reference-count index so it is rebuilt from the XML on
+        next use. Call after changing references in the XML other than
+        through the methods that maintain the index.
+        """
+        self._rel_refs = None
+
     @classmethod
     def load(cls, partname, content_type, blob, package):
         return cls(partname, content_type, blob, package)
@@ -140,6 +187,18 @@ class Part(object):
         """
         return self.rels.related_parts
 
+    def remove_rel_ref(self, rId):
+        """
+        Record the removal of a reference to *rId* from the XML of this part,
+        keeping the reference-count index current if it has been built.
+        """
+        rel_refs = self._rel_refs
+        if rel_refs is None:
+            return
+        rel_refs[rId] -= 1
+        if rel_refs[rId] <= 0:
+            del rel_refs[rId]
+
     @lazyproperty
     def rels(self):
         """
@@ -158,10 +217,13 @@ class Part(object):
     def _rel_ref_count(self, rId):
         """
         Return the count of references in this part's XML to the relationship
-        identified by *rId*.
+        identified by *rId*. The counts of all rIds are gathered in a single
+        pass over the XML on first use and kept in an index thereafter.
         """
-        rIds = self._element.xpath('//@r:id')
-        return len([_rId for _rId in rIds if _rId == rId])
+        rel_refs = self._rel_refs
+        if rel_refs is None:
+            rel_refs = self._rel_refs = Counter(self._element.xpath('//@r:*'))
+        return rel_refs[rId]
 
 
 class PartFactory(object):
@@ -226,9 +288,29 @@ class XmlPart(Part):
         """
         return self._element
 
+    def drop_unreferenced_rels(self):
+        """
+        Remove each relationship of a type referenced by rId from the XML,
+        such as an image, hyperlink, header or footer, that no longer has any
+        reference in this part. Implicit relationships, like that to the
+        styles part, are kept. Return the list of rIds dropped.
+        """
+        self.invalidate_rel_refs()
+        dropped = [
+            rId for rId, rel in self.rels.items()
+            if rel.reltype in _EXPLICIT_RELTYPES
+            and self._rel_ref_count(rId) == 0
+        ]
+        for rId in dropped:
+            del self.rels[rId]
+        return dropped
+
     @classmethod
     def load(cls, partname, content_type, blob, package):
-        element = parse_xml(blob)
+        if xml_part_cache.caches(content_type):
+            element = xml_part_cache.element_for(blob)
+        else:
+            element = parse_xml(blob)
         return cls(partname, content_type, element, package)
 
     @property
@@ -241,6 +323,131 @@ class XmlPart(Part):
         return self
 
 
+# relationship types whose relationships are referenced by rId from the part
+# XML, and so are no longer needed once the last reference is removed
+_EXPLICIT_RELTYPES = frozenset((
+    RT.AUDIO, RT.CHART, RT.CONTROL, RT.DIAGRAM_COLORS, RT.DIAGRAM_DATA,
+    RT.DIAGRAM_LAYOUT, RT.DIAGRAM_QUICK_STYLE, RT.FOOTER, RT.HEADER,
+    RT.HYPERLINK, RT.IMAGE, RT.OLE_OBJECT, RT.PACKAGE, RT.VIDEO,
+))
+
+
+class XmlPartCache(object):
+    """
+    Thread-safe least-recently-used cache of the parsed XML of parts shared
+    by all the documents in the process, so a part found byte-for-byte
+    identical in many documents, like the styles of documents made from the
+    same template, is parsed only once. Parts are looked up by the SHA1 of
+    their blob and each part loaded gets its own copy of the cached tree,
+    which is about twice as fast to make as parsing the blob again.
+
+    Only parts whose content type is in :attr:`content_types` are cached.
+    The cache is bounded by the total size in bytes of the blobs of the
+    cached parts, *max_bytes*; a value of 0 disables it.
+    """
+    def __init__(self, max_bytes, content_types=()):
+        super(XmlPartCache, self).__init__()
+        self._max_bytes = max_bytes
+        self._content_types = set(content_types)
+        self._elements = OrderedDict()
+        self._nbytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._elements)
+
+    def caches(self, content_type):
+        """
+        |True| if parts of *content_type* are being cached.
+        """
+        return self.enabled and content_type in self._content_types
+
+    def clear(self):
+        """
+        Remove all parsed parts from the cache.
+        """
+        with self._lock:
+            self._elements.clear()
+            self._nbytes = 0
+
+    @property
+    def content_types(self):
+        """
+        The set of content types of the parts cached, e.g.
+        ``CT.WML_STYLES``, which can be added to or removed from.
+        """
+        return self._content_types
+
+    def element_for(self, blob):
+        """
+        Return a new copy of the root element parsed from *blob*, parsing it
+        and caching the result when it is not already in the cache.
+        """
+        key = hashlib.sha1(blob).hexdigest()
+        with self._lock:
+            entry = self._elements.get(key)
+            if entry is not None:
+                self._elements.move_to_end(key)
+        if entry is None:
+            entry = (parse_xml(blob), len(blob))
+            self._put(key, entry)
+        return deepcopy(entry[0])
+
+    @property
+    def enabled(self):
+        """
+        |True| if parts are being cached, i.e. *max_bytes* is not 0.
+        """
+        return self._max_bytes > 0
+
+    @property
+    def max_bytes(self):
+        """
+        Read/write. Upper bound on the total blob size of the cached parts.
+        Lowering it evicts least-recently-used parts as needed.
+        """
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, value):
+        with self._lock:
+            self._max_bytes = value
+            self._evict()
+
+    @property
+    def nbytes(self):
+        """
+        Total size in bytes of the blobs of the cached parts.
+        """
+        return self._nbytes
+
+    def _evict(self):
+        while self._nbytes > self._max_bytes and self._elements:
+            _, (_, size) = self._elements.popitem(last=False)
+            self._nbytes -= size
+
+    def _put(self, key, entry):
+        """
+        Cache *entry*, a (root element, blob size) pair, under *key*. The
+        tree is only ever copied from, never handed out, so it stays as
+        parsed. A part larger than *max_bytes* is not cached.
+        """
+        size = entry[1]
+        with self._lock:
+            if size > self._max_bytes:
+                return
+            old = self._elements.pop(key, None)
+            if old is not None:
+                self._nbytes -= old[1]
+            self._elements[key] = entry
+            self._nbytes += size
+            self._evict()
+
+
+xml_part_cache = XmlPartCache(
+    0, (CT.WML_NUMBERING, CT.WML_SETTINGS, CT.WML_STYLES)
+)
+
 
 def copy_part(srcp, destp, destpackage):
     """ /xtended
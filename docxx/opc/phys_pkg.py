@@ -6,13 +6,118 @@ Provides a general interface to a *physical* OPC package, such as a zip file.
 
 from __future__ import absolute_import
 
+import mmap
 import os
+import struct
+import time
+import zlib
 
-from zipfile import ZipFile, is_zipfile, ZIP_DEFLATED
+from collections import deque
+from zipfile import (
+    BadZipFile, ZipFile, is_zipfile, ZIP_DEFLATED, ZIP_STORED
+)
 
 from docxx.opc.compat import is_string
-from docxx.opc.exceptions import PackageNotFoundError
+from docxx.opc.compression import deflate
+from docxx.opc.exceptions import PackageChangedError, PackageNotFoundError
 from docxx.opc.packuri import CONTENT_TYPES_URI
+from docxx.opc.transport import PackageTransport
+
+
+_LOCAL_HEADER_SIZE = 30
+
+# zip records written by _ZipStreamWriter, see APPNOTE.TXT
+_LOCAL_HEADER = struct.Struct('<4s5H3L2H')
+_CENTRAL_HEADER = struct.Struct('<4s6H3L5H2L')
+_END = struct.Struct('<4s4H2LH')
+_ZIP64_END = struct.Struct('<4sQ2H2L4Q')
+_ZIP64_LOCATOR = struct.Struct('<4sLQL')
+_ZIP64_EXTRA = struct.Struct('<2H2Q')
+_ZIP64_LIMIT = 0xffffffff
+_ZIP_VERSION = 20
+_ZIP64_VERSION = 45
+_MADE_BY_UNIX = 3 << 8
+
+
+def map_file(path):
+    """
+    Return a read-only memory map of the file at *path*, suitable to open as
+    a package without reading the file into memory. The map is released once
+    it and every blob taken from it are no longer referenced. The map knows
+    the path it was made from, as its ``path`` attribute.
+    """
+    with open(path, 'rb') as f:
+        mapped = _MappedFile(f.fileno(), 0, access=mmap.ACCESS_READ)
+    mapped.path = os.path.abspath(path)
+    return mapped
+
+
+def can_reopen(pkg_file):
+    """
+    True if the package *pkg_file* can be opened again after it has been
+    read, so its blobs can be read on demand: a path, a buffer or a seekable
+    stream.
+    """
+    if is_string(pkg_file):
+        return True
+    if isinstance(pkg_file, (bytes, bytearray, memoryview, mmap.mmap)):
+        return True
+    seekable = getattr(pkg_file, 'seekable', None)
+    return seekable is not None and seekable()
+
+
+class LazyBlob(object):
+    """
+    Handle on the blob of the member *pack_uri* of the package *pkg_file*,
+    which is read from the package each time :meth:`read` is called rather
+    than held in memory. The package is reopened for each read; *pkg_file*
+    must be a package for which :func:`can_reopen` is True. For a package
+    file, or a memory map of one made by :func:`map_file`, a read fails with
+    |PackageChangedError| if the file has changed since this handle was
+    created.
+    """
+    def __init__(self, pkg_file, pack_uri):
+        super(LazyBlob, self).__init__()
+        self._pkg_file = pkg_file
+        self._pack_uri = pack_uri
+        self._stamp = _file_stamp(pkg_file)
+
+    def __deepcopy__(self, memo):
+        # the handle is immutable and its package may be a memory map, which
+        # cannot be copied
+        return self
+
+    def is_read_from(self, path):
+        """
+        True if this blob is read from the file at *path*, either directly or
+        through a memory map of it. A memory map not made by :func:`map_file`
+        could be of any file, so it is taken to be of *path*.
+        """
+        pkg_file = self._pkg_file
+        if isinstance(pkg_file, mmap.mmap):
+            if not isinstance(pkg_file, _MappedFile):
+                return True
+            pkg_file = pkg_file.path
+        if not is_string(pkg_file) or not os.path.exists(path):
+            return False
+        return os.path.samefile(pkg_file, path)
+
+    def read(self):
+        """
+        Return the blob, read from the package. The blob is always bytes,
+        never a view of a package buffer.
+        """
+        if _file_stamp(self._pkg_file) != self._stamp:
+            raise PackageChangedError(
+                "package '%s' has changed since it was opened"
+                % _source_name(self._pkg_file)
+            )
+        phys_reader = PhysPkgReader(self._pkg_file)
+        try:
+            blob = phys_reader.blob_for(self._pack_uri)
+        finally:
+            phys_reader.close()
+        return blob.tobytes() if isinstance(blob, memoryview) else blob
 
 
 class PhysPkgReader(object):
@@ -30,6 +135,10 @@ class PhysPkgReader(object):
                 raise PackageNotFoundError(
                     "Package not found at '%s'" % pkg_file
                 )
+        elif isinstance(pkg_file, (bytes, bytearray, memoryview, mmap.mmap)):
+            reader_cls = _BufferPkgReader
+        elif isinstance(pkg_file, PackageTransport):
+            reader_cls = _TransportPkgReader
         else:  # assume it's a stream and pass it to Zip reader to sort out
             reader_cls = _ZipPkgReader
 
@@ -40,8 +149,47 @@ class PhysPkgWriter(object):
     """
     Factory for physical package writer objects.
     """
-    def __new__(cls, pkg_file):
-        return super(PhysPkgWriter, cls).__new__(_ZipPkgWriter)
+    def __new__(cls, pkg_file, compression=None, max_workers=None):
+        if isinstance(pkg_file, PackageTransport):
+            writer_cls = _TransportPkgWriter
+        elif max_workers is not None and max_workers > 1:
+            writer_cls = _ParallelZipPkgWriter
+        else:
+            writer_cls = _ZipPkgWriter
+        return super(PhysPkgWriter, cls).__new__(writer_cls)
+
+
+class LazyPkgReader(object):
+    """
+    Wraps |PhysPkgReader| *phys_reader* over package *pkg_file*, returning
+    a |LazyBlob| in place of the blob of each member whose content type in
+    *content_types* is not XML. XML blobs are read as usual, to be parsed.
+    """
+    def __init__(self, phys_reader, pkg_file, content_types):
+        super(LazyPkgReader, self).__init__()
+        self._phys_reader = phys_reader
+        self._pkg_file = pkg_file
+        self._content_types = content_types
+
+    def blob_for(self, pack_uri):
+        """
+        Return the blob of *pack_uri*, or a |LazyBlob| for it when it is not
+        XML.
+        """
+        content_type = self._content_types[pack_uri]
+        if _is_xml_content_type(content_type):
+            return self._phys_reader.blob_for(pack_uri)
+        return LazyBlob(self._pkg_file, pack_uri)
+
+    def close(self):
+        self._phys_reader.close()
+
+    @property
+    def content_types_xml(self):
+        return self._phys_reader.content_types_xml
+
+    def rels_xml_for(self, source_uri):
+        return self._phys_reader.rels_xml_for(source_uri)
 
 
 class _DirPkgReader(PhysPkgReader):
@@ -132,13 +280,177 @@ class _ZipPkgReader(PhysPkgReader):
         return rels_xml
 
 
+class _BufferPkgReader(_ZipPkgReader):
+    """
+    Implements |PhysPkgReader| interface for a zip file OPC package held in
+    a buffer: bytes, a bytearray, a memoryview or a memory-mapped file, as
+    returned by :func:`map_file`. The buffer is not copied. A deflated member
+    is decompressed straight from the buffer when its blob is requested and
+    the blob of a stored member is a memoryview of the buffer, so XML can be
+    parsed from it without a copy. A |Part| keeping its blob copies such a
+    view, so no part depends on the buffer once the package is open.
+    """
+    def __init__(self, buffer):
+        self._view = memoryview(buffer).cast('B')
+        super(_BufferPkgReader, self).__init__(_BufferStream(self._view))
+
+    def blob_for(self, pack_uri):
+        """
+        Return blob corresponding to *pack_uri*. Raises |KeyError| if no
+        matching member is present in zip archive.
+        """
+        zinfo = self._zipf.getinfo(pack_uri.membername)
+        if zinfo.compress_type not in (ZIP_STORED, ZIP_DEFLATED):
+            return self._zipf.read(zinfo)
+        view = self._view
+        offset = zinfo.header_offset
+        header = view[offset:offset + _LOCAL_HEADER_SIZE]
+        if len(header) < _LOCAL_HEADER_SIZE or header[:4] != b'PK\x03\x04':
+            raise BadZipFile('bad local header for %s' % zinfo.filename)
+        name_len, extra_len = struct.unpack('<HH', header[26:30])
+        start = offset + _LOCAL_HEADER_SIZE + name_len + extra_len
+        data = view[start:start + zinfo.compress_size]
+        if zinfo.compress_type == ZIP_STORED:
+            return data
+        blob = zlib.decompress(data, -zlib.MAX_WBITS, zinfo.file_size or 1)
+        if zlib.crc32(blob) & 0xffffffff != zinfo.CRC:
+            raise BadZipFile('bad CRC-32 for %s' % zinfo.filename)
+        return blob
+
+    def close(self):
+        """
+        Close the zip archive. The buffer itself is left to the caller and
+        to the memoryviews of stored members still in use.
+        """
+        super(_BufferPkgReader, self).close()
+        self._view = None
+
+
+class _MappedFile(mmap.mmap):
+    """
+    Read-only memory map of the package file at :attr:`path`, as returned by
+    :func:`map_file`.
+    """
+    path = None
+
+
+class _BufferStream(object):
+    """
+    Read-only, seekable file-like object over memoryview *view*, letting
+    |ZipFile| read the central directory of a buffer without copying it.
+    """
+    def __init__(self, view):
+        super(_BufferStream, self).__init__()
+        self._view = view
+        self._pos = 0
+
+    def read(self, size=-1):
+        start = self._pos
+        end = len(self._view) if size is None or size < 0 else start + size
+        data = self._view[start:end].tobytes()
+        self._pos = start + len(data)
+        return data
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        if whence == os.SEEK_CUR:
+            offset += self._pos
+        elif whence == os.SEEK_END:
+            offset += len(self._view)
+        if offset < 0:
+            raise ValueError('negative seek position %d' % offset)
+        self._pos = offset
+        return offset
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self._pos
+
+
+class _TransportPkgReader(PhysPkgReader):
+    """
+    Implements |PhysPkgReader| interface for a |PackageTransport|.
+    """
+    def __init__(self, transport):
+        super(_TransportPkgReader, self).__init__()
+        self._transport = transport
+
+    def blob_for(self, pack_uri):
+        """
+        Return blob corresponding to *pack_uri*. Raises |KeyError| if no
+        matching member is present in the transport.
+        """
+        return self._transport.blob_for(pack_uri.membername)
+
+    def close(self):
+        """
+        Close the transport's handle on its shared memory, if any.
+        """
+        self._transport.close()
+
+    @property
+    def content_types_xml(self):
+        """
+        Return the `[Content_Types].xml` blob from the transport.
+        """
+        return self.blob_for(CONTENT_TYPES_URI)
+
+    def rels_xml_for(self, source_uri):
+        """
+        Return rels item XML for source with *source_uri* or None if no rels
+        item is present.
+        """
+        try:
+            rels_xml = self.blob_for(source_uri.rels_uri)
+        except KeyError:
+            rels_xml = None
+        return rels_xml
+
+
+class _TransportPkgWriter(PhysPkgWriter):
+    """
+    Implements |PhysPkgWriter| interface for a |PackageTransport|. Members
+    are added uncompressed, so *compression* and *max_workers* are ignored.
+    """
+    def __init__(self, transport, compression=None, max_workers=None):
+        super(_TransportPkgWriter, self).__init__()
+        self._transport = transport
+
+    def close(self):
+        """
+        Seal the transport once all members have been written.
+        """
+        self._transport.seal()
+
+    def write(self, pack_uri, blob, content_type=None):
+        """
+        Add *blob* to the transport as the member corresponding to
+        *pack_uri*. A member whose *content_type* is not XML is media, which
+        the transport may place in shared memory.
+        """
+        is_media = (
+            content_type is not None and not _is_xml_content_type(content_type)
+        )
+        self._transport.add(pack_uri.membername, blob, is_media)
+
+
 class _ZipPkgWriter(PhysPkgWriter):
     """
     Implements |PhysPkgWriter| interface for a zip file OPC package.
+    *pkg_file* may be a non-seekable stream, in which case each member is
+    followed by a data descriptor instead of its local header being updated.
+
+    *compression* is a |CompressionPolicy| choosing the compression level of
+    each member by its content type; all members are deflated at the default
+    level when it is |None|.
     """
-    def __init__(self, pkg_file):
+    def __init__(self, pkg_file, compression=None, max_workers=None):
         super(_ZipPkgWriter, self).__init__()
+        if not is_string(pkg_file) and not _is_seekable(pkg_file):
+            pkg_file = _WriteOnlyStream(pkg_file)
         self._zipf = ZipFile(pkg_file, 'w', compression=ZIP_DEFLATED)
+        self._compression = compression
 
     def close(self):
         """
@@ -147,9 +459,275 @@ class _ZipPkgWriter(PhysPkgWriter):
         """
         self._zipf.close()
 
-    def write(self, pack_uri, blob):
+    def write(self, pack_uri, blob, content_type=None):
         """
         Write *blob* to this zip package with the membername corresponding to
-        *pack_uri*.
+        *pack_uri*. *content_type* selects the compression level of the
+        member when this writer has a compression policy.
+        """
+        level = _level_for(self._compression, content_type)
+        if level == 0:
+            self._zipf.writestr(
+                pack_uri.membername, blob, compress_type=ZIP_STORED
+            )
+        else:
+            self._zipf.writestr(pack_uri.membername, blob, compresslevel=level)
+
+
+class _ParallelZipPkgWriter(PhysPkgWriter):
+    """
+    Implements |PhysPkgWriter| interface for a zip file OPC package whose
+    members are compressed on a pool of *max_workers* threads; zlib releases
+    the GIL while compressing, so members are deflated concurrently.
+
+    Each member is handed to the pool as it is written and added to the
+    archive, in the order written, once compressed. At most two members per
+    thread are in flight, so memory use does not grow with the size of the
+    package. |ZipFile| cannot add data compressed elsewhere, so the archive
+    is written by a |_ZipStreamWriter|, front to back; *pkg_file* need not
+    be seekable. *compression* is as for |_ZipPkgWriter|.
+    """
+    def __init__(self, pkg_file, compression=None, max_workers=None):
+        super(_ParallelZipPkgWriter, self).__init__()
+        from concurrent.futures import ThreadPoolExecutor
+
+        self._file = open(pkg_file, 'wb') if is_string(pkg_file) else None
+        self._archive = _ZipStreamWriter(
+            pkg_file if self._file is None else self._file
+        )
+        self._compression = compression
+        self._executor = ThreadPoolExecutor(max_workers)
+        self._window = max_workers * 2
+        self._pending = deque()
+
+    def close(self):
+        """
+        Add the members still being compressed, finish the archive and
+        release the thread pool.
+        """
+        try:
+            while self._pending:
+                self._archive.add(*self._pending.popleft().result())
+            self._archive.close()
+        finally:
+            for future in self._pending:
+                future.cancel()
+            self._executor.shutdown()
+            if self._file is not None:
+                self._file.close()
+
+    def write(self, pack_uri, blob, content_type=None):
+        """
+        Compress *blob* on the pool as the member corresponding to
+        *pack_uri*, first adding to the archive members already handed to
+        the pool until there is room in the window.
+        """
+        level = _level_for(self._compression, content_type)
+        while len(self._pending) >= self._window:
+            self._archive.add(*self._pending.popleft().result())
+        self._pending.append(self._executor.submit(
+            _compressed_member, pack_uri.membername, blob, level
+        ))
+
+
+class _ZipStreamWriter(object):
+    """
+    Writes a zip archive of members already compressed to the writable
+    file-like object *stream*, front to back, following the .ZIP File
+    Format Specification (APPNOTE.TXT). Each local header is written with
+    the sizes and CRC known, so *stream* is never read, seeked or asked its
+    position. ZIP64 records are written only where a size, offset or count
+    does not fit the classic fields.
+    """
+    def __init__(self, stream):
+        super(_ZipStreamWriter, self).__init__()
+        self._stream = stream
+        self._offset = 0
+        self._entries = []
+        self._date_time = _dos_date_time(time.localtime(time.time()))
+
+    def add(self, membername, crc, size, data, compress_type):
         """
-        self._zipf.writestr(pack_uri.membername, blob)
+        Add member *membername* holding *data*, the *size* bytes of its blob
+        with CRC-32 *crc* compressed as *compress_type*.
+        """
+        try:
+            name, flags = membername.encode('ascii'), 0
+        except UnicodeEncodeError:
+            name, flags = membername.encode('utf-8'), 0x800  # UTF-8 name
+        compress_size = len(data)
+        extra = b''
+        if size >= _ZIP64_LIMIT or compress_size >= _ZIP64_LIMIT:
+            extra = _ZIP64_EXTRA.pack(1, 16, size, compress_size)
+        version = _ZIP64_VERSION if extra else _ZIP_VERSION
+        dos_time, dos_date = self._date_time
+        offset = self._offset
+        self._write(_LOCAL_HEADER.pack(
+            b'PK\x03\x04', version, flags, compress_type, dos_time,
+            dos_date, crc,
+            0xffffffff if extra else compress_size,
+            0xffffffff if extra else size,
+            len(name), len(extra),
+        ))
+        self._write(name)
+        self._write(extra)
+        self._write(data)
+        self._entries.append(
+            (name, flags, compress_type, crc, compress_size, size, offset)
+        )
+
+    def close(self):
+        """
+        Write the central directory and end records, completing the archive.
+        The stream is flushed but left open.
+        """
+        cd_offset = self._offset
+        dos_time, dos_date = self._date_time
+        for name, flags, compress_type, crc, csize, size, offset in (
+            self._entries
+        ):
+            fields = [
+                value for value in (size, csize, offset)
+                if value >= _ZIP64_LIMIT
+            ]
+            extra = (
+                struct.pack('<2H%dQ' % len(fields), 1, 8 * len(fields),
+                            *fields)
+                if fields else b''
+            )
+            version = _ZIP64_VERSION if extra else _ZIP_VERSION
+            self._write(_CENTRAL_HEADER.pack(
+                b'PK\x01\x02', _MADE_BY_UNIX | version, version, flags,
+                compress_type, dos_time, dos_date, crc,
+                min(csize, 0xffffffff), min(size, 0xffffffff),
+                len(name), len(extra), 0, 0, 0, 0o600 << 16,
+                min(offset, 0xffffffff),
+            ))
+            self._write(name)
+            self._write(extra)
+        cd_size = self._offset - cd_offset
+        count = len(self._entries)
+        if (count >= 0xffff or cd_size >= _ZIP64_LIMIT or
+                cd_offset >= _ZIP64_LIMIT):
+            zip64_end_offset = self._offset
+            self._write(_ZIP64_END.pack(
+                b'PK\x06\x06', _ZIP64_END.size - 12,
+                _MADE_BY_UNIX | _ZIP64_VERSION, _ZIP64_VERSION, 0, 0,
+                count, count, cd_size, cd_offset,
+            ))
+            self._write(_ZIP64_LOCATOR.pack(
+                b'PK\x06\x07', 0, zip64_end_offset, 1
+            ))
+        self._write(_END.pack(
+            b'PK\x05\x06', 0, 0, min(count, 0xffff), min(count, 0xffff),
+            min(cd_size, 0xffffffff), min(cd_offset, 0xffffffff), 0,
+        ))
+        flush = getattr(self._stream, 'flush', None)
+        if flush is not None:
+            flush()
+
+    def _write(self, data):
+        self._stream.write(data)
+        self._offset += len(data)
+
+
+class _WriteOnlyStream(object):
+    """
+    Adapts the non-seekable writable *stream* for |ZipFile|, tracking the
+    write position itself. The stream's ``write()`` need not return the
+    number of bytes written, as WSGI and some HTTP response objects do not,
+    and the stream need not have ``flush()``.
+    """
+    def __init__(self, stream):
+        super(_WriteOnlyStream, self).__init__()
+        self._stream = stream
+        self._offset = 0
+
+    def flush(self):
+        flush = getattr(self._stream, 'flush', None)
+        if flush is not None:
+            flush()
+
+    def tell(self):
+        return self._offset
+
+    def write(self, data):
+        self._stream.write(data)
+        self._offset += len(data)
+        return len(data)
+
+
+def _level_for(compression, content_type):
+    """
+    Return the compression level |CompressionPolicy| *compression* chooses
+    for *content_type*, |None| for the default when there is no policy.
+    """
+    return None if compression is None else compression.level_for(content_type)
+
+
+def _is_seekable(stream):
+    """
+    True if file-like object *stream* supports random access.
+    """
+    seekable = getattr(stream, 'seekable', None)
+    if seekable is not None:
+        return seekable()
+    try:
+        stream.seek(stream.tell())
+    except (AttributeError, OSError):
+        return False
+    return True
+
+
+def _compressed_member(membername, blob, level):
+    """
+    Return the arguments of :meth:`_ZipStreamWriter.add` for *blob* as the
+    member *membername*, deflated at *level* or stored when *level* is 0.
+    """
+    crc = zlib.crc32(blob) & 0xffffffff
+    if level == 0:
+        return membername, crc, len(blob), blob, ZIP_STORED
+    return membername, crc, len(blob), deflate(blob, level), ZIP_DEFLATED
+
+
+def _dos_date_time(t):
+    """
+    Return the `(time, date)` pair of MS-DOS fields encoding struct_time *t*.
+    """
+    dos_time = t.tm_hour << 11 | t.tm_min << 5 | t.tm_sec // 2
+    dos_date = max(t.tm_year - 1980, 0) << 9 | t.tm_mon << 5 | t.tm_mday
+    return dos_time, dos_date
+
+
+def _file_stamp(pkg_file):
+    """
+    Return a value that changes when the package file *pkg_file* does, or
+    |None| when *pkg_file* is neither the path of a file nor a memory map of
+    one made by :func:`map_file`.
+    """
+    if isinstance(pkg_file, _MappedFile):
+        pkg_file = pkg_file.path
+    if not is_string(pkg_file) or not os.path.isfile(pkg_file):
+        return None
+    stat = os.stat(pkg_file)
+    return (stat.st_size, stat.st_mtime_ns)
+
+
+def _source_name(pkg_file):
+    """
+    Return the path of package *pkg_file* for messages, or its type name
+    when it is not read from a file.
+    """
+    if is_string(pkg_file):
+        return pkg_file
+    if isinstance(pkg_file, _MappedFile):
+        return pkg_file.path
+    return type(pkg_file).__name__
+
+
+def _is_xml_content_type(content_type):
+    """
+    True if *content_type*, e.g. ``'application/xml'`` or
+    ``'application/vnd.openxmlformats-package.relationships+xml'``, is XML.
+    """
+    return content_type.endswith('+xml') or content_type.endswith('/xml')
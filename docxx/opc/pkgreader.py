@@ -10,7 +10,7 @@ from __future__ import absolute_import
 from docxx.opc.constants import RELATIONSHIP_TARGET_MODE as RTM
 from docxx.opc.oxml import parse_xml
 from docxx.opc.packuri import PACKAGE_URI, PackURI
-from docxx.opc.phys_pkg import PhysPkgReader
+from docxx.opc.phys_pkg import can_reopen, LazyPkgReader, PhysPkgReader
 from docxx.opc.shared import CaseInsensitiveDict
 
 
@@ -19,32 +19,46 @@ class PackageReader(object):
     Provides access to the contents of a zip-format OPC package via its
     :attr:`serialized_parts` and :attr:`pkg_srels` attributes.
     """
-    def __init__(self, content_types, pkg_srels, sparts):
+    def __init__(self, content_types, pkg_srels, sparts, release_blobs=False):
         super(PackageReader, self).__init__()
         self._pkg_srels = pkg_srels
         self._sparts = sparts
+        self._release_blobs = release_blobs
 
     @staticmethod
-    def from_file(pkg_file):
+    def from_file(pkg_file, lazy_blobs=False):
         """
         Return a |PackageReader| instance loaded with contents of *pkg_file*.
+        When *lazy_blobs* is True and *pkg_file* can be reopened, each
+        non-XML part, such as an image, gets a |LazyBlob| reading it from
+        *pkg_file* on demand in place of its blob, and each XML blob is
+        released once the part has been loaded from it.
         """
         phys_reader = PhysPkgReader(pkg_file)
         content_types = _ContentTypeMap.from_xml(phys_reader.content_types_xml)
         pkg_srels = PackageReader._srels_for(phys_reader, PACKAGE_URI)
+        lazy_blobs = lazy_blobs and can_reopen(pkg_file)
+        blob_reader = (
+            LazyPkgReader(phys_reader, pkg_file, content_types) if lazy_blobs
+            else phys_reader
+        )
         sparts = PackageReader._load_serialized_parts(
-            phys_reader, pkg_srels, content_types
+            blob_reader, pkg_srels, content_types
         )
         phys_reader.close()
-        return PackageReader(content_types, pkg_srels, sparts)
+        return PackageReader(content_types, pkg_srels, sparts, lazy_blobs)
 
     def iter_sparts(self):
         """
         Generate a 4-tuple `(partname, content_type, reltype, blob)` for each
-        of the serialized parts in the package.
+        of the serialized parts in the package. When this reader releases
+        blobs, each blob is dropped once the consumer moves on to the next
+        part, so the parts can be iterated only once.
         """
         for s in self._sparts:
             yield (s.partname, s.content_type, s.reltype, s.blob)
+            if self._release_blobs:
+                s.release_blob()
 
     def iter_srels(self):
         """
@@ -189,6 +203,12 @@ class _SerializedPart(object):
     def blob(self):
         return self._blob
 
+    def release_blob(self):
+        """
+        Drop the reference to the blob of this part.
+        """
+        self._blob = None
+
     @property
     def reltype(self):
         """
@@ -23,13 +23,14 @@ class PackageWriter(object):
     be instantiated.
     """
     @staticmethod
-    def write(pkg_file, pkg_rels, parts):
+    def write(pkg_file, pkg_rels, parts, compression=None, max_workers=None):
         """
         Write a physical package (.pptx file) to *pkg_file* containing
         *pkg_rels* and *parts* and a content types stream based on the
-        content types of the parts.
+        content types of the parts. *compression* and *max_workers* are
+        passed to the physical writer, see |PhysPkgWriter|.
         """
-        phys_writer = PhysPkgWriter(pkg_file)
+        phys_writer = PhysPkgWriter(pkg_file, compression, max_workers)
         PackageWriter._write_content_types_stream(phys_writer, parts)
         PackageWriter._write_pkg_rels(phys_writer, pkg_rels)
         PackageWriter._write_parts(phys_writer, parts)
@@ -51,9 +52,12 @@ class PackageWriter(object):
         rels item for its relationships if and only if it has any.
         """
         for part in parts:
-            phys_writer.write(part.partname, part.blob)
+            phys_writer.write(part.partname, part.blob, part.content_type)
             if len(part._rels):
-                phys_writer.write(part.partname.rels_uri, part._rels.xml)
+                phys_writer.write(
+                    part.partname.rels_uri, part._rels.xml,
+                    CT.OPC_RELATIONSHIPS
+                )
 
     @staticmethod
     def _write_pkg_rels(phys_writer, pkg_rels):
@@ -61,7 +65,9 @@ class PackageWriter(object):
         Write the XML rels item for *pkg_rels* ('/_rels/.rels') to the
         package.
         """
-        phys_writer.write(PACKAGE_URI.rels_uri, pkg_rels.xml)
+        phys_writer.write(
+            PACKAGE_URI.rels_uri, pkg_rels.xml, CT.OPC_RELATIONSHIPS
+        )
 
 
 class _ContentTypesItem(object):
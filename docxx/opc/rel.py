@@ -14,11 +14,41 @@ from docxx.opc.oxml import CT_Relationships
 class Relationships(dict):
     """
     Collection object for |_Relationship| instances, having list semantics.
+    Secondary indexes by (reltype, target) and by reltype, and the lowest
+    rId number that may be free, are maintained as relationships are added
+    and removed, so lookups and rId allocation do not scan the collection.
     """
     def __init__(self, baseURI):
         super(Relationships, self).__init__()
         self._baseURI = baseURI
         self._target_parts_by_rId = {}
+        self._rels_by_target = {}
+        self._rels_by_reltype = {}
+        self._next_rId_number = 1
+
+    def __setitem__(self, rId, rel):
+        if rId in self:
+            self._unindex(rId, self[rId])
+        super(Relationships, self).__setitem__(rId, rel)
+        self._index(rId, rel)
+
+    def __delitem__(self, rId):
+        rel = self[rId]
+        super(Relationships, self).__delitem__(rId)
+        self._unindex(rId, rel)
+        self._target_parts_by_rId.pop(rId, None)
+        number = _rId_number(rId)
+        if number is not None and number < self._next_rId_number:
+            self._next_rId_number = number
+
+    def pop(self, rId, *default):
+        if rId not in self:
+            if default:
+                return default[0]
+            raise KeyError(rId)
+        rel = self[rId]
+        del self[rId]
+        return rel
 
     def add_relationship(self, reltype, target, rId, is_external=False):
         """
@@ -89,20 +119,10 @@ class Relationships(dict):
         Return relationship of matching *reltype*, *target*, and
         *is_external* from collection, or None if not found.
         """
-        def matches(rel, reltype, target, is_external):
-            if rel.reltype != reltype:
-                return False
-            if rel.is_external != is_external:
-                return False
-            rel_target = rel.target_ref if rel.is_external else rel.target_part
-            if rel_target != target:
-                return False
-            return True
-
-        for rel in self.values():
-            if matches(rel, reltype, target, is_external):
-                return rel
-        return None
+        matching = self._rels_by_target.get((reltype, bool(is_external), target))
+        if not matching:
+            return None
+        return next(iter(matching.values()))
 
     def _get_rel_of_type(self, reltype):
         """
@@ -110,25 +130,72 @@ class Relationships(dict):
         Raises |KeyError| if no matching relationship is found. Raises
         |ValueError| if more than one matching relationship is found.
         """
-        matching = [rel for rel in self.values() if rel.reltype == reltype]
-        if len(matching) == 0:
+        matching = self._rels_by_reltype.get(reltype)
+        if not matching:
             tmpl = "no relationship of type '%s' in collection"
             raise KeyError(tmpl % reltype)
         if len(matching) > 1:
             tmpl = "multiple relationships of type '%s' in collection"
             raise ValueError(tmpl % reltype)
-        return matching[0]
+        return next(iter(matching.values()))
+
+    def _index(self, rId, rel):
+        """
+        Add *rel* under *rId* to the (reltype, target) and reltype indexes.
+        """
+        self._rels_by_target.setdefault(_target_key(rel), {})[rId] = rel
+        self._rels_by_reltype.setdefault(rel.reltype, {})[rId] = rel
+
+    def _unindex(self, rId, rel):
+        """
+        Remove *rel* under *rId* from the (reltype, target) and reltype
+        indexes.
+        """
+        for index, key in (
+            (self._rels_by_target, _target_key(rel)),
+            (self._rels_by_reltype, rel.reltype),
+        ):
+            matching = index.get(key)
+            if matching is None:
+                continue
+            matching.pop(rId, None)
+            if not matching:
+                del index[key]
 
     @property
     def _next_rId(self):
         """
         Next available rId in collection, starting from 'rId1' and making use
-        of any gaps in numbering, e.g. 'rId2' for rIds ['rId1', 'rId3'].
+        of any gaps in numbering, e.g. 'rId2' for rIds ['rId1', 'rId3']. Every
+        rId below the remembered number is known to be taken, so the search
+        resumes from there rather than from 'rId1'.
         """
-        for n in range(1, len(self)+2):
-            rId_candidate = 'rId%d' % n  # like 'rId19'
-            if rId_candidate not in self:
-                return rId_candidate
+        n = self._next_rId_number
+        while 'rId%d' % n in self:
+            n += 1
+        self._next_rId_number = n
+        return 'rId%d' % n
+
+
+def _rId_number(rId):
+    """
+    Return the integer suffix of an rId like 'rId19', or |None| if *rId* is
+    not of that form.
+    """
+    if isinstance(rId, str) and rId.startswith('rId') and rId[3:].isdigit():
+        return int(rId[3:])
+    return None
+
+
+def _target_key(rel):
+    """
+    Return the (reltype, is_external, target) key of *rel* in the target
+    index, where target is the target ref for an external relationship and
+    the target part otherwise.
+    """
+    is_external = rel.is_external
+    target = rel.target_ref if is_external else rel.target_part
+    return (rel.reltype, bool(is_external), target)
 
 
 class _Relationship(object):
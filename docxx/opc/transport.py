@@ -0,0 +1,180 @@
+# encoding: utf-8
+
+"""
+Picklable, uncompressed form of an OPC package, for handing an opened package
+to another process without deflating it into a zip archive and inflating it
+again on the other side.
+"""
+
+from __future__ import absolute_import
+
+import os
+import weakref
+
+_SHARED_MEMORY = 'shared_memory'
+
+
+class PackageTransport(object):
+    """
+    Members of a package, each the uncompressed blob written by
+    :meth:`OpcPackage.save`: the serialized XML of each part and rels item
+    and the bytes of each binary part, keyed by membername. A transport is
+    produced by :meth:`OpcPackage.to_transport`, can be pickled and is
+    opened again by :meth:`OpcPackage.from_transport` or :func:`open_docx`.
+
+    When *share_media* is True, images and other binary members are placed
+    in a single shared memory segment rather than in the transport, so
+    pickling the transport copies only the XML and the segment name. The
+    transport that created the segment owns it: it must be kept until every
+    process it was handed to has opened it, then released with
+    :meth:`release`, or by using it as a context manager. The segment is
+    also released when the owning transport is garbage collected.
+    """
+    def __init__(self, share_media=False):
+        super(PackageTransport, self).__init__()
+        self._share_media = share_media
+        self._members = {}
+        self._media = []
+        self._shared = {}
+        self._segment_name = None
+        self._segment = None
+        self._finalizer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.release()
+
+    def __getstate__(self):
+        return (self._members, self._shared, self._segment_name)
+
+    def __setstate__(self, state):
+        self.__init__()
+        self._members, self._shared, self._segment_name = state
+
+    def add(self, membername, blob, is_media=False):
+        """
+        Add *blob* as the member *membername*. *is_media* marks a binary
+        member to be moved into shared memory when this transport shares
+        media.
+        """
+        self._members[membername] = bytes(blob)
+        if is_media and self._share_media:
+            self._media.append(membername)
+
+    def blob_for(self, membername):
+        """
+        Return the blob of member *membername*. Raises |KeyError| if there is
+        no such member.
+        """
+        if membername in self._members:
+            return self._members[membername]
+        offset, size = self._shared[membername]
+        if self._segment is None:
+            self._segment = _attach_segment(self._segment_name)
+        return bytes(self._segment.buf[offset:offset + size])
+
+    def close(self):
+        """
+        Close the handle this process holds on the shared memory segment, if
+        any. The segment itself is left in place.
+        """
+        if self._segment is not None:
+            self._segment.close()
+            self._segment = None
+
+    @property
+    def nbytes(self):
+        """
+        Total size of the member blobs, whether held in this transport or in
+        shared memory.
+        """
+        return (
+            sum(len(blob) for blob in self._members.values()) +
+            sum(size for _, size in self._shared.values())
+        )
+
+    def release(self):
+        """
+        Close this transport's handle on its shared memory segment and, when
+        this transport created the segment, remove it. Processes the
+        transport was handed to can no longer open it afterwards.
+        """
+        self.close()
+        if self._finalizer is not None:
+            self._finalizer()
+
+    def seal(self):
+        """
+        Move the media members into a new shared memory segment when this
+        transport shares media. Called once every member has been added.
+        """
+        media, self._media = self._media, []
+        size = sum(len(self._members[membername]) for membername in media)
+        if not size:
+            return
+        segment = _create_segment(size)
+        offset = 0
+        for membername in media:
+            blob = self._members.pop(membername)
+            segment.buf[offset:offset + len(blob)] = blob
+            self._shared[membername] = (offset, len(blob))
+            offset += len(blob)
+        self._segment = segment
+        self._segment_name = segment.name
+        self._finalizer = weakref.finalize(self, _unlink_segment, segment.name)
+
+
+def _attach_segment(name):
+    """
+    Return a handle on the existing shared memory segment *name*, left
+    untracked so the process opening it does not remove it on exit.
+    """
+    from multiprocessing.shared_memory import SharedMemory
+
+    try:
+        return SharedMemory(name, track=False)
+    except TypeError:  # track is new in Python 3.13
+        segment = SharedMemory(name)
+        _untrack(segment)
+        return segment
+
+
+def _create_segment(size):
+    """
+    Return a new shared memory segment of *size* bytes, untracked so it
+    outlives a process exit only until its owner releases it.
+    """
+    from multiprocessing.shared_memory import SharedMemory
+
+    try:
+        return SharedMemory(create=True, size=size, track=False)
+    except TypeError:  # track is new in Python 3.13
+        segment = SharedMemory(create=True, size=size)
+        _untrack(segment)
+        return segment
+
+
+def _untrack(segment):
+    """
+    Remove *segment* from the resource tracker, which would otherwise remove
+    the segment when the process exits and warn about it as leaked.
+    """
+    if os.name == 'posix':
+        from multiprocessing import resource_tracker
+        resource_tracker.unregister(segment._name, _SHARED_MEMORY)
+
+
+def _unlink_segment(name):
+    """
+    Remove the shared memory segment *name*.
+    """
+    segment = _attach_segment(name)
+    segment.close()
+    if os.name == 'posix' and getattr(segment, '_track', True):
+        # unlink() reports the removal to the resource tracker, which must
+        # then know of the segment
+        from multiprocessing import resource_tracker
+        resource_tracker.register(segment._name, _SHARED_MEMORY)
+    segment.unlink()
@@ -7,25 +7,49 @@ corresponding to Open XML elements.
 
 from __future__ import absolute_import
 import sys
+import threading
 
 from lxml import etree
 
+from docxx.opc.oxml import make_thread_parser
+
 from .ns import NamespacePrefixedTag, nsmap, pfxmap
 
 # configure XML parser
 element_class_lookup = etree.ElementNamespaceClassLookup()
-oxml_parser = etree.XMLParser(remove_blank_text=True, resolve_entities=False)
-oxml_parser.set_element_class_lookup(element_class_lookup)
+_thread_parser = make_thread_parser(element_class_lookup)
+
+# parser of the importing thread, other threads get their own on first use
+oxml_parser = _thread_parser()
+
+# custom element classes are registered on first use of the parser
+_classes_registered = False
+_registration_lock = threading.RLock()
+
+
+def thread_oxml_parser():
+    """
+    Return the oxml parser of the calling thread, creating it on first use.
+    lxml parsers must not be used by two threads at once, so each thread
+    parses with its own parser; all of them share :data:`element_class_lookup`
+    and so produce the same custom element classes. This is what allows
+    independent documents to be opened, edited and saved concurrently from
+    different threads. The custom element classes are registered on the
+    first call.
+    """
+    if not _classes_registered:
+        _register_element_classes()
+    return _thread_parser()
 
 
 def parse_xml(xml):
     """
     Return root lxml element obtained by parsing XML character string in
     *xml*, which can be either a Python 2.x string or unicode. The custom
-    parser is used, so custom element classes are produced for elements in
-    *xml* that have them.
+    parser of the calling thread is used, so custom element classes are
+    produced for elements in *xml* that have them.
     """
-    root_element = etree.fromstring(xml, oxml_parser)
+    root_element = etree.fromstring(xml, thread_oxml_parser())
     return root_element
 
 
@@ -33,13 +57,51 @@ def register_element_cls(tag, cls):
     """
     Register *cls* to be constructed when the oxml parser encounters an
     element with matching *tag*. *tag* is a string of the form
-    ``nspfx:tagroot``, e.g. ``'w:document'``.
+    ``nspfx:tagroot``, e.g. ``'w:document'``. The built-in custom element
+    classes are registered first, so *cls* replaces any of them for *tag*.
     """
+    if not _classes_registered:
+        _register_element_classes()
+    _register_element_cls(tag, cls)
+
+
+def _register_element_cls(tag, cls):
     nspfx, tagroot = tag.split(':')
     namespace = element_class_lookup.get_namespace(nsmap[nspfx])
     namespace[tagroot] = cls
 
 
+def _register_element_classes():
+    """
+    Register the built-in custom element classes, once, by importing
+    :mod:`docxx.oxml.registry`. Deferred to first use of the parser so that
+    importing the package does not import every custom element class.
+    """
+    global _classes_registered
+    with _registration_lock:
+        if _classes_registered:
+            return
+        from docxx.oxml import registry  # noqa
+        _classes_registered = True
+
+
+def __getattr__(name):
+    """
+    Provide the custom element classes formerly imported into this module,
+    e.g. ``docxx.oxml.CT_P``, registering them on first access.
+    """
+    if name.startswith('CT_'):
+        _register_element_classes()
+        from docxx.oxml import registry
+        try:
+            return getattr(registry, name)
+        except AttributeError:
+            pass
+    raise AttributeError(
+        "module '%s' has no attribute '%s'" % (__name__, name)
+    )
+
+
 def OxmlElement(nsptag_str, attrs=None, nsdecls=None):
     """
     Return a 'loose' lxml element having the tag specified by *nsptag_str*.
@@ -55,7 +117,7 @@ def OxmlElement(nsptag_str, attrs=None, nsdecls=None):
     nsptag = NamespacePrefixedTag(nsptag_str)
     if nsdecls is None:
         nsdecls = nsptag.nsmap
-    return oxml_parser.makeelement(
+    return thread_oxml_parser().makeelement(
         nsptag.clark_name, attrib=attrs, nsmap=nsdecls
     )
 
@@ -67,273 +129,3 @@ def extend_nsmap(newnsmap):
     nsmap.update(newnsmap)
     newpfxmap = {v:k for k,v in newnsmap.items()}
     pfxmap.update(newpfxmap)
-
-
-# ===========================================================================
-# custom element class mappings
-# ===========================================================================
-
-from .shared import (
-    CT_DecimalNumber,
-    CT_MarkupRange, 
-    CT_Markup, 
-    CT_OnOff, 
-    CT_String, 
-    CT_Bookmark,
-)
-register_element_cls("w:evenAndOddHeaders", CT_OnOff)
-register_element_cls("w:titlePg", CT_OnOff)
-
-
-from .coreprops import CT_CoreProperties  # noqa
-register_element_cls('cp:coreProperties', CT_CoreProperties)
-
-from .document import CT_Body, CT_Document  # noqa
-register_element_cls('w:body',     CT_Body)
-register_element_cls('w:document', CT_Document)
-
-from .numbering import CT_Num, CT_Numbering, CT_NumLvl, CT_NumPr  # noqa
-register_element_cls('w:abstractNumId', CT_DecimalNumber)
-register_element_cls('w:ilvl',          CT_DecimalNumber)
-register_element_cls('w:lvlOverride',   CT_NumLvl)
-register_element_cls('w:num',           CT_Num)
-register_element_cls('w:numId',         CT_DecimalNumber)
-register_element_cls('w:numPr',         CT_NumPr)
-register_element_cls('w:numbering',     CT_Numbering)
-register_element_cls('w:startOverride', CT_DecimalNumber)
-
-from .section import (  # noqa
-    CT_DocGrid,
-    CT_HdrFtr,
-    CT_HdrFtrRef,
-    CT_PageMar,
-    CT_PageSz,
-    CT_SectPr,
-    CT_SectType,
-    CT_TextDirection,
-)
-register_element_cls("w:footerReference", CT_HdrFtrRef)
-register_element_cls("w:ftr", CT_HdrFtr)
-register_element_cls("w:hdr", CT_HdrFtr)
-register_element_cls("w:headerReference", CT_HdrFtrRef)
-register_element_cls("w:pgMar", CT_PageMar)
-register_element_cls("w:pgSz", CT_PageSz)
-register_element_cls("w:sectPr", CT_SectPr)
-register_element_cls("w:type", CT_SectType)
-register_element_cls("w:textDirection", CT_TextDirection)
-register_element_cls("w:docGrid", CT_DocGrid)
-
-from .settings import CT_Settings  # noqa
-register_element_cls("w:settings", CT_Settings)
-
-from .shape import (  # noqa
-    CT_Blip,
-    CT_BlipFillProperties,
-    CT_GraphicalObject,
-    CT_GraphicalObjectData,
-    CT_Inline,
-    CT_Anchor,
-    CT_NonVisualDrawingProps,
-    CT_Picture,
-    CT_PictureNonVisual,
-    CT_Point2D,
-    CT_PositiveSize2D,
-    CT_ShapeProperties,
-    CT_Transform2D,
-)
-register_element_cls('a:blip',        CT_Blip)
-register_element_cls('a:ext',         CT_PositiveSize2D)
-register_element_cls('a:graphic',     CT_GraphicalObject)
-register_element_cls('a:graphicData', CT_GraphicalObjectData)
-register_element_cls('a:off',         CT_Point2D)
-register_element_cls('a:xfrm',        CT_Transform2D)
-register_element_cls('pic:blipFill',  CT_BlipFillProperties)
-register_element_cls('pic:cNvPr',     CT_NonVisualDrawingProps)
-register_element_cls('pic:nvPicPr',   CT_PictureNonVisual)
-register_element_cls('pic:pic',       CT_Picture)
-register_element_cls('pic:spPr',      CT_ShapeProperties)
-register_element_cls('wp:docPr',      CT_NonVisualDrawingProps)
-register_element_cls('wp:extent',     CT_PositiveSize2D)
-register_element_cls('wp:inline',     CT_Inline)
-register_element_cls('wp:anchor',     CT_Anchor)
-
-from .styles import CT_LatentStyles, CT_LsdException, CT_Style, CT_Styles, CT_DocDefaults, CT_PPrDefault, CT_RPrDefault
-register_element_cls('w:basedOn',        CT_String)
-register_element_cls('w:latentStyles',   CT_LatentStyles)
-register_element_cls('w:locked',         CT_OnOff)
-register_element_cls('w:lsdException',   CT_LsdException)
-register_element_cls('w:name',           CT_String)
-register_element_cls('w:next',           CT_String)
-register_element_cls('w:qFormat',        CT_OnOff)
-register_element_cls('w:semiHidden',     CT_OnOff)
-register_element_cls('w:style',          CT_Style)
-register_element_cls('w:styles',         CT_Styles)
-register_element_cls('w:uiPriority',     CT_DecimalNumber)
-register_element_cls('w:unhideWhenUsed', CT_OnOff)
-register_element_cls('w:docDefaults',    CT_DocDefaults)
-register_element_cls('w:rPrDefault',     CT_RPrDefault)
-register_element_cls('w:pPrDefault',     CT_PPrDefault)
-
-from .table import (  # noqa
-    CT_Height,
-    CT_Row,
-    CT_Tbl,
-    CT_TblGrid,
-    CT_TblGridCol,
-    CT_TblLayoutType,
-    CT_TblPr,
-    CT_TblWidth,
-    CT_Tc,
-    CT_TcPr,
-    CT_TrPr,
-    CT_VMerge,
-    CT_VerticalJc,
-)
-register_element_cls('w:bidiVisual', CT_OnOff)
-register_element_cls('w:gridCol',    CT_TblGridCol)
-register_element_cls('w:gridSpan',   CT_DecimalNumber)
-register_element_cls('w:tbl',        CT_Tbl)
-register_element_cls('w:tblGrid',    CT_TblGrid)
-register_element_cls('w:tblLayout',  CT_TblLayoutType)
-register_element_cls('w:tblPr',      CT_TblPr)
-register_element_cls('w:tblStyle',   CT_String)
-register_element_cls('w:tc',         CT_Tc)
-register_element_cls('w:tcPr',       CT_TcPr)
-register_element_cls('w:tcW',        CT_TblWidth)
-register_element_cls('w:tr',         CT_Row)
-register_element_cls('w:trHeight',   CT_Height)
-register_element_cls('w:trPr',       CT_TrPr)
-register_element_cls('w:vAlign',     CT_VerticalJc)
-register_element_cls('w:vMerge',     CT_VMerge)
-
-from .text.font import (  # noqa
-    CT_Color,
-    CT_EastAsianLayout,
-    CT_Em, 
-    CT_Fonts,
-    CT_Highlight,
-    CT_HpsMeasure,
-    CT_RPr,
-    CT_TextEffect, 
-    CT_Underline,
-    CT_VerticalAlignRun,
-)
-register_element_cls('w:b',          CT_OnOff)
-register_element_cls('w:bCs',        CT_OnOff)
-register_element_cls('w:caps',       CT_OnOff)
-register_element_cls('w:color',      CT_Color)
-register_element_cls('w:cs',         CT_OnOff)
-register_element_cls('w:dstrike',    CT_OnOff)
-register_element_cls('w:eastAsianLayout', CT_EastAsianLayout)      #
-register_element_cls('w:em',         CT_Em)      #
-register_element_cls('w:emboss',     CT_OnOff)
-register_element_cls('w:effect',     CT_TextEffect)
-register_element_cls('w:highlight',  CT_Highlight)
-register_element_cls('w:i',          CT_OnOff)
-register_element_cls('w:iCs',        CT_OnOff)
-register_element_cls('w:imprint',    CT_OnOff)
-register_element_cls('w:noProof',    CT_OnOff)
-register_element_cls('w:oMath',      CT_OnOff)
-register_element_cls('w:outline',    CT_OnOff)
-register_element_cls('w:rFonts',     CT_Fonts)
-register_element_cls('w:rPr',        CT_RPr)
-register_element_cls('w:rStyle',     CT_String)
-register_element_cls('w:rtl',        CT_OnOff)
-register_element_cls('w:shadow',     CT_OnOff)
-register_element_cls('w:smallCaps',  CT_OnOff)
-register_element_cls('w:snapToGrid', CT_OnOff)
-register_element_cls('w:specVanish', CT_OnOff)
-register_element_cls('w:strike',     CT_OnOff)
-register_element_cls('w:sz',         CT_HpsMeasure)
-register_element_cls('w:szCs',       CT_HpsMeasure)
-register_element_cls('w:u',          CT_Underline)
-register_element_cls('w:vanish',     CT_OnOff)
-register_element_cls('w:vertAlign',  CT_VerticalAlignRun)
-#register_element_cls('w:w',          CT_TextScale)
-register_element_cls('w:webHidden',  CT_OnOff)
-
-from .text.paragraph import CT_P  # noqa
-register_element_cls('w:p', CT_P)
-register_element_cls('w:bookmarkStart',         CT_Bookmark)
-register_element_cls('w:bookmarkEnd',           CT_MarkupRange)
-register_element_cls('w:commentRangeStart',     CT_MarkupRange)
-register_element_cls('w:commentRangeEnd',       CT_MarkupRange)
-
-from .text.parfmt import (  # noqa
-    CT_Hyperlink,
-    CT_Ind,
-    CT_Jc,
-    CT_PPr,
-    CT_Spacing,
-    CT_TabStop,
-    CT_TabStops,
-)
-register_element_cls('w:ind',             CT_Ind)
-register_element_cls('w:jc',              CT_Jc)
-register_element_cls('w:keepLines',       CT_OnOff)
-register_element_cls('w:keepNext',        CT_OnOff)
-register_element_cls('w:pageBreakBefore', CT_OnOff)
-register_element_cls('w:pPr',             CT_PPr)
-register_element_cls('w:pStyle',          CT_String)
-register_element_cls('w:spacing',         CT_Spacing)
-register_element_cls('w:tab',             CT_TabStop)
-register_element_cls('w:tabs',            CT_TabStops)
-register_element_cls('w:widowControl',    CT_OnOff)
-register_element_cls('w:hyperlink',       CT_Hyperlink)
-
-from .text.run import (
-    CT_Br, 
-    CT_Drawing,
-    CT_FldChar,
-    CT_Lang, 
-    CT_R, 
-    CT_Ruby, 
-    CT_RubyAlign, 
-    CT_RubyContent, 
-    CT_RubyPr, 
-    CT_Text, 
-)
-register_element_cls('w:br', CT_Br)
-register_element_cls('w:r',  CT_R)
-register_element_cls('w:t',  CT_Text)
-register_element_cls('w:ruby',  CT_Ruby)
-register_element_cls('w:delText',  CT_Text) 
-register_element_cls('w:instrText',  CT_Text)
-register_element_cls('w:delInstrText',  CT_Text)
-register_element_cls('w:fldChar',  CT_FldChar)
-register_element_cls('w:drawing',  CT_Drawing)
-
-# ruby
-register_element_cls('w:rubyPr',     CT_RubyPr)
-register_element_cls('w:rt',         CT_RubyContent)
-register_element_cls('w:rubyBase',   CT_RubyContent)
-# rubyPr
-register_element_cls('w:rubyAlign',   CT_RubyAlign)
-register_element_cls('w:hps',         CT_HpsMeasure)
-register_element_cls('w:hpsRaise',    CT_HpsMeasure)
-register_element_cls('w:hpsBaseText', CT_HpsMeasure)
-register_element_cls('w:lid',         CT_Lang)
-register_element_cls('w:dirty',       CT_OnOff)
-
-from .notes import (
-    CT_Endnotes, 
-    CT_Footnotes, 
-    CT_FtnEdn, 
-    CT_FtnEdnRef
-)
-register_element_cls('w:endnotes',    CT_Endnotes)
-register_element_cls('w:footnotes',   CT_Footnotes)
-register_element_cls('w:endnote',     CT_FtnEdn)
-register_element_cls('w:footnote',    CT_FtnEdn)
-register_element_cls('w:footnoteReference', CT_FtnEdnRef)
-register_element_cls('w:endnoteReference', CT_FtnEdnRef)
-
-from .comments import (
-    CT_Comment, 
-    CT_Comments
-)
-register_element_cls('w:comments',    CT_Comments)
-register_element_cls('w:comment',     CT_Comment)
-register_element_cls('w:commentReference', CT_Markup)
-
-
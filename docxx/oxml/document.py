@@ -17,10 +17,15 @@ class CT_Document(BaseOxmlElement):
     @property
     def sectPr_lst(self):
         """
-        Return a list containing a reference to each ``<w:sectPr>`` element
-        in the document, in the order encountered.
+        Return a list containing a reference to each body-level
+        ``<w:sectPr>`` element in the document, in the order encountered.
+        Only the children of ``<w:body>`` and the paragraph properties of its
+        paragraphs are visited; the rest of the content is not scanned.
         """
-        return self.xpath('.//w:sectPr')
+        body = self.body
+        if body is None:
+            return []
+        return body.sectPr_lst
 
 
 class CT_Body(BaseOxmlElement):
@@ -32,6 +37,15 @@ class CT_Body(BaseOxmlElement):
     tbl = ZeroOrMore('w:tbl', successors=('w:sectPr',))
     sectPr = ZeroOrOne('w:sectPr', successors=())
 
+    @property
+    def sectPr_lst(self):
+        """
+        List of the ``<w:sectPr>`` elements of this body in document order,
+        those in paragraph properties followed by the sentinel ``<w:sectPr>``
+        at the end of the body, if present.
+        """
+        return self.xpath('./w:p/w:pPr/w:sectPr | ./w:sectPr')
+
     def add_section_break(self):
         """Return `w:sectPr` element for new section added at end of document.
 
@@ -7,6 +7,7 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 from copy import deepcopy
 
 from docxx.enum.section import WD_HEADER_FOOTER, WD_ORIENTATION, WD_SECTION_START
+from docxx.oxml.ns import qn
 from docxx.oxml.simpletypes import ST_SignedTwipsMeasure, ST_TwipsMeasure, ST_TextDirection, ST_DocGrid, ST_DecimalNumber, XsdString
 from docxx.oxml.xmlchemy import (
     BaseOxmlElement,
@@ -288,10 +289,31 @@ class CT_SectPr(BaseOxmlElement):
 
     @property
     def preceding_sectPr(self):
-        """sectPr immediately preceding this one or None if this is the first."""
-        # ---[1] predicate returns list of zero or one value---
-        preceding_sectPrs = self.xpath("./preceding::w:sectPr[1]")
-        return preceding_sectPrs[0] if len(preceding_sectPrs) > 0 else None
+        """sectPr immediately preceding this one or None if this is the first.
+
+        Body-level section properties are found by walking back over the siblings of
+        the block containing this sectPr, which only visits the blocks between this
+        section and the prior one. A sectPr placed anywhere else falls back to an
+        XPath scan of the preceding axis.
+        """
+        block = self
+        parent = self.getparent()
+        if parent is not None and parent.tag == qn('w:pPr'):
+            block = parent.getparent()
+        container = block.getparent() if block is not None else None
+        if container is None or container.tag != qn('w:body'):
+            # ---[1] predicate returns list of zero or one value---
+            preceding_sectPrs = self.xpath("./preceding::w:sectPr[1]")
+            return preceding_sectPrs[0] if len(preceding_sectPrs) > 0 else None
+        for sibling in block.itersiblings(qn('w:p'), qn('w:sectPr'), preceding=True):
+            if sibling.tag == qn('w:sectPr'):
+                return sibling
+            pPr = sibling.find(qn('w:pPr'))
+            if pPr is not None:
+                sectPr = pPr.find(qn('w:sectPr'))
+                if sectPr is not None:
+                    return sectPr
+        return None
 
     def remove_footerReference(self, type_):
         """Return rId of w:footerReference child of *type_* after removing it."""
@@ -4,9 +4,32 @@
 Custom element classes related to paragraphs (CT_P).
 """
 
-from docxx.oxml.ns import qn
+from lxml import etree
+
+from docxx.oxml.ns import nsmap, qn
+from docxx.oxml.text.run import text_of_run_content
 from docxx.oxml.xmlchemy import BaseOxmlElement, OxmlElement, ZeroOrMore, ZeroOrOne
 
+
+def _text_xpath():
+    """
+    Compiled XPath selecting the text-bearing run content of a paragraph in
+    document order: runs directly in the paragraph or in a hyperlink, and the
+    base text of ruby runs. Tab stops in ``<w:pPr>`` and ruby annotation text
+    (``<w:rt>``) are not selected.
+    """
+    content = '*[self::w:t or self::w:tab or self::w:br or self::w:cr]'
+    runs = ('./w:r', './w:hyperlink/w:r')
+    paths = []
+    for r in runs:
+        paths.append('%s/%s' % (r, content))
+        paths.append('%s/w:ruby/w:rubyBase/w:r/%s' % (r, content))
+    return etree.XPath(' | '.join(paths), namespaces=nsmap)
+
+
+_text_content = _text_xpath()
+
+
 class CT_P(BaseOxmlElement):
     """
     ``<w:p>`` element, containing the properties and text for a paragraph.
@@ -85,6 +108,15 @@ class CT_P(BaseOxmlElement):
         pPr = self.get_or_add_pPr()
         pPr.style = style
     
+    @property
+    def text(self):
+        """
+        A string representing the textual content of this paragraph, with
+        the text of runs in hyperlinks and of ruby base runs included. Read
+        in a single pass over the text-bearing descendants.
+        """
+        return text_of_run_content(_text_content(self))
+
     @classmethod
     def get_contenttype(cls, child):
         for idx, tg in enumerate(cls.content_tags):
@@ -4,6 +4,10 @@
 Custom element classes related to text runs (CT_R).
 """
 
+import re
+
+from lxml import etree
+
 from docxx.oxml import parse_xml
 from docxx.oxml.ns import nsdecls, qn
 from docxx.oxml.simpletypes import ST_BrClear, ST_BrType, ST_String, ST_OnOff
@@ -13,6 +17,31 @@ from docxx.oxml.xmlchemy import (
 )
 from copy import deepcopy
 
+_T, _TAB, _BR, _CR = qn('w:t'), qn('w:tab'), qn('w:br'), qn('w:cr')
+_XML_SPACE = qn('xml:space')
+_RUN_CONTENT_SEPARATOR = re.compile('([\t\n\r])')
+
+
+def text_of_run_content(elements):
+    """
+    Return the text equivalent of run content *elements* in a single string.
+    ``<w:t>`` contributes its characters, ``<w:tab/>`` a ``\\t`` and each of
+    ``<w:br>`` and ``<w:cr/>`` a ``\\n``. Other elements are skipped.
+    """
+    chunks = []
+    for child in elements:
+        tag = child.tag
+        if tag == _T:
+            t_text = child.text
+            if t_text:
+                chunks.append(t_text)
+        elif tag == _TAB:
+            chunks.append('\t')
+        elif tag == _BR or tag == _CR:
+            chunks.append('\n')
+    return ''.join(chunks)
+
+
 class CT_Br(BaseOxmlElement):
     """
     ``<w:br>`` element, indicating a line, page, or column break in a run.
@@ -133,16 +162,7 @@ class CT_R(BaseOxmlElement):
         child elements like ``<w:tab/>`` translated to their Python
         equivalent.
         """
-        text = ''
-        for child in self:
-            if child.tag == qn('w:t'):
-                t_text = child.text
-                text += t_text if t_text is not None else ''
-            elif child.tag == qn('w:tab'):
-                text += '\t'
-            elif child.tag in (qn('w:br'), qn('w:cr')):
-                text += '\n'
-        return text
+        return text_of_run_content(self)
 
     @text.setter
     def text(self, text):
@@ -151,10 +171,9 @@ class CT_R(BaseOxmlElement):
         
     # clear_contentせず、テキスト関連のみを変更する
     def set_text(self, text):
-        for child in self:
-            tag = child.tag
-            if any([tag == qn(x) for x in ['w:t','w:tab','w:br','w:cr']]):
-                self.remove(child)              
+        for child in self[:]:
+            if child.tag in (_T, _TAB, _BR, _CR):
+                self.remove(child)
         _RunContentAppender.append_to_run_from_text(self, text)
 
     # 要素をディープコピーする
@@ -258,15 +277,16 @@ class CT_Drawing(BaseOxmlElement):
 class _RunContentAppender(object):
     """
     Service object that knows how to translate a Python string into run
-    content elements appended to a specified ``<w:r>`` element. Contiguous
+    content elements appended to a specified ``<w:r>`` element. The text is
+    split once on tab, newline and carriage-return characters. Contiguous
     sequences of regular characters are appended in a single ``<w:t>``
-    element. Each tab character ('\t') causes a ``<w:tab/>`` element to be
+    element, with ``xml:space="preserve"`` set only when the chunk has edge
+    whitespace. Each tab character ('\t') causes a ``<w:tab/>`` element to be
     appended. Likewise a newline or carriage return character ('\n', '\r')
-    causes a ``<w:cr>`` element to be appended.
+    causes a ``<w:br/>`` element to be appended.
     """
     def __init__(self, r):
         self._r = r
-        self._bfr = []
 
     @classmethod
     def append_to_run_from_text(cls, r, text):
@@ -281,31 +301,18 @@ class _RunContentAppender(object):
     def add_text(self, text):
         """
         Append the run content elements corresponding to *text* to the
-        ``<w:r>`` element of this instance.
-        """
-        for char in text:
-            self.add_char(char)
-        self.flush()
-
-    def add_char(self, char):
-        """
-        Process the next character of input through the translation finite
-        state maching (FSM). There are two possible states, buffer pending
-        and not pending, but those are hidden behind the ``.flush()`` method
-        which must be called at the end of text to ensure any pending
-        ``<w:t>`` element is written.
+        ``<w:r>`` element of this instance, in document order.
         """
-        if char == '\t':
-            self.flush()
-            self._r.add_tab()
-        elif char in '\r\n':
-            self.flush()
-            self._r.add_br()
-        else:
-            self._bfr.append(char)
-
-    def flush(self):
-        text = ''.join(self._bfr)
-        if text:
-            self._r.add_t(text)
-        del self._bfr[:]
+        r = self._r
+        for chunk in _RUN_CONTENT_SEPARATOR.split(text):
+            if not chunk:
+                continue
+            if chunk == '\t':
+                etree.SubElement(r, _TAB)
+            elif chunk == '\n' or chunk == '\r':
+                etree.SubElement(r, _BR)
+            else:
+                t = etree.SubElement(r, _T)
+                t.text = chunk
+                if chunk[0].isspace() or chunk[-1].isspace():
+                    t.set(_XML_SPACE, 'preserve')
@@ -30,6 +30,14 @@ class Package(OpcPackage):
         """
         return self.image_parts.get_or_add_image_part(image_descriptor)
 
+    def get_or_add_image_parts(self, image_descriptors, max_workers=None):
+        """Return list of |ImagePart| for each image in *image_descriptors*, in order.
+
+        The images are read and hashed on a thread pool of up to *max_workers* threads
+        before the missing image-parts are added to the collection.
+        """
+        return self.image_parts.get_or_add_image_parts(image_descriptors, max_workers)
+
     @lazyproperty
     def image_parts(self):
         """|ImageParts| collection object for this package."""
@@ -48,13 +56,22 @@ class Package(OpcPackage):
 
 
 class ImageParts(object):
-    """Collection of |ImagePart| objects corresponding to images in the package"""
+    """Collection of |ImagePart| objects corresponding to images in the package.
+
+    Membership, lookup by SHA1 and the next free partname number are each answered
+    from an index maintained as image parts are appended. The SHA1 index is filled on
+    first lookup, so opening a document does not hash every image it contains.
+    """
 
     def __init__(self):
         self._image_parts = []
+        self._image_part_set = set()
+        self._image_parts_by_sha1 = None
+        self._used_partname_numbers = set()
+        self._next_partname_number = 1
 
     def __contains__(self, item):
-        return self._image_parts.__contains__(item)
+        return item in self._image_part_set
 
     def __iter__(self):
         return self._image_parts.__iter__()
@@ -64,6 +81,10 @@ class ImageParts(object):
 
     def append(self, item):
         self._image_parts.append(item)
+        self._image_part_set.add(item)
+        self._used_partname_numbers.add(item.partname.idx)
+        if self._image_parts_by_sha1 is not None:
+            self._image_parts_by_sha1.setdefault(item.sha1, item)
 
     def get_or_add_image_part(self, image_descriptor):
         """Return |ImagePart| object containing image identified by *image_descriptor*.
@@ -77,6 +98,23 @@ class ImageParts(object):
             return matching_image_part
         return self._add_image_part(image)
 
+    def get_or_add_image_parts(self, image_descriptors, max_workers=None):
+        """Return list of |ImagePart| object for each of *image_descriptors*, in order.
+
+        Each image is read, has its header parsed and its SHA1 computed on a thread pool
+        of up to *max_workers* threads; hashing releases the GIL, so this work proceeds
+        in parallel. Matching and adding image-parts then happens in order on the calling
+        thread, so an image repeated within the batch gets a single part. A stream must
+        not appear more than once in *image_descriptors*.
+        """
+        image_parts = []
+        for image in _load_images(image_descriptors, max_workers):
+            image_part = self._get_by_sha1(image.sha1)
+            if image_part is None:
+                image_part = self._add_image_part(image)
+            image_parts.append(image_part)
+        return image_parts
+
     def _add_image_part(self, image):
         """
         Return an |ImagePart| instance newly created from image and appended
@@ -92,10 +130,12 @@ class ImageParts(object):
         Return the image part in this collection having a SHA1 hash matching
         *sha1*, or |None| if not found.
         """
-        for image_part in self._image_parts:
-            if image_part.sha1 == sha1:
-                return image_part
-        return None
+        if self._image_parts_by_sha1 is None:
+            image_parts_by_sha1 = {}
+            for image_part in self._image_parts:
+                image_parts_by_sha1.setdefault(image_part.sha1, image_part)
+            self._image_parts_by_sha1 = image_parts_by_sha1
+        return self._image_parts_by_sha1.get(sha1)
 
     def _next_image_partname(self, ext):
         """
@@ -104,10 +144,28 @@ class ImageParts(object):
         partname is unique by number, without regard to the extension. *ext*
         does not include the leading period.
         """
-        def image_partname(n):
-            return PackURI('/word/media/image%d.%s' % (n, ext))
-        used_numbers = [image_part.partname.idx for image_part in self]
-        for n in range(1, len(self)+1):
-            if n not in used_numbers:
-                return image_partname(n)
-        return image_partname(len(self)+1)
+        used_numbers = self._used_partname_numbers
+        n = self._next_partname_number
+        while n in used_numbers:
+            n += 1
+        self._next_partname_number = n
+        return PackURI('/word/media/image%d.%s' % (n, ext))
+
+
+def _load_image(image_descriptor):
+    """Return |Image| loaded from *image_descriptor* with its SHA1 computed."""
+    image = Image.from_file(image_descriptor)
+    image.sha1
+    return image
+
+
+def _load_images(image_descriptors, max_workers=None):
+    """Return list of |Image| loaded from *image_descriptors*, using a thread pool."""
+    image_descriptors = list(image_descriptors)
+    if len(image_descriptors) < 2:
+        return [_load_image(d) for d in image_descriptors]
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers) as executor:
+        return list(executor.map(_load_image, image_descriptors))
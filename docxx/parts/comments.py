@@ -10,11 +10,12 @@ from __future__ import (
 
 import os
 
-from docxx.opc.constants import CONTENT_TYPE as CT
+from docxx.opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
 from docxx.opc.packuri import PackURI
 from docxx.opc.part import XmlPart
 from docxx.oxml import parse_xml
-from docxx.comments import Comments
+from docxx.comments import CommentIndex, Comments
+from docxx.shared import lazyproperty
 
 
 class CommentsPart(XmlPart):
@@ -34,7 +35,27 @@ class CommentsPart(XmlPart):
 
     @property
     def comments(self):
-        return Comments(self._element)
+        return Comments(self._element, self)
+
+    @lazyproperty
+    def comment_index(self):
+        """
+        |CommentIndex| of the comments in this part and their anchors in the
+        document stories.
+        """
+        return CommentIndex(self._element, self._iter_story_elements)
+
+    def _iter_story_elements(self):
+        """
+        Generate the root element of each story that can anchor a comment:
+        the main document and its headers, footers, footnotes and endnotes.
+        """
+        document_part = self.package.main_document_part
+        yield document_part.element
+        for rel in list(document_part.rels.values()):
+            if rel.is_external or rel.reltype not in _STORY_RELTYPES:
+                continue
+            yield rel.target_part.element
         
     @classmethod
     def _default_xml(cls):
@@ -47,3 +68,6 @@ class CommentsPart(XmlPart):
         with open(path, 'rb') as f:
             xml_bytes = f.read()
         return xml_bytes
+
+
+_STORY_RELTYPES = frozenset((RT.ENDNOTES, RT.FOOTER, RT.FOOTNOTES, RT.HEADER))
@@ -4,6 +4,8 @@
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+from functools import partial
+
 from docxx.document import Document
 from docxx.opc.constants import RELATIONSHIP_TYPE as RT
 from docxx.parts.hdrftr import FooterPart, HeaderPart
@@ -13,6 +15,7 @@ from docxx.comments import Comments
 from docxx.parts.settings import SettingsPart
 from docxx.parts.story import BaseStoryPart
 from docxx.parts.styles import StylesPart
+from docxx.section import SectionIndex
 from docxx.shape import InlineShapes
 from docxx.shared import lazyproperty
 
@@ -135,12 +138,54 @@ class DocumentPart(BaseStoryPart):
             self.relate_to(numbering_part, RT.NUMBERING)
             return numbering_part
 
-    def save(self, path_or_stream):
+    @lazyproperty
+    def section_index(self):
+        """
+        The |SectionIndex| of the body-level ``<w:sectPr>`` elements in this
+        document, shared by every |Sections| and header/footer object obtained
+        from this part.
+        """
+        return SectionIndex(self._element)
+
+    def save(self, path_or_stream, compression=None, max_workers=None):
         """
         Save this document to *path_or_stream*, which can be either a path to
-        a filesystem location (a string) or a file-like object.
+        a filesystem location (a string) or a file-like object. See
+        :meth:`OpcPackage.save` for *compression* and *max_workers*.
+        """
+        self.package.save(path_or_stream, compression, max_workers)
+
+    async def save_async(self, stream, compression=None, max_workers=None,
+                         executor=None):
+        """
+        Save this document as :meth:`save` does, with the blocking work run
+        in *executor*, the event loop's default executor when |None|.
+        *stream* may also be an async sink, an object with a coroutine
+        ``write()`` or ``drain()`` method, which receives the package as it
+        is written.
+        """
+        from docxx.aio import save_to  # asyncio is imported on first use
+
+        save = partial(
+            self.save, compression=compression, max_workers=max_workers
+        )
+        await save_to(save, stream, executor)
+
+    def to_bytes(self, compression=None, max_workers=None):
+        """
+        Return this document serialized as a .docx package, as bytes. Prefer
+        this to saving to a |BytesIO| and calling ``getvalue()``.
+        """
+        return self.package.to_bytes(compression, max_workers)
+
+    def to_transport(self, share_media=False):
+        """
+        Return a picklable |PackageTransport| of this document, to open it
+        in another process with :func:`open_docx` without a zip archive
+        being written and read. See :meth:`OpcPackage.to_transport` for
+        *share_media*.
         """
-        self.package.save(path_or_stream)
+        return self.package.to_transport(share_media)
 
     @property
     def settings(self):
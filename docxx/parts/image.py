@@ -12,7 +12,7 @@ import hashlib
 
 from docxx.image.image import Image
 from docxx.opc.part import Part
-from docxx.shared import Emu, Inches
+from docxx.shared import Emu, Inches, lazyproperty
 
 
 class ImagePart(Part):
@@ -81,9 +81,12 @@ class ImagePart(Part):
         """
         return cls(partname, content_type, blob)
 
-    @property
+    @lazyproperty
     def sha1(self):
         """
-        SHA1 hash digest of the blob of this image part.
+        SHA1 hash digest of the blob of this image part. Computed once, taken
+        from the source image when this part was created from one.
         """
-        return hashlib.sha1(self._blob).hexdigest()
+        if self._image is not None:
+            return self._image.sha1
+        return hashlib.sha1(self.blob).hexdigest()
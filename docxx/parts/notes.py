@@ -12,7 +12,8 @@ from docxx.opc.constants import CONTENT_TYPE as CT
 from docxx.opc.packuri import PackURI
 from docxx.opc.part import XmlPart
 from docxx.oxml import parse_xml
-from docxx.notes import Endnotes, Footnotes
+from docxx.notes import Endnotes, Footnotes, NoteIndex
+from docxx.shared import lazyproperty
 
 class EndnotesPart(XmlPart):
     """
@@ -36,6 +37,13 @@ class EndnotesPart(XmlPart):
         proxies) for this styles part.
         """
         return Endnotes(self._element, self)
+
+    @lazyproperty
+    def note_index(self):
+        """
+        |NoteIndex| of the notes in this part.
+        """
+        return NoteIndex(self._element, 'w:endnote')
         
     @classmethod
     def _default_xml(cls):
@@ -74,6 +82,13 @@ class FootnotesPart(XmlPart):
         proxies) for this styles part.
         """
         return Footnotes(self._element, self)
+
+    @lazyproperty
+    def note_index(self):
+        """
+        |NoteIndex| of the notes in this part.
+        """
+        return NoteIndex(self._element, 'w:footnote')
         
     @classmethod
     def _default_xml(cls):
@@ -4,6 +4,7 @@
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+from docxx.markup import MarkupIndex
 from docxx.opc.constants import RELATIONSHIP_TYPE as RT
 from docxx.opc.part import XmlPart
 from docxx.oxml.shape import CT_Inline
@@ -51,12 +52,48 @@ class BaseStoryPart(XmlPart):
         """Return a newly-created `w:inline` element.
 
         The element contains the image specified by *image_descriptor* and is scaled
-        based on the values of *width* and *height*.
+        based on the values of *width* and *height*. The reference it carries
+        to the image relationship is counted as part of this story, so the
+        caller is expected to insert the element into it.
         """
         rId, image = self.get_or_add_image(image_descriptor)
         cx, cy = image.scaled_dimensions(width, height)
         shape_id, filename = self.next_id, image.filename
-        return CT_Inline.new_pic_inline(shape_id, rId, filename, cx, cy)
+        inline = CT_Inline.new_pic_inline(shape_id, rId, filename, cx, cy)
+        self.add_rel_ref(rId)
+        return inline
+
+    def new_pic_inlines(self, image_descriptors, width=None, height=None,
+                        max_workers=None):
+        """Return a list of newly-created `w:inline` elements, one per image.
+
+        Like :meth:`new_pic_inline` for each item of *image_descriptors*, but
+        the images are loaded on a thread pool of up to *max_workers* threads
+        and the shape ids are allocated with a single scan of the story XML.
+        """
+        image_parts = self._package.get_or_add_image_parts(
+            image_descriptors, max_workers
+        )
+        shape_id = self.next_id
+        inlines = []
+        for image_part in image_parts:
+            rId = self.relate_to(image_part, RT.IMAGE)
+            image = image_part.image
+            cx, cy = image.scaled_dimensions(width, height)
+            inlines.append(
+                CT_Inline.new_pic_inline(shape_id, rId, image.filename, cx, cy)
+            )
+            self.add_rel_ref(rId)
+            shape_id += 1
+        return inlines
+
+    @lazyproperty
+    def markup_index(self):
+        """
+        |MarkupIndex| of the bookmarks and fields in this story, built on
+        first use.
+        """
+        return MarkupIndex(self._element)
 
     @property
     def next_id(self):
@@ -14,28 +14,114 @@ from docxx.oxml.simpletypes import ST_DocGrid
 class Sections(Sequence):
     """Sequence of |Section| objects corresponding to the sections in the document.
 
-    Supports ``len()``, iteration, and indexed access.
+    Supports ``len()``, iteration, and indexed access. The `w:sectPr` elements are
+    looked up in *section_index*, the cached |SectionIndex| of the document part; a
+    transient index is built over *document_elm* when none is provided.
     """
 
-    def __init__(self, document_elm, document_part):
+    def __init__(self, document_elm, document_part, section_index=None):
         super(Sections, self).__init__()
         self._document_elm = document_elm
         self._document_part = document_part
+        if section_index is None:
+            section_index = SectionIndex(document_elm)
+        self._section_index = section_index
 
     def __getitem__(self, key):
         if isinstance(key, slice):
             return [
                 Section(sectPr, self._document_part)
-                for sectPr in self._document_elm.sectPr_lst[key]
+                for sectPr in self._section_index[key]
             ]
-        return Section(self._document_elm.sectPr_lst[key], self._document_part)
+        return Section(self._section_index[key], self._document_part)
 
     def __iter__(self):
-        for sectPr in self._document_elm.sectPr_lst:
+        for sectPr in self._section_index:
             yield Section(sectPr, self._document_part)
 
     def __len__(self):
-        return len(self._document_elm.sectPr_lst)
+        return len(self._section_index)
+
+
+class SectionIndex(object):
+    """Cached, document-order index of the body-level `w:sectPr` elements of a document.
+
+    The index is built in one pass on first use and then answers ``len()``, indexed
+    access and :meth:`preceding` lookups without scanning the document again. It is
+    held by the |DocumentPart| and invalidated by the API methods that add or remove
+    sections. Each lookup checks that the entries it returns are still in the body,
+    so an indexed section removed by editing the XML directly causes a rebuild when
+    it is next reached; sections added that way are only seen after
+    :meth:`invalidate` is called.
+    """
+
+    def __init__(self, document_elm):
+        super(SectionIndex, self).__init__()
+        self._document_elm = document_elm
+        self._sectPrs = None
+        self._positions = None
+
+    def __getitem__(self, key):
+        found = self._sectPr_lst[key]
+        entries = found if isinstance(key, slice) else (found,)
+        if not all(self._is_attached(sectPr) for sectPr in entries):
+            self.invalidate()
+            found = self._sectPr_lst[key]
+        return found
+
+    def __iter__(self):
+        return iter(self[:])
+
+    def __len__(self):
+        # ---the sentinel `w:sectPr` stands for the list: it goes with the body---
+        sectPrs = self._sectPr_lst
+        if sectPrs and not self._is_attached(sectPrs[-1]):
+            self.invalidate()
+            sectPrs = self._sectPr_lst
+        return len(sectPrs)
+
+    def invalidate(self):
+        """Discard the index so it is rebuilt from the XML on next use."""
+        self._sectPrs = None
+        self._positions = None
+
+    def preceding(self, sectPr):
+        """Return the `w:sectPr` of the section before *sectPr*, or None if first.
+
+        A *sectPr* not present in the index, such as one added by editing the XML
+        directly, is resolved from the XML by `CT_SectPr.preceding_sectPr`.
+        """
+        sectPrs = self._sectPr_lst
+        position = self._positions.get(sectPr)
+        if position is None:
+            return sectPr.preceding_sectPr
+        preceding = sectPrs[position - 1] if position > 0 else None
+        if not self._is_attached(sectPr) or (
+            preceding is not None and not self._is_attached(preceding)
+        ):
+            self.invalidate()
+            return self.preceding(sectPr)
+        return preceding
+
+    @property
+    def _sectPr_lst(self):
+        sectPrs = self._sectPrs
+        if sectPrs is None:
+            sectPrs = self._sectPrs = self._document_elm.sectPr_lst
+            self._positions = dict((sectPr, i) for i, sectPr in enumerate(sectPrs))
+        return sectPrs
+
+    def _is_attached(self, sectPr):
+        """True if *sectPr* is still a body-level `w:sectPr` of the document.
+
+        Only the entries a lookup returns are checked, which keeps each lookup O(1).
+        """
+        body = self._document_elm.body
+        parent = sectPr.getparent()
+        if parent is body:
+            return True
+        p = None if parent is None else parent.getparent()
+        return p is not None and p.getparent() is body
 
 
 class Section(object):
@@ -453,6 +539,7 @@ class _Footer(_BaseHeaderFooter):
         """Return newly-added footer part."""
         footer_part, rId = self._document_part.add_footer_part()
         self._sectPr.add_footerReference(self._hdrftr_index, rId)
+        self._document_part.add_rel_ref(rId)
         return footer_part
 
     @property
@@ -464,6 +551,7 @@ class _Footer(_BaseHeaderFooter):
     def _drop_definition(self):
         """Remove footer definition (footer part) associated with this section."""
         rId = self._sectPr.remove_footerReference(self._hdrftr_index)
+        self._document_part.remove_rel_ref(rId)
         self._document_part.drop_rel(rId)
 
     @property
@@ -475,7 +563,7 @@ class _Footer(_BaseHeaderFooter):
     @property
     def _prior_headerfooter(self):
         """|_Footer| proxy on prior sectPr element or None if this is first section."""
-        preceding_sectPr = self._sectPr.preceding_sectPr
+        preceding_sectPr = self._document_part.section_index.preceding(self._sectPr)
         return (
             None if preceding_sectPr is None
             else _Footer(preceding_sectPr, self._document_part, self._hdrftr_index)
@@ -496,6 +584,7 @@ class _Header(_BaseHeaderFooter):
         """Return newly-added header part."""
         header_part, rId = self._document_part.add_header_part()
         self._sectPr.add_headerReference(self._hdrftr_index, rId)
+        self._document_part.add_rel_ref(rId)
         return header_part
 
     @property
@@ -507,6 +596,7 @@ class _Header(_BaseHeaderFooter):
     def _drop_definition(self):
         """Remove header definition associated with this section."""
         rId = self._sectPr.remove_headerReference(self._hdrftr_index)
+        self._document_part.remove_rel_ref(rId)
         self._document_part.drop_header_part(rId)
 
     @property
@@ -518,7 +608,7 @@ class _Header(_BaseHeaderFooter):
     @property
     def _prior_headerfooter(self):
         """|_Header| proxy on prior sectPr element or None if this is first section."""
-        preceding_sectPr = self._sectPr.preceding_sectPr
+        preceding_sectPr = self._document_part.section_index.preceding(self._sectPr)
         return (
             None if preceding_sectPr is None
             else _Header(preceding_sectPr, self._document_part, self._hdrftr_index)
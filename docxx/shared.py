@@ -6,6 +6,8 @@ Objects shared by docx modules.
 
 from __future__ import absolute_import, print_function, unicode_literals
 
+from collections.abc import Sequence
+
 
 class Length(int):
     """
@@ -193,11 +195,12 @@ class ElementProxy(object):
     type of class in python-docx other than custom element (oxml) classes.
     """
 
-    __slots__ = ('_element', '_parent')
+    __slots__ = ('_element', '_parent', '_part')
 
     def __init__(self, element, parent=None):
         self._element = element
         self._parent = parent
+        self._part = None
 
     def __eq__(self, other):
         """
@@ -226,9 +229,73 @@ class ElementProxy(object):
     @property
     def part(self):
         """
-        The package part containing this object
+        The package part containing this object, resolved through the parent
+        chain on first access and cached on this proxy.
         """
-        return self._parent.part
+        part = self._part
+        if part is None:
+            part = self._part = self._parent.part
+        return part
+
+
+class ProxySequence(Sequence):
+    """
+    Lazy, read-only sequence of proxy objects, one for each child of
+    *element* having the namespace-prefixed tag *nsptagname*, e.g. ``'w:p'``.
+    Supports ``len()``, iteration, indexed access and slicing. Each proxy is
+    constructed as ``proxy_cls(child, parent)`` the first time its child
+    element is reached, and the same proxy object is returned for that child
+    on later access through this sequence. The list of child elements is read
+    once, on the first ``len()``, iteration or indexed access, so indexing is
+    O(1) from then on; like the list of proxies it stands for, the sequence
+    does not follow later changes to *element*.
+    """
+
+    __slots__ = (
+        '_element', '_nsptagname', '_tag', '_proxy_cls', '_parent', '_proxies',
+        '_children',
+    )
+
+    def __init__(self, element, nsptagname, proxy_cls, parent):
+        from docxx.oxml.ns import qn
+        super(ProxySequence, self).__init__()
+        self._element = element
+        self._nsptagname = nsptagname
+        self._tag = qn(nsptagname)
+        self._proxy_cls = proxy_cls
+        self._parent = parent
+        self._proxies = {}
+        self._children = None
+
+    def __getitem__(self, idx):
+        children = self._child_list()
+        if isinstance(idx, slice):
+            return [self._proxy(child) for child in children[idx]]
+        try:
+            return self._proxy(children[idx])
+        except IndexError:
+            raise IndexError('%s index out of range' % self._proxy_cls.__name__)
+
+    def __iter__(self):
+        for child in self._child_list():
+            yield self._proxy(child)
+
+    def __len__(self):
+        return len(self._child_list())
+
+    def _child_list(self):
+        children = self._children
+        if children is None:
+            children = self._children = list(
+                self._element.iterchildren(self._tag)
+            )
+        return children
+
+    def _proxy(self, child):
+        proxy = self._proxies.get(child)
+        if proxy is None:
+            proxy = self._proxies[child] = self._proxy_cls(child, self._parent)
+        return proxy
 
 
 class Parented(object):
@@ -238,16 +305,24 @@ class Parented(object):
     such as add or drop a relationship. Provides ``self._parent`` attribute
     to subclasses.
     """
+
+    __slots__ = ('_parent', '_part')
+
     def __init__(self, parent):
         super(Parented, self).__init__()
         self._parent = parent
+        self._part = None
 
     @property
     def part(self):
         """
-        The package part containing this object
+        The package part containing this object, resolved through the parent
+        chain on first access and cached on this proxy.
         """
-        return self._parent.part
+        part = self._part
+        if part is None:
+            part = self._part = self._parent.part
+        return part
         
 
 class AlmostSingle(object):
@@ -192,6 +192,8 @@ class Table(Parented):
 class _Cell(BlockItemContainer):
     """Table cell"""
 
+    __slots__ = ('_tc',)
+
     def __init__(self, tc, parent):
         super(_Cell, self).__init__(tc, parent)
         self._tc = self._element = tc
@@ -235,7 +237,7 @@ class _Cell(BlockItemContainer):
     @property
     def paragraphs(self):
         """
-        List of paragraphs in the cell. A table cell is required to contain
+        Sequence of paragraphs in the cell. A table cell is required to contain
         at least one block-level element and end with a paragraph. By
         default, a new cell contains a single paragraph. Read-only
         """
@@ -244,7 +246,7 @@ class _Cell(BlockItemContainer):
     @property
     def tables(self):
         """
-        List of tables in the cell, in the order they appear. Read-only.
+        Sequence of tables in the cell, in the order they appear. Read-only.
         """
         return super(_Cell, self).tables
 
@@ -389,6 +391,9 @@ class _Row(Parented):
     """
     Table row
     """
+
+    __slots__ = ('_tr', '_element')
+
     def __init__(self, tr, parent):
         super(_Row, self).__init__(parent)
         self._tr = self._element = tr
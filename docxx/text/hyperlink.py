@@ -19,6 +19,9 @@ class Hyperlink(Parented):
     not specified directly on the run and its effective value is taken from
     the style hierarchy.
     """
+
+    __slots__ = ('_h', '_element', 'element')
+
     def __init__(self, h, parent):
         super().__init__(parent)
         self._h = self._element = self.element = h
@@ -11,7 +11,7 @@ from __future__ import (
 from docxx.enum.style import WD_STYLE_TYPE
 from docxx.text.run import Run, same_run
 from docxx.shared import Parented
-from docxx.element import insert_element_next, insert_element_prev, same_element
+from docxx.element import get_element, insert_element_next, insert_element_prev
 from docxx.text.parfmt import ParagraphFormat
 from docxx.text.hyperlink import Hyperlink
 
@@ -20,6 +20,9 @@ class Paragraph(Parented):
     """
     Proxy object wrapping ``<w:p>`` element.
     """
+
+    __slots__ = ('_p', '_element')
+
     def __init__(self, p, parent):
         super(Paragraph, self).__init__(parent)
         self._p = self._element = p
@@ -49,7 +52,8 @@ class Paragraph(Parented):
             headrun(Optional[Run]):
             tailrun(Optional[Run]):
         """
-        comment = self.part.use_comments().add()
+        comments = self.part.use_comments()
+        comment = comments.add()
         if text:
             comment.text = text
         
@@ -57,18 +61,18 @@ class Paragraph(Parented):
         comment_beg.id = comment.id
         comment_end = self._element._add_commentRangeEnd()
         comment_end.id = comment.id
-        for (_ct, run) in self.paragraph_contents:
-            if same_element(run, headrun):
-                insert_element_prev(run, comment_beg)
-            if same_element(run, tailrun):
-                insert_element_next(run, comment_end)
-                break
+        if self._is_child_run(headrun):
+            insert_element_prev(headrun, comment_beg)
+        if self._is_child_run(tailrun):
+            insert_element_next(tailrun, comment_end)
         
         comment_refrun = self._element.add_r()
         comref = comment_refrun._add_commentReference()
         comref.id = comment.id
         insert_element_next(tailrun, comment_refrun)
 
+        for anchor in (comment_beg, comment_end, comref):
+            comments.index.add_anchor(anchor)
         return comment
 
     def add_bookmark(self, id, headrun, tailrun, name):
@@ -78,12 +82,14 @@ class Paragraph(Parented):
         beg.name = name
         end = self._element._add_bookmarkEnd()
         end.id = id
-        for (_ct, run) in self.paragraph_contents:
-            if same_element(run, headrun):
-                insert_element_prev(run, beg)
-            if same_element(run, tailrun):
-                insert_element_next(run, end)
-                break        
+        if self._is_child_run(headrun):
+            insert_element_prev(headrun, beg)
+        if self._is_child_run(tailrun):
+            insert_element_next(tailrun, end)
+        # ---only story parts keep a markup index, comments have none---
+        index = getattr(self.part, 'markup_index', None)
+        if index is not None:
+            index.add_bookmark(beg, end)
         return end
 
     @property
@@ -162,8 +168,9 @@ class Paragraph(Parented):
     @property
     def text(self):
         """
-        String formed by concatenating the text of each run in the paragraph.
-        Tabs and line breaks in the XML are mapped to ``\\t`` and ``\\n``
+        String formed by concatenating the text of each run in the paragraph,
+        including runs inside hyperlinks and the base text of ruby runs. Tabs
+        and line breaks in the XML are mapped to ``\\t`` and ``\\n``
         characters respectively.
 
         Assigning text to this property causes all existing paragraph content
@@ -173,16 +180,20 @@ class Paragraph(Parented):
         Paragraph-level formatting, such as style, is preserved. All
         run-level formatting, such as bold or italic, is removed.
         """
-        text = ''
-        for run in self.runs:
-            text += run.text
-        return text
+        return self._p.text
 
     @text.setter
     def text(self, text):
         self.clear()
         self.add_run(text)
 
+    def _is_child_run(self, run):
+        """
+        True if *run*, a |Run| or ``<w:r>`` element, is a direct child of this
+        paragraph.
+        """
+        return run is not None and get_element(run).getparent() is self._p
+
     def _insert_paragraph_before(self):
         """
         Return a newly created paragraph, inserted directly before this
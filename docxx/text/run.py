@@ -21,6 +21,9 @@ class Run(Parented):
     not specified directly on the run and its effective value is taken from
     the style hierarchy.
     """
+
+    __slots__ = ('_r', '_element', 'element')
+
     def __init__(self, r, parent):
         super(Run, self).__init__(parent)
         self._r = self._element = self.element = r
@@ -66,6 +69,22 @@ class Run(Parented):
         inline = self.part.new_pic_inline(image_path_or_stream, width, height)
         self._r.add_drawing(inline)
         return InlineShape(inline)
+
+    def add_pictures(self, image_paths_or_streams, width=None, height=None,
+                     max_workers=None):
+        """
+        Return a list of |InlineShape| instances, one for each image in
+        *image_paths_or_streams*, added in order to the end of this run.
+        *width* and *height* apply to every picture as they do for
+        :meth:`add_picture`. The image files are read and hashed in parallel
+        on a thread pool of up to *max_workers* threads.
+        """
+        inlines = self.part.new_pic_inlines(
+            image_paths_or_streams, width, height, max_workers
+        )
+        for inline in inlines:
+            self._r.add_drawing(inline)
+        return [InlineShape(inline) for inline in inlines]
     
     @property
     def pictures(self):
@@ -270,6 +289,12 @@ def same_run(lrun, rrun):
 def clone_run(run, **kwargs):
     nelem = deepcopy(run.element)
     r = Run(nelem, run._parent)
+    # 複製が参照するrIdを数えておく。挿入されなくても関係が残るだけで済む
+    rIds = nelem.xpath('.//@r:*')
+    if rIds and run._parent is not None:
+        part = r.part
+        for rId in rIds:
+            part.add_rel_ref(rId)
     for key, arg in kwargs.items():
         setattr(r, key, arg)
     return r
@@ -10,7 +10,9 @@ from docxx.compat import BytesIO
 from docxx.image.bmp import Bmp
 from docxx.image.exceptions import UnrecognizedImageError
 from docxx.image.gif import Gif
-from docxx.image.image import BaseImageHeader, Image, _ImageHeaderFactory
+from docxx.image.image import (
+    BaseImageHeader, Image, ImageCache, _ImageHeaderFactory, image_cache
+)
 from docxx.image.jpeg import Exif, Jfif
 from docxx.image.png import Png
 from docxx.image.tiff import Tiff
@@ -130,8 +132,33 @@ class DescribeImage(object):
             assert image.horz_dpi == horz_dpi
             assert image.vert_dpi == vert_dpi
 
+    def it_reuses_a_cached_image_for_the_same_file(self, cache_enabled):
+        path = test_file('python-icon.png')
+        image = Image.from_file(path)
+        with open(path, 'rb') as f:
+            blob = f.read()
+
+        assert Image.from_file(path) is image
+        assert Image.from_file(BytesIO(blob)) is Image.from_blob(blob)
+        assert len(image_cache) == 2
+
     # fixtures -------------------------------------------------------
 
+    @pytest.fixture(autouse=True)
+    def cache_disabled(self, request):
+        max_bytes = image_cache.max_bytes
+        image_cache.max_bytes = 0
+
+        def restore():
+            image_cache.max_bytes = max_bytes
+        request.addfinalizer(restore)
+
+    @pytest.fixture
+    def cache_enabled(self, request, cache_disabled):
+        image_cache.max_bytes = 1024 * 1024
+        image_cache.clear()
+        request.addfinalizer(image_cache.clear)
+
     @pytest.fixture
     def content_type_fixture(self, image_header_):
         content_type = 'image/foobar'
@@ -270,6 +297,39 @@ class DescribeImage(object):
         return property_mock(request, Image, 'width')
 
 
+class DescribeImageCache(object):
+
+    def it_is_disabled_by_default(self):
+        assert not image_cache.enabled
+
+    def it_evicts_the_least_recently_used_images(self, request):
+        cache = ImageCache(max_bytes=10)
+        images = [
+            instance_mock(request, Image, blob=b'x' * size) for size in (4, 4, 4)
+        ]
+        cache.put('a', images[0])
+        cache.put('b', images[1])
+        assert cache.get('a') is images[0]
+
+        cache.put('c', images[2])
+
+        assert cache.get('b') is None
+        assert cache.get('a') is images[0]
+        assert cache.nbytes == 8
+
+    def it_does_not_cache_an_image_larger_than_the_cap(self, request):
+        cache = ImageCache(max_bytes=2)
+        cache.put('a', instance_mock(request, Image, blob=b'xyz'))
+        assert len(cache) == 0
+
+    def it_evicts_when_its_cap_is_lowered(self, request):
+        cache = ImageCache(max_bytes=10)
+        cache.put('a', instance_mock(request, Image, blob=b'xyzw'))
+        cache.max_bytes = 0
+        assert not cache.enabled
+        assert len(cache) == 0
+
+
 class Describe_ImageHeaderFactory(object):
 
     def it_constructs_the_right_class_for_a_given_image_stream(
@@ -511,6 +511,15 @@ class Describe_MarkerFinder(object):
         marker_code, segment_offset = marker_finder.next(start)
         assert (marker_code, segment_offset) == expected_code_and_offset
 
+    def it_can_find_a_marker_beyond_the_first_block_read(self):
+        bytes_ = b'\x00' * 5000 + b'\xFF' * 5000 + b'\xD9'
+        stream_reader = StreamReader(BytesIO(bytes_), BIG_ENDIAN)
+        marker_finder = _MarkerFinder(stream_reader)
+
+        marker_code, segment_offset = marker_finder.next(0)
+
+        assert (marker_code, segment_offset) == (JPEG_MARKER_CODE.EOI, 10001)
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
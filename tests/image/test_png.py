@@ -309,14 +309,18 @@ class Describe_ChunkParser(object):
             return_value=iter(chunk_offsets)
         )
 
-    @pytest.fixture
-    def iter_offsets_fixture(self):
-        bytes_ = b'-filler-\x00\x00\x00\x00IHDRxxxx\x00\x00\x00\x00IEND'
+    @pytest.fixture(params=[
+        (b'\x00\x00\x00\x00IEND', 'IEND'),
+        (b'\x00\x00\x00\x00IDATxxxx\x00\x00\x00\x00IEND', 'IDAT'),
+    ])
+    def iter_offsets_fixture(self, request):
+        tail, last_chunk_type = request.param
+        bytes_ = b'-filler-\x00\x00\x00\x00IHDRxxxx' + tail
         stream_rdr = StreamReader(BytesIO(bytes_), BIG_ENDIAN)
         chunk_parser = _ChunkParser(stream_rdr)
         expected_chunk_offsets = [
             (PNG_CHUNK_TYPE.IHDR, 16),
-            (PNG_CHUNK_TYPE.IEND, 28),
+            (last_chunk_type, 28),
         ]
         return chunk_parser, expected_chunk_offsets
 
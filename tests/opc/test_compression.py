@@ -0,0 +1,40 @@
+# encoding: utf-8
+
+"""
+Test suite for docxx.opc.compression module
+"""
+
+from __future__ import absolute_import
+
+import zlib
+
+import pytest
+
+from docxx.opc.compression import CompressionPolicy, deflate
+
+
+class DescribeCompressionPolicy(object):
+
+    def it_chooses_a_level_by_content_type(self):
+        policy = CompressionPolicy(6, {'image/png': 0, 'audio/': 1})
+
+        assert policy.level_for('image/png') == 0
+        assert policy.level_for('audio/mpeg') == 1
+        assert policy.level_for('image/x-emf') == 6
+        assert policy.level_for(None) == 6
+
+    def it_stores_precompressed_media_in_its_presets(self):
+        fast, archival = CompressionPolicy.fast(), CompressionPolicy.archival()
+
+        assert fast.level_for('image/jpeg') == archival.level_for('video/mp4') == 0
+        assert fast.level_for('application/xml') == 1
+        assert archival.level_for('application/xml') == 9
+
+    def it_rejects_an_invalid_level(self):
+        with pytest.raises(ValueError):
+            CompressionPolicy(10)
+
+
+def it_deflates_a_blob_as_a_raw_stream():
+    blob = b'foobar' * 100
+    assert zlib.decompress(deflate(blob, 9), -zlib.MAX_WBITS) == blob
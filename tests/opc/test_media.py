@@ -0,0 +1,60 @@
+# encoding: utf-8
+
+"""
+Test suite for docxx.opc.media module
+"""
+
+from __future__ import absolute_import
+
+import hashlib
+
+from io import BytesIO
+
+import pytest
+
+from docxx.opc.constants import RELATIONSHIP_TYPE as RT
+from docxx.opc.media import _source_uri_for, iter_media
+from docxx.opc.packuri import PACKAGE_URI
+
+from ..unitutil.file import absjoin, test_file_dir
+
+
+having_images_path = absjoin(test_file_dir, 'having-images.docx')
+
+
+class Describe_iter_media(object):
+
+    def it_generates_each_media_member_of_a_package(self):
+        members = {m.partname: m for m in iter_media(having_images_path)}
+
+        assert sorted(members) == [
+            '/word/media/image1.png',
+            '/word/media/image2.png',
+            '/word/media/image3.png',
+        ]
+        image3 = members['/word/media/image3.png']
+        assert image3.content_type == 'image/png'
+        assert image3.size == 6111
+        assert image3.rels == [
+            ('/word/document.xml', 'rId9', RT.IMAGE),
+            ('/word/header1.xml', 'rId1', RT.IMAGE),
+        ]
+
+    def it_streams_the_contents_of_a_media_member(self):
+        for member in iter_media(having_images_path):
+            with member.open() as f:
+                blob = f.read()
+            copy = BytesIO()
+            member.copy_to(copy, chunk_size=1024)
+
+            assert len(blob) == member.size
+            assert copy.getvalue() == blob
+            assert member.sha1 == hashlib.sha1(blob).hexdigest()
+
+    @pytest.mark.parametrize('membername, expected_uri', [
+        ('_rels/.rels', PACKAGE_URI),
+        ('word/_rels/document.xml.rels', '/word/document.xml'),
+        ('word/_rels/header1.xml.rels', '/word/header1.xml'),
+    ])
+    def it_knows_the_source_of_a_rels_item(self, membername, expected_uri):
+        assert _source_uri_for(membername) == expected_uri
@@ -4,9 +4,14 @@
 Test suite for opc.oxml module
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
+from lxml import etree
+
 from docxx.opc.constants import RELATIONSHIP_TARGET_MODE as RTM
 from docxx.opc.oxml import (
-    CT_Default, CT_Override, CT_Relationship, CT_Relationships, CT_Types
+    CT_Default, CT_Override, CT_Relationship, CT_Relationships, CT_Types,
+    make_thread_parser
 )
 from docxx.oxml.xmlchemy import serialize_for_reading
 
@@ -15,6 +20,24 @@ from .unitdata.rels import (
 )
 
 
+class DescribeMakeThreadParser(object):
+
+    def it_makes_one_parser_per_thread_sharing_a_lookup(self):
+        lookup = etree.ElementNamespaceClassLookup()
+        lookup.get_namespace('urn:x')['foo'] = CT_Default
+        thread_parser = make_thread_parser(lookup)
+
+        with ThreadPoolExecutor(1) as executor:
+            other_parser = executor.submit(thread_parser).result()
+        parser = thread_parser()
+
+        assert thread_parser() is parser
+        assert other_parser is not parser
+        for p in (parser, other_parser):
+            element = etree.fromstring('<x:foo xmlns:x="urn:x"> </x:foo>', p)
+            assert type(element) is CT_Default
+
+
 class DescribeCT_Default(object):
 
     def it_provides_read_access_to_xml_values(self):
@@ -14,6 +14,7 @@ from docxx.opc.part import Part
 from docxx.opc.parts.coreprops import CorePropertiesPart
 from docxx.opc.pkgreader import PackageReader
 from docxx.opc.rel import _Relationship, Relationships
+from docxx.opc.transport import PackageTransport
 
 from ..unitutil.mock import (
     call,
@@ -38,7 +39,7 @@ class DescribeOpcPackage(object):
         # exercise ---------------------
         pkg = OpcPackage.open(pkg_file)
         # verify -----------------------
-        PackageReader_.from_file.assert_called_once_with(pkg_file)
+        PackageReader_.from_file.assert_called_once_with(pkg_file, False)
         Unmarshaller_.unmarshal.assert_called_once_with(pkg_reader, pkg,
                                                         PartFactory_)
         assert isinstance(pkg, OpcPackage)
@@ -128,9 +129,38 @@ class DescribeOpcPackage(object):
         for part in parts_:
             part.before_marshal.assert_called_once_with()
         PackageWriter_.write.assert_called_once_with(
-            pkg_file_, pkg._rels, parts_
+            pkg_file_, pkg._rels, parts_, None, None
         )
 
+    def it_can_serialize_itself_to_bytes(self, request):
+        def save(pkg, pkg_file, compression, max_workers):
+            pkg_file.write(b'PK\x03\x04')
+        save_ = method_mock(request, OpcPackage, 'save', side_effect=save)
+        pkg = OpcPackage()
+
+        blob = pkg.to_bytes(max_workers=2)
+
+        assert save_.call_args[0][2:] == (None, 2)
+        assert blob == b'PK\x03\x04'
+
+    def it_can_produce_a_transport_of_itself(self, request):
+        save_ = method_mock(request, OpcPackage, 'save')
+        pkg = OpcPackage()
+
+        transport = pkg.to_transport()
+
+        save_.assert_called_once_with(pkg, transport)
+        assert isinstance(transport, PackageTransport)
+
+    def it_can_be_loaded_from_a_transport(self, request):
+        open_ = method_mock(request, OpcPackage, 'open')
+        transport = PackageTransport()
+
+        package = OpcPackage.from_transport(transport)
+
+        open_.assert_called_once_with(transport)
+        assert package is open_.return_value
+
     def it_provides_access_to_the_core_properties(self, core_props_fixture):
         opc_package, core_properties_ = core_props_fixture
         core_properties = opc_package.core_properties
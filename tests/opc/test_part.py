@@ -4,13 +4,20 @@
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+import hashlib
 import pytest
 
+from concurrent.futures import ThreadPoolExecutor
+
+from docxx.opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
 from docxx.opc.package import OpcPackage
 from docxx.opc.packuri import PackURI
-from docxx.opc.part import Part, PartFactory, XmlPart
+from docxx.opc.part import (
+    Part, PartFactory, XmlPart, XmlPartCache, xml_part_cache
+)
 from docxx.opc.rel import _Relationship, Relationships
 from docxx.oxml.xmlchemy import BaseOxmlElement
+from docxx.text.run import Run
 
 from ..unitutil.cxml import element
 from ..unitutil.mock import (
@@ -22,6 +29,7 @@ from ..unitutil.mock import (
     instance_mock,
     loose_mock,
     Mock,
+    var_mock,
 )
 
 
@@ -62,6 +70,15 @@ class DescribePart(object):
         part, load_blob = blob_fixture
         assert part.blob is load_blob
 
+    def it_copies_a_blob_that_views_the_package_buffer(self):
+        buffer = bytearray(b'0123456789')
+
+        part = Part(None, None, memoryview(buffer)[2:5])
+        buffer[2] = ord('X')
+
+        assert part.blob == b'234'
+        assert isinstance(part.blob, bytes)
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture
@@ -158,6 +175,19 @@ class DescribePartRelationshipManagementInterface(object):
         else:
             assert rId in part.rels
 
+    def it_keeps_its_rel_ref_counts_current(self, part):
+        part._element = element('w:p/r:a{r:id=rId42}')
+        part._rels = {'rId42': None}
+        assert part._rel_ref_count('rId42') == 1
+        part.add_rel_ref('rId42')
+        part.drop_rel('rId42')
+        assert 'rId42' in part.rels
+        part.remove_rel_ref('rId42')
+        part.remove_rel_ref('rId42')
+        assert part._rel_ref_count('rId42') == 0
+        part.drop_rel('rId42')
+        assert 'rId42' not in part.rels
+
     def it_can_find_a_related_part_by_reltype(self, related_part_fixture):
         part, reltype_, related_part_ = related_part_fixture
         related_part = part.part_related_by(reltype_)
@@ -431,6 +461,76 @@ class DescribePartFactory(object):
         return instance_mock(request, str)
 
 
+class DescribeXmlPartCache(object):
+
+    def it_caches_only_the_content_types_it_is_given(self):
+        cache = XmlPartCache(1024, (CT.WML_STYLES,))
+
+        assert cache.caches(CT.WML_STYLES)
+        assert not cache.caches(CT.WML_DOCUMENT_MAIN)
+        cache.content_types.add(CT.WML_DOCUMENT_MAIN)
+        assert cache.caches(CT.WML_DOCUMENT_MAIN)
+        cache.max_bytes = 0
+        assert not cache.caches(CT.WML_STYLES)
+
+    def it_is_disabled_by_default(self):
+        assert not xml_part_cache.enabled
+        assert CT.WML_STYLES in xml_part_cache.content_types
+
+    def it_hands_out_a_new_copy_of_a_cached_tree(self):
+        cache = XmlPartCache(1024)
+        blob = b'<w:styles xmlns:w="urn:w"><w:style/></w:styles>'
+
+        styles = cache.element_for(blob)
+        styles.remove(styles[0])
+        copy = cache.element_for(blob)
+
+        assert len(copy) == 1
+        assert copy is not styles
+        assert len(cache) == 1
+        assert cache.nbytes == len(blob)
+
+    def it_evicts_the_least_recently_used_parts(self):
+        blobs = [b'<a n="%d"/>' % n for n in range(3)]
+        cache = XmlPartCache(len(blobs[0]) * 2)
+
+        cache.element_for(blobs[0])
+        cache.element_for(blobs[1])
+        cache.element_for(blobs[0])
+        cache.element_for(blobs[2])
+
+        assert len(cache) == 2
+        assert list(cache._elements) == [
+            hashlib.sha1(blobs[0]).hexdigest(),
+            hashlib.sha1(blobs[2]).hexdigest(),
+        ]
+        cache.max_bytes = len(blobs[0])
+        assert len(cache) == 1
+        cache.clear()
+        assert (len(cache), cache.nbytes) == (0, 0)
+
+    def it_does_not_cache_a_part_larger_than_its_bound(self):
+        cache = XmlPartCache(4)
+
+        element = cache.element_for(b'<abc/>')
+
+        assert element.tag == 'abc'
+        assert len(cache) == 0
+
+    def it_can_be_used_from_several_threads(self):
+        cache = XmlPartCache(1024)
+        blob = b'<w:styles xmlns:w="urn:w"><w:style/></w:styles>'
+
+        def load(_):
+            styles = cache.element_for(blob)
+            styles.append(styles.makeelement('{urn:w}style', {}))
+            return len(styles)
+
+        with ThreadPoolExecutor(4) as executor:
+            assert set(executor.map(load, range(64))) == {2}
+        assert len(cache) == 1
+
+
 class DescribeXmlPart(object):
 
     def it_can_be_constructed_by_PartFactory(
@@ -444,6 +544,20 @@ class DescribeXmlPart(object):
         )
         assert isinstance(part, XmlPart)
 
+    def it_loads_a_cached_content_type_from_the_part_cache(
+            self, request, package_):
+        blob = b'<w:styles xmlns:w="urn:w"><w:style/></w:styles>'
+        cache = XmlPartCache(1024, (CT.WML_STYLES,))
+        var_mock(request, 'docxx.opc.part.xml_part_cache', new=cache)
+
+        part = XmlPart.load(None, CT.WML_STYLES, blob, package_)
+        other = XmlPart.load(None, CT.WML_STYLES, blob, package_)
+        numbering = XmlPart.load(None, CT.WML_NUMBERING, blob, package_)
+
+        assert len(cache) == 1
+        assert part.element is not other.element
+        assert part.blob == other.blob == numbering.blob
+
     def it_can_serialize_to_xml(self, blob_fixture):
         xml_part, element_, serialize_part_xml_ = blob_fixture
         blob = xml_part.blob
@@ -454,6 +568,38 @@ class DescribeXmlPart(object):
         xml_part = part_fixture
         assert xml_part.part is xml_part
 
+    def it_keeps_a_rel_referenced_from_a_cloned_picture_run(self, request):
+        xml_part = XmlPart(
+            None, None, element('w:p/w:r/a:blip{r:embed=rId1}'), None
+        )
+        xml_part._rels = rels = Relationships(None)
+        rels.add_relationship(RT.IMAGE, instance_mock(request, Part), 'rId1')
+        assert xml_part._rel_ref_count('rId1') == 1
+        p = xml_part.element
+        picture_run = Run(p[0], xml_part)
+
+        p.append(picture_run.clone()._r)
+
+        xml_part.drop_rel('rId1')
+        assert 'rId1' in rels
+        p.remove(picture_run._r)
+        assert xml_part.drop_unreferenced_rels() == []
+        p.remove(p[0])
+        assert xml_part.drop_unreferenced_rels() == ['rId1']
+
+    def it_can_drop_its_unreferenced_rels(self, request):
+        xml_part = XmlPart(None, None, element('w:p/r:a{r:embed=rId1}'), None)
+        xml_part._rels = rels = Relationships(None)
+        target_ = instance_mock(request, Part)
+        rels.add_relationship(RT.IMAGE, target_, 'rId1')
+        rels.add_relationship(RT.IMAGE, target_, 'rId2')
+        rels.add_relationship(RT.STYLES, target_, 'rId3')
+
+        dropped = xml_part.drop_unreferenced_rels()
+
+        assert dropped == ['rId2']
+        assert sorted(rels) == ['rId1', 'rId3']
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
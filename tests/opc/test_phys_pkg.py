@@ -12,18 +12,26 @@ except ImportError:
     from StringIO import StringIO as BytesIO
 
 import hashlib
+import mmap
 import pytest
 
-from zipfile import ZIP_DEFLATED, ZipFile
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile
 
-from docxx.opc.exceptions import PackageNotFoundError
+from docxx.opc.compression import CompressionPolicy
+from docxx.opc.constants import CONTENT_TYPE as CT
+from docxx.opc.exceptions import PackageChangedError, PackageNotFoundError
 from docxx.opc.packuri import PACKAGE_URI, PackURI
 from docxx.opc.phys_pkg import (
-    _DirPkgReader, PhysPkgReader, PhysPkgWriter, _ZipPkgReader, _ZipPkgWriter
+    _BufferPkgReader, _DirPkgReader, LazyBlob, map_file, PhysPkgReader,
+    _ParallelZipPkgWriter, PhysPkgWriter, _TransportPkgReader,
+    _TransportPkgWriter, _ZipPkgReader, _ZipPkgWriter
 )
+from docxx.opc.transport import PackageTransport
 
 from ..unitutil.file import absjoin, test_file_dir
-from ..unitutil.mock import class_mock, loose_mock, Mock
+from ..unitutil.mock import (
+    class_mock, loose_mock, method_mock, Mock, var_mock
+)
 
 
 test_docx_path = absjoin(test_file_dir, 'test.docx')
@@ -136,11 +144,177 @@ class DescribeZipPkgReader(object):
         return loose_mock(request)
 
 
+class DescribeBufferPkgReader(object):
+
+    def it_is_used_by_PhysPkgReader_when_pkg_is_a_buffer(self, zip_bytes):
+        for buffer in (
+            zip_bytes, bytearray(zip_bytes), memoryview(zip_bytes),
+            map_file(zip_pkg_path),
+        ):
+            phys_reader = PhysPkgReader(buffer)
+            assert isinstance(phys_reader, _BufferPkgReader)
+            phys_reader.close()
+
+    def it_can_retrieve_the_blob_for_a_pack_uri(self, zip_bytes):
+        phys_reader = _BufferPkgReader(memoryview(zip_bytes))
+        blob = phys_reader.blob_for(PackURI('/word/document.xml'))
+        sha1 = hashlib.sha1(blob).hexdigest()
+        assert sha1 == 'b9b4a98bcac7c5a162825b60c3db7df11e02ac5f'
+        assert phys_reader.rels_xml_for(PackURI('/ppt/viewProps.xml')) is None
+        phys_reader.close()
+
+    def it_exposes_a_stored_member_without_copying(self):
+        stream = BytesIO()
+        zipf = ZipFile(stream, 'w', compression=ZIP_STORED)
+        zipf.writestr('foo.bin', b'0123456789')
+        zipf.close()
+        buffer = bytearray(stream.getvalue())
+        phys_reader = _BufferPkgReader(buffer)
+
+        blob = phys_reader.blob_for(PackURI('/foo.bin'))
+
+        assert isinstance(blob, memoryview)
+        assert blob == b'0123456789'
+        blob_offset = buffer.index(b'0123456789')
+        buffer[blob_offset] = ord('X')
+        assert blob.tobytes() == b'X123456789'
+
+    def it_can_open_a_memory_mapped_file(self):
+        mapped = map_file(zip_pkg_path)
+        assert isinstance(mapped, mmap.mmap)
+        phys_reader = PhysPkgReader(mapped)
+        sha1 = hashlib.sha1(phys_reader.content_types_xml).hexdigest()
+        assert sha1 == 'cd687f67fd6b5f526eedac77cf1deb21968d7245'
+        phys_reader.close()
+
+    # fixtures ---------------------------------------------
+
+    @pytest.fixture(scope='class')
+    def zip_bytes(self):
+        with open(zip_pkg_path, 'rb') as f:
+            return f.read()
+
+
+class DescribeLazyBlob(object):
+
+    def it_reads_the_blob_from_the_package_on_demand(self, tmp_docx_path):
+        with open(zip_pkg_path, 'rb') as f:
+            zip_bytes = f.read()
+        with open(tmp_docx_path, 'wb') as f:
+            f.write(zip_bytes)
+        pack_uri = PackURI('/word/document.xml')
+
+        for pkg_file in (tmp_docx_path, zip_bytes, BytesIO(zip_bytes)):
+            blob = LazyBlob(pkg_file, pack_uri).read()
+            sha1 = hashlib.sha1(blob).hexdigest()
+            assert sha1 == 'b9b4a98bcac7c5a162825b60c3db7df11e02ac5f'
+
+    def it_knows_the_file_it_is_read_from(self, tmp_docx_path):
+        with open(tmp_docx_path, 'wb') as f:
+            f.write(b'PK')
+        lazy_blob = LazyBlob(tmp_docx_path, PackURI('/foo.png'))
+
+        assert lazy_blob.is_read_from(tmp_docx_path)
+        assert not lazy_blob.is_read_from(zip_pkg_path)
+        assert not LazyBlob(b'PK', PackURI('/foo.png')).is_read_from(
+            tmp_docx_path
+        )
+
+    def it_knows_the_file_it_is_read_from_through_a_memory_map(
+            self, tmp_docx_path):
+        with open(tmp_docx_path, 'wb') as f:
+            f.write(b'PK')
+        mapped = map_file(tmp_docx_path)
+        with open(zip_pkg_path, 'rb') as f:
+            unknown = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        assert LazyBlob(mapped, PackURI('/foo.png')).is_read_from(
+            tmp_docx_path
+        )
+        assert not LazyBlob(mapped, PackURI('/foo.png')).is_read_from(
+            zip_pkg_path
+        )
+        assert LazyBlob(unknown, PackURI('/foo.png')).is_read_from(
+            tmp_docx_path
+        )
+
+    def it_reads_a_stored_member_of_a_buffer_as_bytes(self):
+        stream = BytesIO()
+        zipf = ZipFile(stream, 'w', compression=ZIP_STORED)
+        zipf.writestr('foo.bin', b'0123456789')
+        zipf.close()
+
+        blob = LazyBlob(stream.getvalue(), PackURI('/foo.bin')).read()
+
+        assert blob == b'0123456789'
+        assert isinstance(blob, bytes)
+
+    def it_refuses_to_read_from_a_changed_file(self, tmp_docx_path):
+        with open(zip_pkg_path, 'rb') as f:
+            zip_bytes = f.read()
+        with open(tmp_docx_path, 'wb') as f:
+            f.write(zip_bytes)
+        lazy_blob = LazyBlob(tmp_docx_path, PackURI('/word/document.xml'))
+
+        with open(tmp_docx_path, 'ab') as f:
+            f.write(b'changed')
+
+        with pytest.raises(PackageChangedError):
+            lazy_blob.read()
+
+
+class DescribeTransportPkgReader(object):
+
+    def it_is_used_by_PhysPkgReader_when_pkg_is_a_transport(self):
+        phys_reader = PhysPkgReader(PackageTransport())
+        assert isinstance(phys_reader, _TransportPkgReader)
+
+    def it_can_retrieve_the_blobs_of_the_package(self):
+        transport = PackageTransport()
+        transport.add('[Content_Types].xml', b'<Types/>')
+        transport.add('word/document.xml', b'<w:document/>')
+        transport.add('word/_rels/document.xml.rels', b'<Relationships/>')
+        phys_reader = PhysPkgReader(transport)
+
+        assert phys_reader.content_types_xml == b'<Types/>'
+        assert phys_reader.blob_for(PackURI('/word/document.xml')) == (
+            b'<w:document/>'
+        )
+        assert phys_reader.rels_xml_for(PackURI('/word/document.xml')) == (
+            b'<Relationships/>'
+        )
+        assert phys_reader.rels_xml_for(PackURI('/word/styles.xml')) is None
+        phys_reader.close()
+
+
+class DescribeTransportPkgWriter(object):
+
+    def it_is_used_by_PhysPkgWriter_when_pkg_is_a_transport(self):
+        phys_writer = PhysPkgWriter(PackageTransport())
+        assert isinstance(phys_writer, _TransportPkgWriter)
+
+    def it_adds_each_member_uncompressed(self, request):
+        transport = PackageTransport()
+        seal_ = method_mock(request, PackageTransport, 'seal')
+        phys_writer = PhysPkgWriter(transport, CompressionPolicy.archival())
+
+        phys_writer.write(PackURI('/word/document.xml'), b'<w:document/>',
+                          CT.WML_DOCUMENT_MAIN)
+        phys_writer.write(PackURI('/word/media/image1.png'), b'PNG', CT.PNG)
+        phys_writer.close()
+
+        assert transport.blob_for('word/document.xml') == b'<w:document/>'
+        assert transport.blob_for('word/media/image1.png') == b'PNG'
+        seal_.assert_called_once_with(transport)
+
+
 class DescribeZipPkgWriter(object):
 
-    def it_is_used_by_PhysPkgWriter_unconditionally(self, tmp_docx_path):
-        phys_writer = PhysPkgWriter(tmp_docx_path)
-        assert isinstance(phys_writer, _ZipPkgWriter)
+    def it_is_used_by_PhysPkgWriter_to_compress_serially(self, tmp_docx_path):
+        for max_workers in (None, 1):
+            phys_writer = PhysPkgWriter(tmp_docx_path, max_workers=max_workers)
+            assert isinstance(phys_writer, _ZipPkgWriter)
+            phys_writer.close()
 
     def it_opens_pkg_file_zip_on_construction(self, ZipFile_):
         pkg_file = Mock(name='pkg_file')
@@ -174,6 +348,105 @@ class DescribeZipPkgWriter(object):
         retrieved_blob_sha1 = hashlib.sha1(retrieved_blob).hexdigest()
         assert retrieved_blob_sha1 == written_blob_sha1
 
+    def it_compresses_each_member_as_its_policy_directs(self, pkg_file):
+        policy = CompressionPolicy.fast()
+        xml = b'<foo/>' * 1000
+        pkg_writer = PhysPkgWriter(pkg_file, policy)
+        pkg_writer.write(PackURI('/a.xml'), xml, 'application/xml')
+        pkg_writer.write(PackURI('/b.png'), b'PNG', 'image/png')
+        pkg_writer.close()
+
+        zipf = ZipFile(pkg_file, 'r')
+        a, b = zipf.infolist()
+        assert (a.compress_type, b.compress_type) == (ZIP_DEFLATED, ZIP_STORED)
+        assert zipf.read('a.xml') == xml
+        assert zipf.read('b.png') == b'PNG'
+        zipf.close()
+
+    def it_can_compress_members_in_parallel(self, pkg_file):
+        policy = CompressionPolicy(9, {'image/': 0})
+        members = [
+            ('m%d.xml' % i, ('<m%d/>' % i).encode('utf-8') * (i * 100 + 1))
+            for i in range(20)
+        ] + [('pic.jpeg', b'JFIF' * 50)]
+        pkg_writer = PhysPkgWriter(pkg_file, policy, max_workers=4)
+        for membername, blob in members:
+            content_type = 'image/jpeg' if membername == 'pic.jpeg' else None
+            pkg_writer.write(PackURI('/' + membername), blob, content_type)
+        pkg_writer.close()
+
+        zipf = ZipFile(pkg_file, 'r')
+        assert zipf.testzip() is None
+        assert zipf.namelist() == [membername for membername, _ in members]
+        for membername, blob in members:
+            assert zipf.read(membername) == blob
+        assert zipf.getinfo('pic.jpeg').compress_type == ZIP_STORED
+        assert zipf.getinfo('m19.xml').compress_type == ZIP_DEFLATED
+        zipf.close()
+
+    def it_is_used_by_PhysPkgWriter_to_compress_in_parallel(self, pkg_file):
+        phys_writer = PhysPkgWriter(pkg_file, max_workers=2)
+        assert isinstance(phys_writer, _ParallelZipPkgWriter)
+        phys_writer.close()
+
+    def it_keeps_a_bounded_number_of_members_in_flight(self, pkg_file):
+        pkg_writer = PhysPkgWriter(pkg_file, max_workers=2)
+        in_flight = []
+        for i in range(50):
+            pkg_writer.write(PackURI('/m%d.xml' % i), b'<m/>' * 1000)
+            in_flight.append(len(pkg_writer._pending))
+        pkg_writer.close()
+
+        assert max(in_flight) == 4
+        zipf = ZipFile(pkg_file, 'r')
+        assert zipf.testzip() is None
+        assert len(zipf.namelist()) == 50
+        zipf.close()
+
+    def it_can_compress_in_parallel_to_a_non_seekable_stream(self):
+        stream = _WriteOnlyStream()
+        members = [('a.xml', b'<a/>' * 500), (u'\u00e9t\u00e9.xml', b'<b/>')]
+        pkg_writer = PhysPkgWriter(stream, max_workers=3)
+        for membername, blob in members:
+            pkg_writer.write(PackURI('/' + membername), blob)
+        pkg_writer.close()
+
+        zipf = ZipFile(BytesIO(b''.join(stream.chunks)), 'r')
+        assert zipf.testzip() is None
+        assert zipf.namelist() == [membername for membername, _ in members]
+        for membername, blob in members:
+            assert zipf.read(membername) == blob
+        zipf.close()
+
+    def it_writes_zip64_records_where_values_overflow(self, request, pkg_file):
+        var_mock(request, 'docxx.opc.phys_pkg._ZIP64_LIMIT', new=64)
+        members = [('m%d.xml' % i, b'<m/>' * (i * 10)) for i in range(8)]
+        pkg_writer = PhysPkgWriter(
+            pkg_file, CompressionPolicy(0), max_workers=2
+        )
+        for membername, blob in members:
+            pkg_writer.write(PackURI('/' + membername), blob)
+        pkg_writer.close()
+
+        blob = pkg_file.getvalue()
+        assert b'PK\x06\x06' in blob
+        zipf = ZipFile(pkg_file, 'r')
+        assert zipf.testzip() is None
+        for membername, blob in members:
+            assert zipf.read(membername) == blob
+        assert zipf.getinfo('m7.xml').file_size == 280
+        zipf.close()
+
+    def it_can_write_to_a_non_seekable_stream(self):
+        stream = _WriteOnlyStream()
+        pkg_writer = PhysPkgWriter(stream)
+        pkg_writer.write(PackURI('/part/name.xml'), b'<foo/>' * 100)
+        pkg_writer.close()
+
+        zipf = ZipFile(BytesIO(b''.join(stream.chunks)), 'r')
+        assert zipf.read('part/name.xml') == b'<foo/>' * 100
+        zipf.close()
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture
@@ -183,6 +456,21 @@ class DescribeZipPkgWriter(object):
         return pkg_file
 
 
+class _WriteOnlyStream(object):
+    """
+    Non-seekable stream whose ``write()`` returns |None|, like a socket file
+    or HTTP response body.
+    """
+    def __init__(self):
+        self.chunks = []
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+
+    def flush(self):
+        pass
+
+
 # fixtures -------------------------------------------------
 
 @pytest.fixture
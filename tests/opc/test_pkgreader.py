@@ -52,7 +52,9 @@ class DescribePackageReader(object):
             phys_reader, pkg_srels, content_types
         )
         phys_reader.close.assert_called_once_with()
-        _init_.assert_called_once_with(ANY, content_types, pkg_srels, sparts)
+        _init_.assert_called_once_with(
+            ANY, content_types, pkg_srels, sparts, False
+        )
         assert isinstance(pkg_reader, PackageReader)
 
     def it_can_iterate_over_the_serialized_parts(self, iter_sparts_fixture):
@@ -60,6 +62,18 @@ class DescribePackageReader(object):
         iter_spart_items = list(pkg_reader.iter_sparts())
         assert iter_spart_items == expected_iter_spart_items
 
+    def it_can_release_each_blob_once_it_is_consumed(self):
+        sparts = [
+            _SerializedPart('/pn1', 'ct1', 'rt1', b'blob1', []),
+            _SerializedPart('/pn2', 'ct2', 'rt2', b'blob2', []),
+        ]
+        pkg_reader = PackageReader(None, [], sparts, release_blobs=True)
+
+        blobs = [blob for _, _, _, blob in pkg_reader.iter_sparts()]
+
+        assert blobs == [b'blob1', b'blob2']
+        assert [spart.blob for spart in sparts] == [None, None]
+
     def it_can_iterate_over_all_the_srels(self):
         # mockery ----------------------
         pkg_srels = ['srel1', 'srel2']
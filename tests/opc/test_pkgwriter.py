@@ -34,7 +34,7 @@ class DescribePackageWriter(object):
             call._write_pkg_rels(phys_writer, pkg_rels),
             call._write_parts(phys_writer, parts),
         ]
-        PhysPkgWriter_.assert_called_once_with(pkg_file)
+        PhysPkgWriter_.assert_called_once_with(pkg_file, None, None)
         assert _write_methods.mock_calls == expected_calls
         phys_writer.close.assert_called_once_with()
 
@@ -55,8 +55,9 @@ class DescribePackageWriter(object):
         # exercise ---------------------
         PackageWriter._write_pkg_rels(phys_writer, pkg_rels)
         # verify -----------------------
-        phys_writer.write.assert_called_once_with('/_rels/.rels',
-                                                  pkg_rels.xml)
+        phys_writer.write.assert_called_once_with(
+            '/_rels/.rels', pkg_rels.xml, CT.OPC_RELATIONSHIPS
+        )
 
     def it_can_write_a_list_of_parts(self):
         # mockery ----------------------
@@ -69,9 +70,12 @@ class DescribePackageWriter(object):
         PackageWriter._write_parts(phys_writer, [part1, part2])
         # verify -----------------------
         expected_calls = [
-            call(part1.partname, part1.blob),
-            call(part1.partname.rels_uri, part1._rels.xml),
-            call(part2.partname, part2.blob),
+            call(part1.partname, part1.blob, part1.content_type),
+            call(
+                part1.partname.rels_uri, part1._rels.xml,
+                CT.OPC_RELATIONSHIPS
+            ),
+            call(part2.partname, part2.blob, part2.content_type),
         ]
         assert phys_writer.write.mock_calls == expected_calls
 
@@ -138,6 +138,27 @@ class DescribeRelationships(object):
         next_rId = rels._next_rId
         assert next_rId == expected_next_rId
 
+    def it_reuses_the_rId_of_a_dropped_relationship(self, reltype, url):
+        rels = Relationships(None)
+        for n in range(1, 5):
+            rels.add_relationship(reltype, url + str(n), 'rId%d' % n, True)
+        del rels['rId2']
+        assert rels._next_rId == 'rId2'
+        rels.add_relationship(reltype, url, 'rId2', True)
+        assert rels._next_rId == 'rId5'
+
+    def it_keeps_its_lookups_current_as_rels_are_dropped(
+            self, reltype, url, _target_part):
+        rels = Relationships(None)
+        rels.add_relationship(reltype, _target_part, 'rId1')
+        rId = rels.get_or_add_ext_rel('http://rt-hyperlink', url)
+        del rels['rId1']
+        assert 'rId1' not in rels.related_parts
+        with pytest.raises(KeyError):
+            rels.part_with_reltype(reltype)
+        assert rels.pop(rId).target_ref == url
+        assert rels.get_or_add_ext_rel('http://rt-hyperlink', url) == 'rId1'
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture
@@ -0,0 +1,78 @@
+# encoding: utf-8
+
+"""
+Test suite for docxx.opc.transport module
+"""
+
+from __future__ import absolute_import
+
+import pickle
+
+import pytest
+
+from docxx.opc.transport import PackageTransport
+
+
+class DescribePackageTransport(object):
+
+    def it_holds_the_blob_of_each_member(self):
+        transport = PackageTransport()
+        transport.add('word/document.xml', memoryview(b'<w:document/>'))
+        transport.add('word/media/image1.png', b'PNG', is_media=True)
+
+        assert transport.blob_for('word/document.xml') == b'<w:document/>'
+        assert transport.blob_for('word/media/image1.png') == b'PNG'
+        assert transport.nbytes == 16
+        with pytest.raises(KeyError):
+            transport.blob_for('word/styles.xml')
+
+    def it_can_be_pickled(self):
+        transport = PackageTransport()
+        transport.add('word/document.xml', b'<w:document/>')
+        transport.seal()
+
+        received = pickle.loads(pickle.dumps(transport))
+
+        assert received.blob_for('word/document.xml') == b'<w:document/>'
+
+    def it_can_place_media_in_shared_memory(self, shared_transport):
+        transport = shared_transport
+
+        pickled = pickle.dumps(transport)
+        received = pickle.loads(pickled)
+
+        assert b'<w:document/>' in pickled
+        assert b'0123456789' not in pickled
+        assert transport.nbytes == received.nbytes == 26
+        assert received.blob_for('word/media/image1.png') == b'0123456789'
+        assert received.blob_for('word/media/image2.png') == b'PNG'
+        received.close()
+
+    def it_removes_its_shared_memory_when_released(self, shared_transport):
+        received = pickle.loads(pickle.dumps(shared_transport))
+
+        shared_transport.release()
+
+        with pytest.raises(FileNotFoundError):
+            received.blob_for('word/media/image1.png')
+
+    def it_does_not_release_shared_memory_it_did_not_create(
+            self, shared_transport):
+        received = pickle.loads(pickle.dumps(shared_transport))
+        received.blob_for('word/media/image1.png')
+
+        received.release()
+
+        assert shared_transport.blob_for('word/media/image2.png') == b'PNG'
+
+    # fixtures ---------------------------------------------
+
+    @pytest.fixture
+    def shared_transport(self, request):
+        transport = PackageTransport(share_media=True)
+        transport.add('word/document.xml', b'<w:document/>')
+        transport.add('word/media/image1.png', b'0123456789', is_media=True)
+        transport.add('word/media/image2.png', b'PNG', is_media=True)
+        transport.seal()
+        request.addfinalizer(transport.release)
+        return transport
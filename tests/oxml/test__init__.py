@@ -8,10 +8,13 @@ from __future__ import print_function, unicode_literals
 
 import pytest
 
+from concurrent.futures import ThreadPoolExecutor
+
 from lxml import etree
 
 from docxx.oxml import (
-    OxmlElement, oxml_parser, parse_xml, register_element_cls
+    OxmlElement, oxml_parser, parse_xml, register_element_cls,
+    thread_oxml_parser
 )
 from docxx.oxml.ns import qn
 from docxx.oxml.shared import BaseOxmlElement
@@ -50,6 +53,18 @@ class DescribeOxmlParser(object):
         xml_text = etree.tostring(element, encoding='unicode')
         assert xml_text == stripped_xml_text
 
+    def it_gives_each_thread_its_own_parser(self):
+        with ThreadPoolExecutor(1) as executor:
+            other_parser = executor.submit(thread_oxml_parser).result()
+            element = executor.submit(parse_xml, '<w:p %s/>' % (
+                'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/'
+                '2006/main"'
+            )).result()
+
+        assert thread_oxml_parser() is oxml_parser
+        assert other_parser is not oxml_parser
+        assert type(element).__name__ == 'CT_P'
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
@@ -83,7 +83,25 @@ class DescribeDocumentPart(object):
     def it_can_save_the_package_to_a_file(self, save_fixture):
         document, file_ = save_fixture
         document.save(file_)
-        document._package.save.assert_called_once_with(file_)
+        document._package.save.assert_called_once_with(file_, None, None)
+
+    def it_can_serialize_the_package_to_bytes(self, save_fixture):
+        document, _ = save_fixture
+        document._package.to_bytes.return_value = b'PK'
+
+        blob = document.to_bytes()
+
+        document._package.to_bytes.assert_called_once_with(None, None)
+        assert blob == b'PK'
+
+    def it_can_produce_a_transport_of_the_package(self, save_fixture):
+        document, _ = save_fixture
+        transport_ = document._package.to_transport.return_value
+
+        transport = document.to_transport()
+
+        document._package.to_transport.assert_called_once_with(False)
+        assert transport is transport_
 
     def it_provides_access_to_the_document_settings(self, settings_fixture):
         document_part, settings_ = settings_fixture
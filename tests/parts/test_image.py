@@ -55,6 +55,11 @@ class DescribeImagePart(object):
         image_part = ImagePart(None, None, blob)
         assert image_part.sha1 == '4921e7002ddfba690a937d54bda226a7b8bdeb68'
 
+    def it_takes_the_sha1_from_the_image_it_was_created_from(self, request):
+        image_ = instance_mock(request, Image, sha1='f005ba11')
+        image_part = ImagePart(None, None, b'fO0Bar', image_)
+        assert image_part.sha1 == 'f005ba11'
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
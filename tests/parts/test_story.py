@@ -76,6 +76,25 @@ class DescribeBaseStoryPart(object):
         image_.scaled_dimensions.assert_called_once_with(100, 200)
         assert inline.xml == expected_xml
 
+    def it_can_create_new_pic_inlines_in_bulk(
+        self, package_, image_part_, image_, relate_to_, next_id_prop_
+    ):
+        package_.get_or_add_image_parts.return_value = [image_part_, image_part_]
+        image_part_.image = image_
+        relate_to_.return_value = "rId42"
+        image_.scaled_dimensions.return_value = 444, 888
+        image_.filename = "bar.png"
+        next_id_prop_.return_value = 24
+        story_part = BaseStoryPart(None, None, None, package_)
+
+        inlines = story_part.new_pic_inlines(["foo/bar.png", "bar.png"], 100, 200)
+
+        package_.get_or_add_image_parts.assert_called_once_with(
+            ["foo/bar.png", "bar.png"], None
+        )
+        assert inlines[0].xml == snippet_text("inline")
+        assert [inline.docPr.id for inline in inlines] == [24, 25]
+
     def it_knows_the_next_available_xml_id(self, next_id_fixture):
         story_element, expected_value = next_id_fixture
         story_part = BaseStoryPart(None, None, story_element, None)
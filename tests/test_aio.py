@@ -0,0 +1,159 @@
+# encoding: utf-8
+
+"""
+Test suite for the docxx.aio module and the async open and save API
+"""
+
+from __future__ import absolute_import
+
+import asyncio
+import threading
+import time
+
+from io import BytesIO
+
+import pytest
+
+from docxx import aio
+from docxx.api import open_docx, open_docx_async
+from docxx.opc.phys_pkg import LazyBlob
+from docxx.parts.document import DocumentPart
+
+from .unitutil.file import test_file
+from .unitutil.mock import method_mock
+
+
+class AsyncSource(object):
+
+    def __init__(self, data):
+        self._stream = BytesIO(data)
+
+    async def read(self, size):
+        await asyncio.sleep(0)
+        return self._stream.read(size)
+
+
+class AsyncSink(object):
+
+    def __init__(self):
+        self.chunks = []
+
+    async def write(self, data):
+        await asyncio.sleep(0)
+        self.chunks.append(data)
+
+
+class DescribeAsyncApi(object):
+
+    def it_opens_a_document_from_a_path(self):
+        document = asyncio.run(open_docx_async(test_file('test.docx')))
+        expected = open_docx(test_file('test.docx'))
+        assert len(document.document.paragraphs) == len(
+            expected.document.paragraphs
+        )
+
+    def it_forwards_the_open_options_for_a_path(self):
+        document = asyncio.run(open_docx_async(
+            test_file('having-images.docx'), mmap=True, lazy_blobs=True
+        ))
+
+        image_parts = [
+            part for part in document.package.parts
+            if part.content_type.startswith('image/')
+        ]
+        assert image_parts
+        assert all(isinstance(part._blob, LazyBlob) for part in image_parts)
+
+    def it_reads_the_binary_parts_of_an_async_source_up_front(self):
+        with open(test_file('having-images.docx'), 'rb') as f:
+            source = AsyncSource(f.read())
+
+        document = asyncio.run(open_docx_async(source, lazy_blobs=True))
+
+        image_blobs = [
+            part.blob for part in document.package.parts
+            if part.content_type.startswith('image/')
+        ]
+        assert image_blobs
+        assert all(isinstance(blob, bytes) for blob in image_blobs)
+
+    def it_saves_a_document_through_its_part(self, request):
+        async def save_async(*args):
+            pass
+
+        save_async_ = method_mock(
+            request, DocumentPart, 'save_async', side_effect=save_async
+        )
+        part = open_docx(test_file('test.docx'))
+        stream, executor = BytesIO(), object()
+
+        asyncio.run(part.document.save_async(stream, 'fast', 2, executor))
+
+        save_async_.assert_called_once_with(part, stream, 'fast', 2, executor)
+
+    def it_round_trips_through_an_async_source_and_sink(self):
+        async def round_trip():
+            with open(test_file('having-images.docx'), 'rb') as f:
+                source = AsyncSource(f.read())
+            document = await open_docx_async(source)
+            document.document.add_paragraph('async')
+            sink = AsyncSink()
+            await document.document.save_async(sink)
+            return sink
+
+        sink = asyncio.run(round_trip())
+
+        assert len(sink.chunks) > 1
+        saved = open_docx(BytesIO(b''.join(sink.chunks)))
+        assert saved.document.paragraphs[-1].text == 'async'
+
+    def it_opens_from_an_async_iterable_of_chunks(self):
+        with open(test_file('test.docx'), 'rb') as f:
+            data = f.read()
+
+        async def chunks():
+            for i in range(0, len(data), 1000):
+                yield data[i:i + 1000]
+
+        document = asyncio.run(open_docx_async(chunks()))
+
+        assert document.document.paragraphs is not None
+
+    def it_saves_to_a_regular_stream(self):
+        async def save():
+            document = await open_docx_async(test_file('test.docx'))
+            stream = BytesIO()
+            await document.save_async(stream)
+            return stream
+
+        stream = asyncio.run(save())
+
+        assert open_docx(stream).document is not None
+
+    def it_limits_the_blocking_calls_running_at_once(self, limit_2):
+        running = []
+        peak = []
+        lock = threading.Lock()
+
+        def work():
+            with lock:
+                running.append(1)
+                peak.append(len(running))
+            time.sleep(0.02)
+            with lock:
+                running.pop()
+
+        async def main():
+            await asyncio.gather(*(aio.run_blocking(work) for _ in range(8)))
+
+        asyncio.run(main())
+
+        assert max(peak) == 2
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture
+    def limit_2(self, request):
+        limit = aio.concurrency_limit()
+        aio.set_concurrency_limit(2)
+        request.addfinalizer(lambda: aio.set_concurrency_limit(limit))
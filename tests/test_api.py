@@ -8,13 +8,23 @@ from __future__ import (
     absolute_import, division, print_function, unicode_literals
 )
 
+import pickle
 import pytest
+import subprocess
+import sys
+
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
 
 import docxx
 
 from docxx.api import Document, open_docx, compose_docx
 from docxx.opc.constants import CONTENT_TYPE as CT
+from docxx.enum.style import WD_STYLE_TYPE
+from docxx.opc.part import xml_part_cache
+from docxx.opc.phys_pkg import LazyBlob
 
+from .unitutil.file import test_file
 from .unitutil.mock import function_mock, instance_mock, class_mock
 
 # Document -> open_docxへの対応は今後
@@ -76,3 +86,169 @@ class DescribeDocument(object):
     @pytest.fixture
     def Package_(self, request):
         return class_mock(request, 'docxx.api.Package')
+
+
+class DescribeOpenDocx(object):
+
+    def it_opens_a_package_held_in_a_buffer(self):
+        with open(test_file('having-images.docx'), 'rb') as f:
+            blob = f.read()
+        expected = len(open_docx(test_file('having-images.docx')).document.paragraphs)
+        for buffer in (blob, bytearray(blob), memoryview(blob)):
+            document = open_docx(buffer).document
+            assert len(document.paragraphs) == expected
+
+    def it_can_memory_map_a_package_file(self):
+        document = open_docx(test_file('having-images.docx'), mmap=True)
+        saved = open_docx(document.to_bytes())
+        assert len(saved.document.inline_shapes) == len(
+            document.document.inline_shapes
+        )
+
+
+    def it_can_save_over_the_memory_mapped_file(self, stored_docx_path):
+        output = _run_isolated(
+            "d = open_docx(%r, mmap=True)\n"
+            "d.document.add_paragraph('saved over')\n"
+            "d.save(%r)\n"
+            "d = open_docx(%r)\n"
+            "print(d.document.paragraphs[-1].text)"
+            % ((stored_docx_path,) * 3)
+        )
+        assert output == 'saved over'
+
+    def it_can_save_over_the_memory_mapped_file_read_on_demand(
+            self, stored_docx_path):
+        output = _run_isolated(
+            "d = open_docx(%r, mmap=True, lazy_blobs=True)\n"
+            "d.save(%r)\n"
+            "d = open_docx(%r)\n"
+            "print(len(d.document.inline_shapes))"
+            % ((stored_docx_path,) * 3)
+        )
+        document = open_docx(test_file('having-images.docx')).document
+        assert output == str(len(document.inline_shapes))
+
+    def it_can_compose_from_a_document_held_in_a_buffer(
+            self, stored_docx_path):
+        with open(stored_docx_path, 'rb') as f:
+            base = open_docx(f.read())
+
+        composed = compose_docx(base=base)
+
+        assert len(composed.document.paragraphs) == 0
+        assert sorted(
+            bytes(part.blob) for part in composed.package.parts
+            if part.content_type == CT.JPEG
+        ) == sorted(
+            bytes(part.blob) for part in base.package.parts
+            if part.content_type == CT.JPEG
+        )
+
+    def it_can_read_binary_parts_on_demand(self, tmpdir):
+        path = str(tmpdir.join('lazy.docx'))
+        with open(test_file('having-images.docx'), 'rb') as f:
+            blob = f.read()
+        with open(path, 'wb') as f:
+            f.write(blob)
+        document = open_docx(path, lazy_blobs=True)
+        image_parts = [
+            part for part in document.package.parts
+            if part.content_type.startswith('image/')
+        ]
+        assert image_parts
+        assert all(isinstance(part._blob, LazyBlob) for part in image_parts)
+
+        document.document.add_paragraph('lazy')
+        document.save(path)
+
+        saved = open_docx(path)
+        assert saved.document.paragraphs[-1].text == 'lazy'
+        assert sorted(
+            part.blob for part in saved.package.parts
+            if part.content_type.startswith('image/')
+        ) == sorted(bytes(part.blob) for part in image_parts)
+
+    def it_opens_a_transport_handed_over_by_another_process(self):
+        document = open_docx(test_file('having-images.docx'))
+        document.document.add_paragraph('handed over')
+
+        with document.to_transport(share_media=True) as transport:
+            received = open_docx(pickle.loads(pickle.dumps(transport)))
+
+        assert received.document.paragraphs[-1].text == 'handed over'
+        assert sorted(
+            (part.partname, bytes(part.blob))
+            for part in received.package.parts
+        ) == sorted(
+            (part.partname, bytes(part.blob))
+            for part in document.package.parts
+        )
+
+    def it_can_share_parsed_template_parts_between_documents(self, request):
+        max_bytes = xml_part_cache.max_bytes
+        xml_part_cache.max_bytes = 1024 * 1024
+        xml_part_cache.clear()
+
+        def restore():
+            xml_part_cache.max_bytes = max_bytes
+            xml_part_cache.clear()
+        request.addfinalizer(restore)
+        path = test_file('having-images.docx')
+
+        document = open_docx(path).document
+        document.styles.add_style('Cached', WD_STYLE_TYPE.PARAGRAPH)
+        other = open_docx(path).document
+
+        assert len(xml_part_cache) == 2
+        assert 'Cached' in document.styles
+        assert 'Cached' not in other.styles
+
+
+    # fixtures ---------------------------------------------
+
+    @pytest.fixture
+    def stored_docx_path(self, tmpdir):
+        """
+        Path of a copy of a document with images, saved with its JPEG images
+        stored rather than deflated.
+        """
+        path = str(tmpdir.join('stored.docx'))
+        document = open_docx(test_file('having-images.docx'))
+        document.save(path, docxx.CompressionPolicy.fast())
+        return path
+
+
+def _run_isolated(code):
+    """
+    Return the output of *code* run with `open_docx` in a fresh interpreter,
+    so a crash fails the test rather than the test run.
+    """
+    process = subprocess.run(
+        [sys.executable, '-c', 'from docxx import open_docx\n' + code],
+        stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+    )
+    output = process.stdout.decode('utf-8').strip()
+    assert process.returncode == 0, output
+    return output
+
+
+class DescribeConcurrentUse(object):
+
+    def it_opens_edits_and_saves_documents_on_many_threads(self):
+        def round_trip(n):
+            document = open_docx(test_file('having-images.docx')).document
+            texts = ['job %d paragraph %d' % (n, i) for i in range(50)]
+            for text in texts:
+                document.add_paragraph(text).add_run(' run')
+            stream = BytesIO()
+            document.save(stream)
+            stream.seek(0)
+            reopened = open_docx(stream).document
+            return texts, [p.text for p in reopened.paragraphs][-50:]
+
+        with ThreadPoolExecutor(8) as executor:
+            results = list(executor.map(round_trip, range(32)))
+
+        for texts, saved_texts in results:
+            assert saved_texts == [text + ' run' for text in texts]
@@ -0,0 +1,133 @@
+# encoding: utf-8
+
+"""
+Test suite for the docxx.batch module
+"""
+
+from __future__ import (
+    absolute_import, division, print_function, unicode_literals
+)
+
+import os
+import shutil
+
+import pytest
+
+from docxx.api import open_docx
+from docxx.batch import run_batch
+
+from .unitutil.file import test_file
+
+
+def append_paragraph(document):
+    document.document.add_paragraph('appended')
+    return len(document.document.paragraphs)
+
+
+def count_template_styles(document, template):
+    return len(template.styles)
+
+
+def crash_on_title(document):
+    if document.core_properties.title == 'crash':
+        os._exit(1)
+    return document.core_properties.title
+
+
+class DescribeRunBatch(object):
+
+    def it_runs_a_job_on_each_document_and_saves_it(self, docx_dir, tmpdir):
+        output_dir = str(tmpdir.join('out'))
+        progress = []
+
+        results = list(run_batch(
+            append_paragraph, docx_dir, output_dir, max_workers=2,
+            chunksize=2, progress=lambda done, total: progress.append(
+                (done, total)
+            )
+        ))
+
+        assert sorted(os.path.basename(r.path) for r in results) == [
+            'doc%d.docx' % i for i in range(5)
+        ]
+        assert all(r.ok for r in results)
+        for result in results:
+            saved = open_docx(result.output_path).document
+            assert saved.paragraphs[-1].text == 'appended'
+            assert result.value == len(saved.paragraphs)
+        assert progress == [(n, 5) for n in range(1, 6)]
+
+    def it_reports_a_failing_document_without_stopping(self, docx_dir):
+        bad_path = os.path.join(docx_dir, 'bad.docx')
+        with open(bad_path, 'wb') as f:
+            f.write(b'not a zip')
+        paths = (
+            os.path.join(docx_dir, name) for name in sorted(os.listdir(docx_dir))
+        )
+
+        results = list(run_batch(append_paragraph, paths, max_workers=2))
+
+        failed = [r for r in results if not r.ok]
+        assert len(results) == 6
+        assert [r.path for r in failed] == [bad_path]
+        assert 'Error' in failed[0].error
+        assert all(r.output_path is None for r in results)
+
+    def it_reports_a_document_its_worker_dies_on(self, docx_dir):
+        crash_path = os.path.join(docx_dir, 'crash.docx')
+        document = open_docx(test_file('test.docx'))
+        document.core_properties.title = 'crash'
+        document.save(crash_path)
+
+        results = list(run_batch(
+            crash_on_title, docx_dir, max_workers=2, chunksize=2
+        ))
+
+        failed = [r for r in results if not r.ok]
+        assert len(results) == 6
+        assert [r.path for r in failed] == [crash_path]
+        assert 'worker process died' in failed[0].error
+
+    def it_saves_documents_with_clashing_filenames_apart(self, tmpdir):
+        paths = []
+        for dirname in ('a', 'b', 'c'):
+            path = str(tmpdir.mkdir(dirname).join('x.docx'))
+            document = open_docx(test_file('test.docx'))
+            document.core_properties.title = dirname
+            document.save(path)
+            paths.append(path)
+        paths.append(str(tmpdir.join('X-2.docx')))
+        shutil.copy(paths[0], paths[-1])
+        output_dir = str(tmpdir.join('out'))
+
+        results = list(run_batch(
+            crash_on_title, paths, output_dir, max_workers=1
+        ))
+
+        output_names = {
+            r.path: os.path.basename(r.output_path) for r in results
+        }
+        assert [output_names[path] for path in paths] == [
+            'x.docx', 'x-2.docx', 'x-3.docx', 'X-2-2.docx'
+        ]
+        for result in results:
+            saved = open_docx(result.output_path)
+            assert saved.core_properties.title == result.value
+
+    def it_passes_the_worker_template_to_the_job(self, docx_dir):
+        results = list(run_batch(
+            count_template_styles, docx_dir, template=test_file('test.docx'),
+            max_workers=1
+        ))
+
+        expected = len(open_docx(test_file('test.docx')).styles)
+        assert [r.value for r in results] == [expected] * 5
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture
+    def docx_dir(self, tmpdir):
+        docx_dir = tmpdir.mkdir('in')
+        for i in range(5):
+            shutil.copy(test_file('test.docx'), str(docx_dir.join('doc%d.docx' % i)))
+        return str(docx_dir)
@@ -50,6 +50,61 @@ class DescribeBlockItemContainer(object):
             count += 1
         assert count == expected_count
 
+    def it_supports_slicing_and_negative_indexes_on_paragraphs(self):
+        blkcntnr = BlockItemContainer(
+            element('w:body/(w:p/w:r/w:t"a",w:tbl,w:p/w:r/w:t"b",w:p/w:r/w:t"c")'),
+            None,
+        )
+        paragraphs = blkcntnr.paragraphs
+        assert [p.text for p in paragraphs[1:]] == ['b', 'c']
+        assert paragraphs[-1].text == 'c'
+        with pytest.raises(IndexError):
+            paragraphs[3]
+        with pytest.raises(IndexError):
+            paragraphs[-4]
+
+    def it_reads_the_paragraph_list_once_for_indexed_access(self):
+        body = element('w:body/(w:p/w:r/w:t"a",w:p/w:r/w:t"b",w:p/w:r/w:t"c")')
+        paragraphs = BlockItemContainer(body, None).paragraphs
+
+        first = [paragraphs[i] for i in range(len(paragraphs))]
+        body.remove(body[0])
+
+        assert len(paragraphs) == 3
+        assert [paragraphs[i] for i in range(3)] == first
+        assert [p.text for p in paragraphs] == ['a', 'b', 'c']
+
+    def it_iterates_the_paragraphs_present_when_iteration_starts(self):
+        blkcntnr = BlockItemContainer(
+            element('w:body/(w:p/w:r/w:t"a",w:p/w:r/w:t"b")'), None
+        )
+        texts = []
+
+        for paragraph in blkcntnr.paragraphs:
+            texts.append(paragraph.text)
+            blkcntnr._element.add_p()
+            if len(texts) > 4:  # a live view would never run out
+                break
+
+        assert texts == ['a', 'b']
+        assert len(blkcntnr.paragraphs) == 4
+
+    def it_can_iterate_its_block_items_in_document_order(self):
+        blkcntnr = BlockItemContainer(
+            element(
+                'w:body/(w:p/w:r/w:t"a",w:tbl/w:tr/(w:tc/w:p/w:r/w:t"b",w:tc/(w:p/w:r'
+                '/w:t"c",w:tbl/w:tr/w:tc/w:p/w:r/w:t"d")),w:p/w:r/w:t"e")'
+            ),
+            None,
+        )
+        block_items = list(blkcntnr.iter_block_items())
+        assert [type(b).__name__ for b in block_items] == [
+            'Paragraph', 'Table', 'Paragraph', 'Paragraph', 'Table',
+            'Paragraph', 'Paragraph',
+        ]
+        texts = [b.text for b in block_items if isinstance(b, Paragraph)]
+        assert texts == ['a', 'b', 'c', 'd', 'e']
+
     def it_provides_access_to_the_tables_it_contains(self, tables_fixture):
         # test len(), iterable, and indexed access
         blkcntnr, expected_count = tables_fixture
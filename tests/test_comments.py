@@ -0,0 +1,68 @@
+# encoding: utf-8
+
+"""Unit test suite for the docxx.comments module"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from docxx.api import open_docx
+from docxx.comments import CommentIndex
+
+from .unitutil.cxml import element
+
+
+class DescribeCommentIndex(object):
+
+    def it_allocates_ids_past_the_largest_in_use(self):
+        comments = element('w:comments/(w:comment{w:id=4},w:comment{w:id=1})')
+        index = CommentIndex(comments)
+
+        assert index.next_id() == 5
+        assert index.get(1) is comments[1]
+        assert index.get(2) is None
+
+    def it_indexes_a_newly_added_comment(self):
+        comments = element('w:comments')
+        index = CommentIndex(comments)
+        assert index.next_id() == 0
+
+        comment = comments._add_comment()
+        comment.id = 0
+        index.add(comment)
+
+        assert index.get(0) is comment
+        assert index.next_id() == 1
+
+    def it_finds_the_anchors_of_a_comment(self):
+        body = element(
+            'w:body/w:p/(w:commentRangeStart{w:id=3},w:r,'
+            'w:commentRangeEnd{w:id=3},w:r/w:commentReference{w:id=3})'
+        )
+        index = CommentIndex(element('w:comments'), lambda: [body])
+        p = body[0]
+
+        start, end, reference = index.anchors(3)
+
+        assert start is p[0]
+        assert end is p[2]
+        assert reference is p[3][0]
+        assert index.anchors(9) == (None, None, None)
+
+    def it_indexes_the_comments_added_to_a_document(self):
+        document_part = open_docx()
+        paragraph = document_part.document.add_paragraph('foo')
+        run = paragraph.runs[0]
+
+        first = paragraph.add_comment('first', run, run)
+        comments = document_part.comments
+        second = comments.add()
+        index = comments.part.comment_index
+
+        assert (first.id, second.id) == (0, 1)
+        assert index.get(0) is first._element
+        assert index.get(1) is second._element
+        assert comments.get(0).text == 'first'
+        start, end, reference = comments.anchors(0)
+        assert start.getnext() is run._r
+        assert reference.getparent().getprevious() is run._r
+        assert end.getparent() is paragraph._p
+        assert comments.anchors(1) == (None, None, None)
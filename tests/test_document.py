@@ -6,6 +6,7 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 
 import pytest
 
+from docxx.api import open_docx
 from docxx.document import _Body, Document
 from docxx.enum.section import WD_SECTION
 from docxx.enum.text import WD_BREAK
@@ -21,7 +22,9 @@ from docxx.text.paragraph import Paragraph
 from docxx.text.run import Run
 
 from .unitutil.cxml import element, xml
-from .unitutil.mock import class_mock, instance_mock, method_mock, property_mock
+from .unitutil.mock import (
+    class_mock, instance_mock, method_mock, Mock, property_mock
+)
 
 
 class DescribeDocument(object):
@@ -67,6 +70,21 @@ class DescribeDocument(object):
         run_.add_picture.assert_called_once_with(path, width, height)
         assert picture is picture_
 
+    def it_can_add_several_pictures(self, add_paragraph_, document_part_):
+        document = Document(None, document_part_)
+        inlines = [element('wp:inline{id=42}'), element('wp:inline{id=43}')]
+        document_part_.new_pic_inlines.return_value = inlines
+        runs = [Run(element('w:r'), None), Run(element('w:r'), None)]
+        add_paragraph_.return_value.add_run.side_effect = runs
+
+        pictures = document.add_pictures(['foo.png', 'bar.png'], 100, 200)
+
+        document_part_.new_pic_inlines.assert_called_once_with(
+            ['foo.png', 'bar.png'], 100, 200, None
+        )
+        assert [run._r[0][0] for run in runs] == inlines
+        assert [picture._element for picture in pictures] == inlines
+
     def it_can_add_a_section(
         self, add_section_fixture, Section_, section_, document_part_
     ):
@@ -91,7 +109,25 @@ class DescribeDocument(object):
     def it_can_save_the_document_to_a_file(self, save_fixture):
         document, file_ = save_fixture
         document.save(file_)
-        document._part.save.assert_called_once_with(file_)
+        document._part.save.assert_called_once_with(file_, None, None)
+
+    def it_can_serialize_itself_to_bytes(self, save_fixture):
+        document, _ = save_fixture
+        document._part.to_bytes.return_value = b'PK'
+
+        blob = document.to_bytes()
+
+        document._part.to_bytes.assert_called_once_with(None, None)
+        assert blob == b'PK'
+
+    def it_can_produce_a_transport_of_itself(self, save_fixture):
+        document, _ = save_fixture
+        transport_ = document._part.to_transport.return_value
+
+        transport = document.to_transport(share_media=True)
+
+        document._part.to_transport.assert_called_once_with(True)
+        assert transport is transport_
 
     def it_provides_access_to_its_core_properties(self, core_props_fixture):
         document, core_properties_ = core_props_fixture
@@ -107,6 +143,16 @@ class DescribeDocument(object):
         paragraphs = document.paragraphs
         assert paragraphs is paragraphs_
 
+    def it_can_iterate_the_text_of_its_paragraphs(self):
+        document = Document(
+            element(
+                'w:document/w:body/(w:p/w:r/w:t"foo",w:tbl,w:p,'
+                'w:p/w:hyperlink/w:r/w:t"bar",w:sectPr)'
+            ),
+            None,
+        )
+        assert list(document.iter_paragraph_texts()) == ['foo', '', 'bar']
+
     def it_provides_access_to_its_sections(self, document_part_, Sections_, sections_):
         document_elm = element('w:document')
         Sections_.return_value = sections_
@@ -114,7 +160,9 @@ class DescribeDocument(object):
 
         sections = document.sections
 
-        Sections_.assert_called_once_with(document_elm, document_part_)
+        Sections_.assert_called_once_with(
+            document_elm, document_part_, document_part_.section_index
+        )
         assert sections is sections_
 
     def it_provides_access_to_its_settings(self, settings_fixture):
@@ -360,6 +408,27 @@ class Describe_Body(object):
         _body = body.clear_content()
         assert body._body.xml == expected_xml
         assert _body is body
+        body.part.section_index.invalidate.assert_called_once_with()
+
+    def it_drops_the_cleared_sections_from_the_document(self):
+        document = open_docx().document
+        document.add_section()
+        document.add_section()
+        assert len(document.sections) == 3
+
+        document._body.clear_content()
+
+        assert len(document.sections) == 1
+        assert document.sections[0]._sectPr is document.element.body.sectPr
+
+    def it_indexes_the_section_of_an_inserted_paragraph(self):
+        document = open_docx().document
+        paragraph = Paragraph(element('w:p/w:pPr/w:sectPr'), document._body)
+        assert len(document.sections) == 1
+
+        document.insert_paragraph(paragraph)
+
+        assert len(document.sections) == 2
 
     # fixtures -------------------------------------------------------
 
@@ -371,6 +440,6 @@ class Describe_Body(object):
     ])
     def clear_fixture(self, request):
         before_cxml, after_cxml = request.param
-        body = _Body(element(before_cxml), None)
+        body = _Body(element(before_cxml), Mock(name='document'))
         expected_xml = xml(after_cxml)
         return body, expected_xml
@@ -0,0 +1,78 @@
+# encoding: utf-8
+
+"""
+Guards against regressions in the cost of ``import docxx``
+"""
+
+from __future__ import absolute_import
+
+import json
+import subprocess
+import sys
+
+# modules that `import docxx` must leave for first use
+DEFERRED_MODULES = (
+    'asyncio',
+    'concurrent.futures',
+    'docxx.oxml.registry',
+    'docxx.oxml.styles',
+    'docxx.oxml.text.font',
+    'docxx.oxml.text.parfmt',
+)
+
+
+def _imported_after(code):
+    """
+    Return the subset of DEFERRED_MODULES imported after running *code* in
+    a fresh interpreter.
+    """
+    script = '\n'.join((
+        code,
+        'import json, sys',
+        'print(json.dumps([m for m in %r if m in sys.modules]))'
+        % (DEFERRED_MODULES,),
+    ))
+    output = subprocess.check_output([sys.executable, '-c', script])
+    return json.loads(output.decode('utf-8').splitlines()[-1])
+
+
+def _import_time_us():
+    """
+    Return the cumulative time in microseconds ``import docxx`` takes in a
+    fresh interpreter, as reported by ``-X importtime``.
+    """
+    output = subprocess.check_output(
+        [sys.executable, '-X', 'importtime', '-c', 'import docxx'],
+        stderr=subprocess.STDOUT,
+    )
+    for line in output.decode('utf-8').splitlines():
+        fields = [field.strip() for field in line.split('|')]
+        if len(fields) == 3 and fields[2] == 'docxx':
+            return int(fields[1])
+    raise AssertionError('no import time reported for docxx')
+
+
+class DescribeImportDocxx(object):
+
+    def it_defers_heavy_imports_to_first_use(self):
+        assert _imported_after('import docxx') == []
+
+    def it_imports_within_its_time_budget(self):
+        # generous, to catch gross regressions rather than noise; about
+        # 150 ms on a typical machine
+        assert min(_import_time_us() for _ in range(3)) < 1500000
+
+    def it_registers_the_element_classes_on_first_parse(self):
+        imported = _imported_after(
+            'import docxx\n'
+            'document = docxx.open_docx()\n'
+            'assert type(document.element.body).__name__ == "CT_Body"'
+        )
+        assert 'docxx.oxml.registry' in imported
+        assert 'docxx.oxml.styles' in imported
+        assert 'asyncio' not in imported
+
+    def it_still_provides_the_element_classes_by_name(self):
+        from docxx import oxml
+        from docxx.oxml.text.paragraph import CT_P
+        assert oxml.CT_P is CT_P
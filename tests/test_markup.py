@@ -0,0 +1,88 @@
+# encoding: utf-8
+
+"""Unit test suite for the docxx.markup module"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from docxx.markup import MarkupIndex
+
+from .unitutil.cxml import element
+
+
+class DescribeMarkupIndex(object):
+
+    def it_finds_a_bookmark_by_name(self):
+        body = element(
+            'w:body/(w:p/(w:bookmarkStart{w:id=0,w:name=foo},w:r),'
+            'w:p/(w:r,w:bookmarkEnd{w:id=0}))'
+        )
+        index = MarkupIndex(body)
+
+        bookmark = index.bookmark('foo')
+
+        assert bookmark.name == 'foo'
+        assert bookmark.start is body[0][0]
+        assert bookmark.end is body[1][1]
+        assert bookmark.paragraph is body[0]
+        assert index.bookmark('bar') is None
+        assert index.bookmark_names == ['foo']
+
+    def it_indexes_a_newly_added_bookmark(self):
+        body = element('w:body/w:p/w:r')
+        index = MarkupIndex(body)
+        assert index.bookmark_names == []
+
+        p = body[0]
+        start = p._add_bookmarkStart()
+        start.id, start.name = 1, 'bar'
+        end = p._add_bookmarkEnd()
+        end.id = 1
+        index.add_bookmark(start, end)
+
+        assert index.bookmark('bar').end is end
+
+    def it_drops_a_bookmark_removed_from_the_story(self):
+        body = element('w:body/w:p/w:bookmarkStart{w:id=0,w:name=foo}')
+        index = MarkupIndex(body)
+        assert index.bookmark('foo') is not None
+
+        body.remove(body[0])
+
+        assert index.bookmark('foo') is None
+        assert index.bookmark_names == []
+
+    def it_groups_fields_by_type_in_document_order(self):
+        body = element(
+            'w:body/w:p/('
+            'w:r/w:fldChar{w:fldCharType=begin},w:r/w:instrText" REF a ",'
+            'w:r/w:fldChar{w:fldCharType=begin},w:r/w:instrText"PAGE",'
+            'w:r/w:fldChar{w:fldCharType=end},'
+            'w:r/w:fldChar{w:fldCharType=separate},'
+            'w:r/w:fldChar{w:fldCharType=end},'
+            'w:fldSimple{w:instr=ref b})'
+        )
+        index = MarkupIndex(body)
+        p = body[0]
+
+        outer, inner, simple = index.fields()
+
+        assert outer.instr == ' REF a '
+        assert outer.begin is p[0][0]
+        assert outer.separate is p[5][0]
+        assert outer.end is p[6][0]
+        assert inner.type == 'PAGE'
+        assert inner.separate is None
+        assert simple.begin is simple.end is p[7]
+        assert index.fields('ref') == [outer, simple]
+        assert index.fields('TOC') == []
+
+    def it_can_be_invalidated(self):
+        body = element('w:body/w:p')
+        index = MarkupIndex(body)
+        assert index.fields() == []
+
+        body[0].append(element('w:fldSimple{w:instr=TOC}'))
+        assert index.fields() == []
+        index.invalidate()
+
+        assert [f.type for f in index.fields()] == ['TOC']
@@ -0,0 +1,76 @@
+# encoding: utf-8
+
+"""Unit test suite for the docxx.notes module"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import pytest
+
+from docxx.notes import Footnotes, NoteIndex
+from docxx.parts.document import DocumentPart
+from docxx.parts.notes import FootnotesPart
+
+from .unitutil.cxml import element
+from .unitutil.mock import instance_mock
+
+
+class DescribeFootnotes(object):
+
+    def it_can_resolve_a_reference_to_its_note(self, footnotes):
+        reference = element('w:footnoteReference{w:id=2}')
+
+        note = footnotes.resolve(reference)
+
+        assert note.id == 2
+        assert footnotes.resolve(1).id == 1
+        assert footnotes.resolve(7) is None
+
+    def it_can_iterate_the_references_in_the_document(
+        self, footnotes, document_part_
+    ):
+        document_part_.element = element(
+            'w:document/w:body/(w:p/w:r/w:footnoteReference{w:id=2},'
+            'w:p/(w:r,w:r/w:footnoteReference{w:id=1}))'
+        )
+
+        pairs = list(footnotes.iter_references())
+
+        assert [note.id for _, note in pairs] == [2, 1]
+        assert [run.element.tag for run, _ in pairs] == [
+            '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}r'
+        ] * 2
+
+    def it_allocates_ids_for_new_notes(self, footnotes):
+        note = footnotes.add()
+
+        assert note.id == 3
+        assert footnotes.get(3) == note
+        assert footnotes.add().id == 4
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture
+    def document_part_(self, request):
+        return instance_mock(request, DocumentPart)
+
+    @pytest.fixture
+    def footnotes(self, request, document_part_):
+        footnotes_elm = element(
+            'w:footnotes/(w:footnote{w:id=-1},w:footnote{w:id=0},'
+            'w:footnote{w:id=2},w:footnote{w:id=1})'
+        )
+        footnotes_part_ = instance_mock(
+            request, FootnotesPart, part=document_part_,
+            note_index=NoteIndex(footnotes_elm, 'w:footnote')
+        )
+        return Footnotes(footnotes_elm, footnotes_part_)
+
+
+class DescribeNoteIndex(object):
+
+    def it_allocates_ids_after_the_separator_notes(self):
+        index = NoteIndex(
+            element('w:footnotes/(w:footnote{w:id=-1},w:footnote{w:id=0})'),
+            'w:footnote'
+        )
+        assert index.next_id() == 1
@@ -11,7 +11,7 @@ from docxx.opc.packuri import PackURI
 from docxx.package import ImageParts, Package
 from docxx.parts.image import ImagePart
 
-from .unitutil.file import docx_path
+from .unitutil.file import docx_path, test_file
 from .unitutil.mock import class_mock, instance_mock, method_mock, property_mock
 
 
@@ -83,10 +83,45 @@ class DescribeImageParts(object):
         _add_image_part_.assert_called_once_with(image_parts, image_)
         assert image_part is image_part_
 
+    def it_can_get_or_add_image_parts_in_bulk(self):
+        image_parts = ImageParts()
+        paths = [
+            test_file('monty-truth.png'),
+            test_file('python-icon.jpeg'),
+            test_file('monty-truth.png'),
+        ]
+
+        parts = image_parts.get_or_add_image_parts(paths, max_workers=2)
+
+        assert len(image_parts) == 2
+        assert parts[0] is parts[2]
+        assert [p.partname for p in parts] == [
+            '/word/media/image1.png',
+            '/word/media/image2.jpeg',
+            '/word/media/image1.png',
+        ]
+
     def it_knows_the_next_available_image_partname(self, next_partname_fixture):
         image_parts, ext, expected_partname = next_partname_fixture
         assert image_parts._next_image_partname(ext) == expected_partname
 
+    def it_can_find_an_image_part_by_sha1(self, request):
+        image_parts = ImageParts()
+        for n, sha1 in ((1, 'f005ba11'), (2, 'fa1afe1')):
+            image_parts.append(instance_mock(
+                request, ImagePart, partname=PackURI('/word/media/image%d.png' % n),
+                sha1=sha1
+            ))
+        image_part = image_parts._get_by_sha1('fa1afe1')
+        image_parts.append(instance_mock(
+            request, ImagePart, partname=PackURI('/word/media/image3.png'),
+            sha1='deadbeef'
+        ))
+
+        assert image_part.partname.idx == 2
+        assert image_parts._get_by_sha1('deadbeef').partname.idx == 3
+        assert image_parts._get_by_sha1('0ddba11') is None
+
     def it_can_really_add_a_new_image_part(
         self, _next_image_partname_, partname_, image_, ImagePart_, image_part_
     ):
@@ -9,7 +9,9 @@ import pytest
 from docxx.enum.section import WD_HEADER_FOOTER, WD_ORIENT, WD_SECTION
 from docxx.parts.document import DocumentPart
 from docxx.parts.hdrftr import FooterPart, HeaderPart
-from docxx.section import _BaseHeaderFooter, _Footer, _Header, Section, Sections
+from docxx.section import (
+    _BaseHeaderFooter, _Footer, _Header, Section, SectionIndex, Sections
+)
 from docxx.shared import Inches
 
 from .unitutil.cxml import element, xml
@@ -90,6 +92,80 @@ class DescribeSections(object):
         return instance_mock(request, Section)
 
 
+class DescribeSectionIndex(object):
+
+    def it_indexes_the_body_level_sectPrs_in_document_order(self):
+        document_elm = element(
+            "w:document/w:body/(w:p/w:pPr/w:sectPr,w:tbl/w:tr/w:tc/w:p/w:pPr/w:sect"
+            "Pr,w:p/w:pPr/w:sectPr,w:sectPr)"
+        )
+        section_index = SectionIndex(document_elm)
+
+        sectPrs = document_elm.xpath("./w:body/w:p/w:pPr/w:sectPr | ./w:body/w:sectPr")
+        assert len(section_index) == 3
+        assert list(section_index) == sectPrs
+        assert section_index[-1] is sectPrs[2]
+        assert section_index[1:] == sectPrs[1:]
+
+    def it_knows_the_sectPr_preceding_a_sectPr(self):
+        document_elm = element(
+            "w:document/w:body/(w:p/w:pPr/w:sectPr,w:p,w:p/w:pPr/w:sectPr,w:sectPr)"
+        )
+        sectPrs = document_elm.sectPr_lst
+        section_index = SectionIndex(document_elm)
+
+        assert section_index.preceding(sectPrs[0]) is None
+        assert section_index.preceding(sectPrs[1]) is sectPrs[0]
+        assert section_index.preceding(sectPrs[2]) is sectPrs[1]
+
+    def it_rebuilds_itself_after_being_invalidated(self):
+        document_elm = element("w:document/w:body/w:sectPr")
+        section_index = SectionIndex(document_elm)
+        assert len(section_index) == 1
+
+        document_elm.body.add_section_break()
+        assert len(section_index) == 1
+        section_index.invalidate()
+
+        assert len(section_index) == 2
+        sentinel_sectPr = document_elm.body.sectPr
+        assert section_index.preceding(sentinel_sectPr) is section_index[0]
+
+    def it_rebuilds_itself_when_an_indexed_sectPr_is_removed(self):
+        document_elm = element(
+            "w:document/w:body/(w:p/w:pPr/w:sectPr,w:p/w:pPr/w:sectPr,w:sectPr)"
+        )
+        section_index = SectionIndex(document_elm)
+        assert len(section_index) == 3
+        body = document_elm.body
+
+        body.remove(body[0])
+        assert section_index[0] is body[0].pPr.sectPr
+        assert len(section_index) == 2
+        body.clear_content()
+
+        assert list(section_index) == [body.sectPr]
+        assert len(section_index) == 1
+        assert section_index.preceding(body.sectPr) is None
+
+    def it_checks_only_the_entries_a_lookup_reaches(self):
+        document_elm = element(
+            "w:document/w:body/(w:p/w:pPr/w:sectPr,w:p/w:pPr/w:sectPr,w:p/w:pPr/w:s"
+            "ectPr,w:sectPr)"
+        )
+        section_index = SectionIndex(document_elm)
+        body = document_elm.body
+        sectPrs = list(section_index)
+
+        body.remove(body[0])
+
+        assert section_index.preceding(sectPrs[2]) is sectPrs[1]
+        assert section_index[-1] is sectPrs[3]
+        assert len(section_index) == 4
+        assert section_index.preceding(sectPrs[1]) is None
+        assert len(section_index) == 3
+
+
 class DescribeSection(object):
 
     def it_knows_when_it_displays_a_distinct_first_page_header(
@@ -666,8 +742,9 @@ class Describe_Footer(object):
     def it_provides_access_to_the_prior_Footer_to_help(
         self, request, document_part_, footer_
     ):
-        doc_elm = element("w:document/(w:sectPr,w:sectPr)")
-        prior_sectPr, sectPr = doc_elm[0], doc_elm[1]
+        doc_elm = element("w:document/w:body/(w:p/w:pPr/w:sectPr,w:p,w:sectPr)")
+        prior_sectPr, sectPr = doc_elm.sectPr_lst
+        document_part_.section_index = SectionIndex(doc_elm)
         footer = _Footer(sectPr, document_part_, WD_HEADER_FOOTER.EVEN_PAGE)
         # ---mock must occur after construction of "real" footer---
         _Footer_ = class_mock(request, "docxx.section._Footer", return_value=footer_)
@@ -679,10 +756,11 @@ class Describe_Footer(object):
         )
         assert prior_footer is footer_
 
-    def but_it_returns_None_when_its_the_first_footer(self):
-        doc_elm = element("w:document/w:sectPr")
-        sectPr = doc_elm[0]
-        footer = _Footer(sectPr, None, None)
+    def but_it_returns_None_when_its_the_first_footer(self, document_part_):
+        doc_elm = element("w:document/w:body/w:sectPr")
+        sectPr = doc_elm.sectPr_lst[0]
+        document_part_.section_index = SectionIndex(doc_elm)
+        footer = _Footer(sectPr, document_part_, None)
 
         prior_footer = footer._prior_headerfooter
 
@@ -762,8 +840,9 @@ class Describe_Header(object):
     def it_provides_access_to_the_prior_Header_to_help(
         self, request, document_part_, header_
     ):
-        doc_elm = element("w:document/(w:sectPr,w:sectPr)")
-        prior_sectPr, sectPr = doc_elm[0], doc_elm[1]
+        doc_elm = element("w:document/w:body/(w:p/w:pPr/w:sectPr,w:p,w:sectPr)")
+        prior_sectPr, sectPr = doc_elm.sectPr_lst
+        document_part_.section_index = SectionIndex(doc_elm)
         header = _Header(sectPr, document_part_, WD_HEADER_FOOTER.PRIMARY)
         # ---mock must occur after construction of "real" header---
         _Header_ = class_mock(request, "docxx.section._Header", return_value=header_)
@@ -775,10 +854,11 @@ class Describe_Header(object):
         )
         assert prior_header is header_
 
-    def but_it_returns_None_when_its_the_first_header(self):
-        doc_elm = element("w:document/w:sectPr")
-        sectPr = doc_elm[0]
-        header = _Header(sectPr, None, None)
+    def but_it_returns_None_when_its_the_first_header(self, document_part_):
+        doc_elm = element("w:document/w:body/w:sectPr")
+        sectPr = doc_elm.sectPr_lst[0]
+        document_part_.section_index = SectionIndex(doc_elm)
+        header = _Header(sectPr, document_part_, None)
 
         prior_header = header._prior_headerfooter
 
@@ -12,7 +12,7 @@ import pytest
 
 from docxx.opc.part import XmlPart
 from docxx.shared import (
-    ElementProxy, Length, Cm, Emu, Inches, Mm, Pt, RGBColor, Twips
+    ElementProxy, Length, Cm, Emu, Inches, Mm, Parented, Pt, RGBColor, Twips
 )
 
 from .unitutil.cxml import element
@@ -40,6 +40,12 @@ class DescribeElementProxy(object):
         proxy, part_ = part_fixture
         assert proxy.part is part_
 
+    def it_caches_its_part_after_first_access(self, part_fixture):
+        proxy, part_ = part_fixture
+        proxy.part
+        proxy._parent.part = None
+        assert proxy.part is part_
+
     # fixture --------------------------------------------------------
 
     @pytest.fixture
@@ -74,6 +80,28 @@ class DescribeElementProxy(object):
         return instance_mock(request, XmlPart)
 
 
+class DescribeParented(object):
+
+    def it_caches_the_part_of_its_parent(self, part_):
+        parent = Parented(None)
+        parent._part = part_
+        child = Parented(parent)
+        assert child.part is part_
+        parent._part = None
+        parent._parent = None
+        assert child.part is part_
+
+    def it_has_no_instance_dict(self):
+        with pytest.raises(AttributeError):
+            Parented(None).foobar = 42
+
+    # fixture components ---------------------------------------------
+
+    @pytest.fixture
+    def part_(self, request):
+        return instance_mock(request, XmlPart)
+
+
 class DescribeLength(object):
 
     def it_can_construct_from_convenient_units(self, construct_fixture):
@@ -4,6 +4,7 @@
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+from docxx.api import open_docx
 from docxx.enum.style import WD_STYLE_TYPE
 from docxx.enum.text import WD_ALIGN_PARAGRAPH
 from docxx.oxml.text.paragraph import CT_P
@@ -82,6 +83,29 @@ class DescribeParagraph(object):
         if style:
             style_prop_.assert_called_once_with(style)
 
+    def it_can_add_a_bookmark_to_a_body_paragraph(self):
+        document = open_docx().document
+        paragraph = document.add_paragraph('foo')
+        run = paragraph.runs[0]
+
+        end = paragraph.add_bookmark(7, run, run, 'bm')
+
+        bookmark = document.bookmark('bm')
+        assert bookmark.end is end
+        assert bookmark.paragraph is paragraph._p
+
+    def it_can_add_a_bookmark_to_a_paragraph_in_a_comment(self):
+        paragraph = open_docx().document.add_paragraph('foo')
+        run = paragraph.runs[0]
+        comment = paragraph.add_comment('note', run, run)
+        comment_paragraph = comment.paragraphs[0]
+        comment_run = comment_paragraph.runs[0]
+
+        end = comment_paragraph.add_bookmark(7, comment_run, comment_run, 'bm')
+
+        assert comment_paragraph._p[-1] is end
+        assert end.getprevious() is comment_run._r
+
     def it_can_insert_a_paragraph_before_itself(self, insert_before_fixture):
         text, style, paragraph_, add_run_calls = insert_before_fixture
         paragraph = Paragraph(None, None)
@@ -227,6 +251,10 @@ class DescribeParagraph(object):
         ('w:p/w:r/(w:t"foo", w:tab, w:t"bar")', 'foo\tbar'),
         ('w:p/w:r/(w:t"foo", w:br,  w:t"bar")', 'foo\nbar'),
         ('w:p/w:r/(w:t"foo", w:cr,  w:t"bar")', 'foo\nbar'),
+        ('w:p/(w:r/w:t"foo", w:hyperlink/w:r/w:t"bar", w:r/w:t"baz")',
+         'foobarbaz'),
+        ('w:p/(w:pPr/w:tabs/w:tab, w:r/w:t"foo")', 'foo'),
+        ('w:p/w:r/w:ruby/(w:rt/w:r/w:t"a", w:rubyBase/w:r/w:t"foo")', 'foo'),
     ])
     def text_get_fixture(self, request):
         p_cxml, expected_text_value = request.param
@@ -14,7 +14,7 @@ from docxx.text.run import Run
 import pytest
 
 from ..unitutil.cxml import element, xml
-from ..unitutil.mock import class_mock, instance_mock, property_mock
+from ..unitutil.mock import call, class_mock, instance_mock, property_mock
 
 
 class DescribeRun(object):
@@ -95,6 +95,22 @@ class DescribeRun(object):
         InlineShape_.assert_called_once_with(inline)
         assert picture is picture_
 
+    def it_can_add_several_pictures(self, part_prop_, document_part_, InlineShape_):
+        run = Run(element('w:r/wp:x'), None)
+        inlines = [element('wp:inline{id=42}'), element('wp:inline{id=43}')]
+        document_part_.new_pic_inlines.return_value = inlines
+
+        pictures = run.add_pictures(['foo.png', 'bar.png'], 1111, 2222)
+
+        run.part.new_pic_inlines.assert_called_once_with(
+            ['foo.png', 'bar.png'], 1111, 2222, None
+        )
+        assert run._r.xml == xml(
+            'w:r/(wp:x,w:drawing/wp:inline{id=42},w:drawing/wp:inline{id=43})'
+        )
+        assert InlineShape_.call_args_list == [call(inlines[0]), call(inlines[1])]
+        assert len(pictures) == 2
+
     def it_can_remove_its_content_but_keep_formatting(self, clear_fixture):
         run, expected_xml = clear_fixture
         _run = run.clear()
@@ -265,6 +281,8 @@ class DescribeRun(object):
         ('abc\tdef', 'w:r/(w:t"abc", w:tab, w:t"def")'),
         ('abc\ndef', 'w:r/(w:t"abc", w:br,  w:t"def")'),
         ('abc\rdef', 'w:r/(w:t"abc", w:br,  w:t"def")'),
+        (' abc\t\tdef\r\n', 'w:r/(w:t{xml:space=preserve}" abc", w:tab, '
+                           'w:tab, w:t"def", w:br, w:br)'),
     ])
     def text_set_fixture(self, request):
         new_text, expected_cxml = request.param